@@ -321,6 +321,8 @@ class BenchmarkRunner:
                 # Runtime C files - include all required runtime libraries
                 runtime_c_files = [
                     runtime_path / "vec_int_minimal.c",
+                    runtime_path / "vec_double_minimal.c",
+                    runtime_path / "vec_bool_minimal.c",
                     runtime_path / "vec_vec_int_minimal.c",
                     runtime_path / "vec_str_minimal.c",
                     runtime_path / "map_int_int_minimal.c",
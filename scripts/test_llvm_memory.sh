@@ -95,6 +95,8 @@ test_benchmark() {
     # Find all C runtime files
     local runtime_files=(
         "$PROJECT_ROOT/src/mgen/backends/llvm/runtime/vec_int_minimal.c"
+        "$PROJECT_ROOT/src/mgen/backends/llvm/runtime/vec_double_minimal.c"
+        "$PROJECT_ROOT/src/mgen/backends/llvm/runtime/vec_bool_minimal.c"
         "$PROJECT_ROOT/src/mgen/backends/llvm/runtime/vec_vec_int_minimal.c"
         "$PROJECT_ROOT/src/mgen/backends/llvm/runtime/vec_str_minimal.c"
         "$PROJECT_ROOT/src/mgen/backends/llvm/runtime/map_int_int_minimal.c"
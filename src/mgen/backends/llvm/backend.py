@@ -40,7 +40,7 @@ class LLVMBackend(LanguageBackend):
     def get_emitter(self) -> AbstractEmitter:
         """Get the LLVM emitter."""
         if self._emitter is None:
-            self._emitter = LLVMEmitter()
+            self._emitter = LLVMEmitter(self.preferences)
         return self._emitter
 
     def get_factory(self) -> AbstractFactory:
@@ -52,7 +52,7 @@ class LLVMBackend(LanguageBackend):
     def get_builder(self) -> AbstractBuilder:
         """Get the LLVM builder."""
         if self._builder is None:
-            self._builder = LLVMBuilder()
+            self._builder = LLVMBuilder(self.preferences)
         return self._builder
 
     def get_container_system(self) -> AbstractContainerSystem:
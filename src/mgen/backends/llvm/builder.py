@@ -7,16 +7,23 @@ from pathlib import Path
 from typing import Any, Optional
 
 from ..base import AbstractBuilder
+from ..preferences import BackendPreferences
+from .module_cache import LLVMModuleCache
 
 
 class LLVMBuilder(AbstractBuilder):
     """Builder for compiling LLVM IR to native binaries."""
 
-    def __init__(self) -> None:
+    def __init__(self, preferences: Optional[BackendPreferences] = None) -> None:
         """Initialize the LLVM builder."""
         self.llc_path = self._find_llvm_tool("llc")
         self.clang_path = self._find_llvm_tool("clang")
 
+        # Optional cache for skipping optimization of unchanged IR (opt-in via preferences)
+        self.module_cache: Optional[LLVMModuleCache] = None
+        if preferences is not None and preferences.get("module_cache", False):
+            self.module_cache = LLVMModuleCache(preferences.get("module_cache_dir"))
+
     def _find_llvm_tool(self, tool_name: str) -> str:
         """Find LLVM tool in common locations.
 
@@ -121,7 +128,7 @@ run: $(TARGET)
             from .optimizer import LLVMOptimizer
 
             llvm_ir = source_path.read_text()
-            optimizer = LLVMOptimizer(opt_level=opt_level)
+            optimizer = LLVMOptimizer(opt_level=opt_level, cache=self.module_cache)
             optimized_ir = optimizer.optimize(llvm_ir)
 
             # Write optimized IR to a new file
@@ -150,6 +157,8 @@ run: $(TARGET)
             # Compile each runtime C file
             runtime_sources = [
                 "vec_int_minimal.c",
+                "vec_double_minimal.c",
+                "vec_bool_minimal.c",
                 "vec_vec_int_minimal.c",
                 "vec_str_minimal.c",
                 "map_str_int_minimal.c",
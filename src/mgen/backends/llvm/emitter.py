@@ -7,6 +7,7 @@ from ...frontend.static_ir import build_ir_from_code
 from ..base import AbstractEmitter
 from ..preferences import BackendPreferences
 from .ir_to_llvm import IRToLLVMConverter
+from .module_cache import LLVMModuleCache
 
 
 class LLVMEmitter(AbstractEmitter):
@@ -17,6 +18,11 @@ class LLVMEmitter(AbstractEmitter):
         super().__init__(preferences)
         self.converter = IRToLLVMConverter()
 
+        # Optional content-addressed cache of generated modules (opt-in via preferences)
+        self.module_cache: Optional[LLVMModuleCache] = None
+        if preferences is not None and preferences.get("module_cache", False):
+            self.module_cache = LLVMModuleCache(preferences.get("module_cache_dir"))
+
     def emit_module(self, source_code: str, analysis_result: Any = None) -> str:
         """Generate LLVM IR from Python source code.
 
@@ -27,14 +33,27 @@ class LLVMEmitter(AbstractEmitter):
         Returns:
             LLVM IR as text string
         """
+        # Skip IR construction and conversion entirely for previously seen sources
+        cache_key = None
+        if self.module_cache is not None:
+            cache_key = self.module_cache.make_key("emit", source_code)
+            cached_ir = self.module_cache.get(cache_key)
+            if cached_ir is not None:
+                return cached_ir
+
         # Build Static IR from Python source
         ir_module = build_ir_from_code(source_code)
 
         # Convert Static IR to LLVM IR
         llvm_module = self.converter.visit_module(ir_module)
+        llvm_ir = str(llvm_module)
+
+        if self.module_cache is not None and cache_key is not None:
+            # Return the cached form so hits and misses produce identical text
+            llvm_ir = self.module_cache.put(cache_key, llvm_ir)
 
         # Return LLVM IR as text
-        return str(llvm_module)
+        return llvm_ir
 
     def emit_function(self, func_node: ast.FunctionDef, type_context: dict[str, str]) -> str:
         """Generate LLVM IR for a single function.
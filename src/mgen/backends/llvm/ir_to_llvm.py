@@ -16,7 +16,6 @@ from ...frontend.static_ir import (
     IRComprehension,
     IRContinue,
     IRDataType,
-    IRExpression,
     IRExpressionStatement,
     IRFor,
     IRFunction,
@@ -24,7 +23,9 @@ from ...frontend.static_ir import (
     IRIf,
     IRLiteral,
     IRModule,
+    IRRaise,
     IRReturn,
+    IRStatement,
     IRType,
     IRTypeCast,
     IRTypeDeclaration,
@@ -35,6 +36,47 @@ from ...frontend.static_ir import (
 )
 from .runtime_decls import LLVMRuntimeDeclarations
 
+_VOID_TYPE = ir.VoidType()
+_I8_TYPE = ir.IntType(8)
+_I64_TYPE = ir.IntType(64)
+
+# Constants used on hot paths, interned instead of rebuilt on every visit
+_I64_ZERO = ir.Constant(_I64_TYPE, 0)
+_I64_ONE = ir.Constant(_I64_TYPE, 1)
+_I32_ZERO = ir.Constant(ir.IntType(32), 0)
+_F64_ZERO = ir.Constant(ir.DoubleType(), 0.0)
+_I1_FALSE = ir.Constant(ir.IntType(1), 0)
+_I1_TRUE = ir.Constant(ir.IntType(1), 1)
+
+# IR scalar type -> LLVM type (built once rather than on every _convert_type call)
+_BASE_TYPE_MAPPING: dict[IRDataType, ir.Type] = {
+    IRDataType.VOID: _VOID_TYPE,
+    IRDataType.INT: _I64_TYPE,  # 64-bit integer
+    IRDataType.FLOAT: ir.DoubleType(),  # double precision
+    IRDataType.BOOL: ir.IntType(1),  # i1
+    IRDataType.STRING: _I8_TYPE.as_pointer(),  # char*
+}
+
+# (element type, count) -> array type, shared by all converters
+_ARRAY_TYPE_CACHE: dict[tuple[ir.Type, int], ir.ArrayType] = {}
+
+
+def _get_array_type(element: ir.Type, count: int) -> ir.ArrayType:
+    """Get a memoized LLVM array type.
+
+    Args:
+        element: LLVM element type
+        count: Number of elements
+
+    Returns:
+        LLVM array type [count x element]
+    """
+    key = (element, count)
+    array_type = _ARRAY_TYPE_CACHE.get(key)
+    if array_type is None:
+        array_type = _ARRAY_TYPE_CACHE[key] = ir.ArrayType(element, count)
+    return array_type
+
 
 class IRToLLVMConverter(IRVisitor):
     """Convert MGen Static IR to LLVM IR using the visitor pattern."""
@@ -53,6 +95,8 @@ class IRToLLVMConverter(IRVisitor):
         # Track current loop blocks for break/continue
         self.loop_exit_stack: list[ir.Block] = []
         self.loop_continue_stack: list[ir.Block] = []
+        # Blocks on statically unlikely paths, moved to the end of the current function
+        self.cold_blocks: list[ir.Block] = []
         # Runtime declarations for C library
         self.runtime = LLVMRuntimeDeclarations(self.module)
 
@@ -65,8 +109,7 @@ class IRToLLVMConverter(IRVisitor):
         Returns:
             LLVM module with generated functions
         """
-        # Declare runtime library functions first
-        self.runtime.declare_all()
+        # Runtime library functions are declared on first use (see LLVMRuntimeDeclarations.get_function)
 
         # Generate type declarations first (for structs, etc.)
         for type_decl in node.type_declarations:
@@ -106,6 +149,7 @@ class IRToLLVMConverter(IRVisitor):
         # Create entry block
         entry_block = func.append_basic_block(name="entry")
         self.builder = ir.IRBuilder(entry_block)
+        self.cold_blocks = []
 
         # Clear variable symbol table for new function
         self.var_symtab = {}
@@ -118,8 +162,7 @@ class IRToLLVMConverter(IRVisitor):
             self.var_symtab[param.name] = param_ptr
 
         # Generate function body
-        for stmt in node.body:
-            stmt.accept(self)
+        self._visit_body(node.body)
 
         # Add implicit return if missing
         if not self.builder.block.is_terminated:
@@ -129,6 +172,11 @@ class IRToLLVMConverter(IRVisitor):
                 # Return zero/null as default
                 self.builder.ret(ir.Constant(ret_type, 0))
 
+        # Lay out cold blocks after the hot path so fall-through stays on the likely side
+        for block in self.cold_blocks:
+            func.blocks.remove(block)
+            func.blocks.append(block)
+
         return func
 
     def visit_variable(self, node: IRVariable) -> Union[ir.AllocaInstr, ir.GlobalVariable]:
@@ -150,11 +198,11 @@ class IRToLLVMConverter(IRVisitor):
             else:
                 # Default initialization to zero
                 if var_type == ir.IntType(64):
-                    initial_value = ir.Constant(ir.IntType(64), 0)
+                    initial_value = _I64_ZERO
                 elif var_type == ir.DoubleType():
-                    initial_value = ir.Constant(ir.DoubleType(), 0.0)
+                    initial_value = _F64_ZERO
                 elif var_type == ir.IntType(1):
-                    initial_value = ir.Constant(ir.IntType(1), 0)
+                    initial_value = _I1_FALSE
                 else:
                     raise NotImplementedError(f"Default initialization for type {var_type} not implemented")
 
@@ -272,7 +320,7 @@ class IRToLLVMConverter(IRVisitor):
                 c_rem = self.builder.srem(left, right, name="c_rem")
 
                 # Check if signs differ: (c_rem < 0) != (right < 0)
-                zero = ir.Constant(ir.IntType(64), 0)
+                zero = _I64_ZERO
                 rem_neg = self.builder.icmp_signed("<", c_rem, zero, name="rem_neg")
                 divisor_neg = self.builder.icmp_signed("<", right, zero, name="divisor_neg")
                 signs_differ = self.builder.xor(rem_neg, divisor_neg, name="signs_differ")
@@ -365,7 +413,7 @@ class IRToLLVMConverter(IRVisitor):
                         map_contains_func = self.runtime.get_function("map_int_int_contains")
                     result = self.builder.call(map_contains_func, [right, left], name="contains_result")
                     # Convert i32 result to i1 (bool)
-                    zero = ir.Constant(ir.IntType(32), 0)
+                    zero = _I32_ZERO
                     return self.builder.icmp_signed("!=", result, zero, name="contains_bool")
 
         raise NotImplementedError(
@@ -405,7 +453,7 @@ class IRToLLVMConverter(IRVisitor):
             # Merge block: use phi to select result
             self.builder.position_at_end(merge_block)
             phi = self.builder.phi(ir.IntType(1), name="and_tmp")
-            phi.add_incoming(ir.Constant(ir.IntType(1), 0), left_end_block)  # Left was false
+            phi.add_incoming(_I1_FALSE, left_end_block)  # Left was false
             phi.add_incoming(right, eval_right_end_block)  # Right result
             return phi
 
@@ -426,7 +474,7 @@ class IRToLLVMConverter(IRVisitor):
             # Merge block: use phi to select result
             self.builder.position_at_end(merge_block)
             phi = self.builder.phi(ir.IntType(1), name="or_tmp")
-            phi.add_incoming(ir.Constant(ir.IntType(1), 1), left_end_block)  # Left was true
+            phi.add_incoming(_I1_TRUE, left_end_block)  # Left was true
             phi.add_incoming(right, eval_right_end_block)  # Right result
             return phi
 
@@ -465,18 +513,12 @@ class IRToLLVMConverter(IRVisitor):
             if elem_type == IRDataType.LIST:
                 # 2D list: vec_vec_int
                 vec_type = self.runtime.get_vec_vec_int_type()
-                vec_init_ptr_func = self.runtime.get_function("vec_vec_int_init_ptr")
-                vec_push_func = self.runtime.get_function("vec_vec_int_push")
-            elif elem_type == IRDataType.STRING:
-                # String list: vec_str
-                vec_type = self.runtime.get_vec_str_type()
-                vec_init_ptr_func = self.runtime.get_function("vec_str_init_ptr")
-                vec_push_func = self.runtime.get_function("vec_str_push")
             else:
-                # Default to integer list: vec_int
-                vec_type = self.runtime.get_vec_int_type()
-                vec_init_ptr_func = self.runtime.get_function("vec_int_init_ptr")
-                vec_push_func = self.runtime.get_function("vec_int_push")
+                # Element-specialized list: vec_int, vec_double, vec_bool or vec_str
+                vec_type = self.runtime.get_vec_type(self._get_list_element_type(elem_type))
+            vec_name = vec_type.name[len("struct.") :]
+            vec_init_ptr_func = self.runtime.get_function(f"{vec_name}_init_ptr")
+            vec_push_func = self.runtime.get_function(f"{vec_name}_push")
 
             # Allocate space for the vec struct on heap (not stack!)
             # Calculate size of struct using GEP null trick
@@ -507,7 +549,7 @@ class IRToLLVMConverter(IRVisitor):
                         # vec_vec_int_push now takes vec_int by pointer (not by value)
                         self.builder.call(vec_push_func, [vec_ptr, element_val], name="")
                     else:
-                        # For 1D lists, element_val is an i64
+                        # For 1D lists, element_val matches the vec element type
                         self.builder.call(vec_push_func, [vec_ptr, element_val], name="")
 
             # Return the pointer
@@ -589,7 +631,7 @@ class IRToLLVMConverter(IRVisitor):
             # Create a null-terminated string
             str_value = str(node.value)
             str_bytes = (str_value + "\0").encode("utf-8")
-            str_const = ir.Constant(ir.ArrayType(ir.IntType(8), len(str_bytes)), bytearray(str_bytes))
+            str_const = ir.Constant(_get_array_type(_I8_TYPE, len(str_bytes)), bytearray(str_bytes))
 
             # Create global variable for the string
             str_global = ir.GlobalVariable(self.module, str_const.type, name=f"str_{len(self.module.globals)}")
@@ -599,7 +641,7 @@ class IRToLLVMConverter(IRVisitor):
 
             # Return pointer to the string (i8*)
             if self.builder is not None:
-                return self.builder.gep(str_global, [ir.Constant(ir.IntType(32), 0), ir.Constant(ir.IntType(32), 0)])
+                return self.builder.gep(str_global, [_I32_ZERO, _I32_ZERO])
             else:
                 # During global variable initialization, return the global itself
                 return str_global
@@ -644,22 +686,9 @@ class IRToLLVMConverter(IRVisitor):
         if self.builder is None or self.current_function is None:
             raise RuntimeError("Builder not initialized")
 
-        # Allocate result list on heap
-        vec_int_type = self.runtime.get_vec_int_type()
-        vec_int_init_ptr_func = self.runtime.get_function("vec_int_init_ptr")
-        vec_int_push_func = self.runtime.get_function("vec_int_push")
-
-        # Calculate size and malloc the struct
-        i64 = ir.IntType(64)
-        i8_ptr = ir.IntType(8).as_pointer()
-        null_ptr = ir.Constant(vec_int_type.as_pointer(), None)
-        size_gep = self.builder.gep(null_ptr, [ir.Constant(ir.IntType(32), 1)], name="size_gep")
-        struct_size = self.builder.ptrtoint(size_gep, i64, name="struct_size")
-        malloc_func = self._get_or_create_c_function("malloc", i8_ptr, [i64])
-        raw_ptr = self.builder.call(malloc_func, [struct_size], name="comp_malloc")
-        result_ptr = self.builder.bitcast(raw_ptr, vec_int_type.as_pointer(), name="comp_result")
-
-        self.builder.call(vec_int_init_ptr_func, [result_ptr], name="")
+        # The result vec_* depends on the element expression's type, so it is allocated in
+        # the block before the loop once the first element has been converted
+        preheader_block = self.builder.block
 
         # Process the comprehension (only single generator supported for now)
         if len(ast_node.generators) != 1:
@@ -680,14 +709,14 @@ class IRToLLVMConverter(IRVisitor):
             assert isinstance(generator.iter, ast.Call)  # For mypy
             range_args = generator.iter.args
             if len(range_args) == 1:
-                start_val = ir.Constant(ir.IntType(64), 0)
+                start_val = _I64_ZERO
                 end_expr = self._convert_ast_expr(range_args[0])
-                step_val = ir.Constant(ir.IntType(64), 1)
+                step_val = _I64_ONE
             elif len(range_args) == 2:
                 start_expr = self._convert_ast_expr(range_args[0])
                 end_expr = self._convert_ast_expr(range_args[1])
                 start_val = start_expr
-                step_val = ir.Constant(ir.IntType(64), 1)
+                step_val = _I64_ONE
             elif len(range_args) == 3:
                 start_expr = self._convert_ast_expr(range_args[0])
                 end_expr = self._convert_ast_expr(range_args[1])
@@ -729,16 +758,18 @@ class IRToLLVMConverter(IRVisitor):
             iter_expr = self._convert_ast_expr(generator.iter)
 
             # Get list size
-            vec_int_size_func = self.runtime.get_function("vec_int_size")
-            list_size = self.builder.call(vec_int_size_func, [iter_expr], name="list_size")
+            vec_name = self._get_vec_name(iter_expr)
+            vec_size_func = self.runtime.get_function(f"{vec_name}_size")
+            vec_at_func = self.runtime.get_function(f"{vec_name}_at")
+            list_size = self.builder.call(vec_size_func, [iter_expr], name="list_size")
 
             # Create index variable
             idx_var = self.builder.alloca(ir.IntType(64), name="idx")
-            self.builder.store(ir.Constant(ir.IntType(64), 0), idx_var)
+            self.builder.store(_I64_ZERO, idx_var)
 
-            # Create element variable for loop target
+            # Create element variable for loop target, typed by the vec element
             loop_var_name = generator.target.id if isinstance(generator.target, ast.Name) else "loop_var"
-            elem_var = self.builder.alloca(ir.IntType(64), name=loop_var_name)
+            elem_var = self.builder.alloca(vec_at_func.function_type.return_type, name=loop_var_name)
 
             # Create loop blocks
             loop_cond_block = self.current_function.append_basic_block(name="loop_cond")
@@ -758,8 +789,7 @@ class IRToLLVMConverter(IRVisitor):
             self.builder.position_at_end(loop_body_block)
 
             # Get element at index: elem = list[idx]
-            vec_int_at_func = self.runtime.get_function("vec_int_at")
-            elem_val = self.builder.call(vec_int_at_func, [iter_expr, idx_val], name="elem")
+            elem_val = self.builder.call(vec_at_func, [iter_expr, idx_val], name="elem")
             self.builder.store(elem_val, elem_var)
 
             # Store element variable in symbol table
@@ -768,7 +798,7 @@ class IRToLLVMConverter(IRVisitor):
 
             # Store current index and list size for increment later
             start_val = None  # Not used for list iteration
-            step_val = ir.Constant(ir.IntType(64), 1)
+            step_val = _I64_ONE
             loop_var = idx_var  # Use idx_var for increment
             loop_var_val = idx_val
 
@@ -783,14 +813,16 @@ class IRToLLVMConverter(IRVisitor):
             self.builder.position_at_end(if_then_block)
             # Evaluate and append expression
             expr_val = self._convert_ast_expr(ast_node.elt)
-            self.builder.call(vec_int_push_func, [result_ptr, expr_val], name="")
+            result_ptr, vec_push_func = self._alloc_comprehension_vec(preheader_block, expr_val.type)
+            self.builder.call(vec_push_func, [result_ptr, expr_val], name="")
             self.builder.branch(if_merge_block)
 
             self.builder.position_at_end(if_merge_block)
         else:
             # No condition - just append
             expr_val = self._convert_ast_expr(ast_node.elt)
-            self.builder.call(vec_int_push_func, [result_ptr, expr_val], name="")
+            result_ptr, vec_push_func = self._alloc_comprehension_vec(preheader_block, expr_val.type)
+            self.builder.call(vec_push_func, [result_ptr, expr_val], name="")
 
         # Increment loop variable
         incremented = self.builder.add(loop_var_val, step_val, name="inc")
@@ -809,6 +841,40 @@ class IRToLLVMConverter(IRVisitor):
 
         return result_ptr
 
+    def _alloc_comprehension_vec(self, preheader_block: ir.Block, elem_type: ir.Type) -> tuple[ir.Value, ir.Function]:
+        """Heap-allocate and initialize the result vec_* of a list comprehension.
+
+        The allocation is placed before the terminator of the block that enters the
+        loop, so it dominates the pushes in the loop body.
+
+        Args:
+            preheader_block: Block that branches into the comprehension loop
+            elem_type: LLVM type of the element expression
+
+        Returns:
+            Tuple of (result vec pointer, vec_*_push function)
+        """
+        if self.builder is None:
+            raise RuntimeError("Builder not initialized")
+
+        vec_type = self.runtime.get_vec_type(elem_type)
+        vec_name = f"vec_{self.runtime.get_vec_suffix(elem_type)}"
+
+        with self.builder.goto_block(preheader_block):
+            # Calculate size and malloc the struct
+            i64 = ir.IntType(64)
+            i8_ptr = ir.IntType(8).as_pointer()
+            null_ptr = ir.Constant(vec_type.as_pointer(), None)
+            size_gep = self.builder.gep(null_ptr, [ir.Constant(ir.IntType(32), 1)], name="size_gep")
+            struct_size = self.builder.ptrtoint(size_gep, i64, name="struct_size")
+            malloc_func = self._get_or_create_c_function("malloc", i8_ptr, [i64])
+            raw_ptr = self.builder.call(malloc_func, [struct_size], name="comp_malloc")
+            result_ptr = self.builder.bitcast(raw_ptr, vec_type.as_pointer(), name="comp_result")
+
+            self.builder.call(self.runtime.get_function(f"{vec_name}_init_ptr"), [result_ptr], name="")
+
+        return result_ptr, self.runtime.get_function(f"{vec_name}_push")
+
     def _infer_dict_key_type(self, key_expr: ast.expr) -> str:
         """Infer the type of a dict key expression.
 
@@ -895,7 +961,7 @@ class IRToLLVMConverter(IRVisitor):
         # Loop body: check if occupied
         self.builder.position_at_end(loop_body_block)
         is_occupied = self.builder.call(is_occupied_func, [dict_ptr, idx_val], name="is_occupied")
-        zero_i32 = ir.Constant(ir.IntType(32), 0)
+        zero_i32 = _I32_ZERO
         occupied_cond = self.builder.icmp_signed("!=", is_occupied, zero_i32, name="occupied_cond")
         self.builder.cbranch(occupied_cond, entry_check_block, loop_inc_block)
 
@@ -977,7 +1043,7 @@ class IRToLLVMConverter(IRVisitor):
         # Loop body: check if entry is occupied
         self.builder.position_at_end(loop_body_block)
         is_occupied = self.builder.call(is_occupied_func, [source_dict_ptr, idx_val], name="is_occupied")
-        zero_i32 = ir.Constant(ir.IntType(32), 0)
+        zero_i32 = _I32_ZERO
         occupied_cond = self.builder.icmp_signed("!=", is_occupied, zero_i32, name="occupied_cond")
         self.builder.cbranch(occupied_cond, entry_check_block, loop_increment_block)
 
@@ -1109,14 +1175,14 @@ class IRToLLVMConverter(IRVisitor):
         assert isinstance(generator.iter, ast.Call)
         range_args = generator.iter.args
         if len(range_args) == 1:
-            start_val = ir.Constant(ir.IntType(64), 0)
+            start_val = _I64_ZERO
             end_expr = self._convert_ast_expr(range_args[0])
-            step_val = ir.Constant(ir.IntType(64), 1)
+            step_val = _I64_ONE
         elif len(range_args) == 2:
             start_expr = self._convert_ast_expr(range_args[0])
             end_expr = self._convert_ast_expr(range_args[1])
             start_val = start_expr
-            step_val = ir.Constant(ir.IntType(64), 1)
+            step_val = _I64_ONE
         elif len(range_args) == 3:
             start_expr = self._convert_ast_expr(range_args[0])
             end_expr = self._convert_ast_expr(range_args[1])
@@ -1231,14 +1297,14 @@ class IRToLLVMConverter(IRVisitor):
             assert isinstance(generator.iter, ast.Call)  # For mypy
             range_args = generator.iter.args
             if len(range_args) == 1:
-                start_val = ir.Constant(ir.IntType(64), 0)
+                start_val = _I64_ZERO
                 end_expr = self._convert_ast_expr(range_args[0])
-                step_val = ir.Constant(ir.IntType(64), 1)
+                step_val = _I64_ONE
             elif len(range_args) == 2:
                 start_expr = self._convert_ast_expr(range_args[0])
                 end_expr = self._convert_ast_expr(range_args[1])
                 start_val = start_expr
-                step_val = ir.Constant(ir.IntType(64), 1)
+                step_val = _I64_ONE
             elif len(range_args) == 3:
                 start_expr = self._convert_ast_expr(range_args[0])
                 end_expr = self._convert_ast_expr(range_args[1])
@@ -1289,18 +1355,19 @@ class IRToLLVMConverter(IRVisitor):
                 size_func = self.runtime.get_function("set_int_size")
                 get_nth_func = self.runtime.get_function("set_int_get_nth_element")
             else:
-                size_func = self.runtime.get_function("vec_int_size")
-                get_nth_func = self.runtime.get_function("vec_int_at")
+                vec_name = self._get_vec_name(iter_expr)
+                size_func = self.runtime.get_function(f"{vec_name}_size")
+                get_nth_func = self.runtime.get_function(f"{vec_name}_at")
 
             iter_size = self.builder.call(size_func, [iter_expr], name="iter_size")
 
             # Create index variable
             idx_var = self.builder.alloca(ir.IntType(64), name="idx")
-            self.builder.store(ir.Constant(ir.IntType(64), 0), idx_var)
+            self.builder.store(_I64_ZERO, idx_var)
 
-            # Create element variable for loop target
+            # Create element variable for loop target, typed by the container element
             loop_var_name = generator.target.id if isinstance(generator.target, ast.Name) else "loop_var"
-            elem_var = self.builder.alloca(ir.IntType(64), name=loop_var_name)
+            elem_var = self.builder.alloca(get_nth_func.function_type.return_type, name=loop_var_name)
 
             # Create loop blocks
             loop_cond_block = self.current_function.append_basic_block(name="set_loop_cond")
@@ -1328,7 +1395,7 @@ class IRToLLVMConverter(IRVisitor):
             self.var_symtab[loop_var_name] = elem_var
 
             # Store for increment
-            step_val = ir.Constant(ir.IntType(64), 1)
+            step_val = _I64_ONE
             loop_var = idx_var
             loop_var_val = idx_val
 
@@ -1375,16 +1442,28 @@ class IRToLLVMConverter(IRVisitor):
             raise RuntimeError("Builder not initialized")
 
         if isinstance(ast_expr, ast.Constant):
-            # Handle constant values - must be int for our use case
+            # Handle constant values - int, or float for comprehensions over list[float]
+            if isinstance(ast_expr.value, float):
+                return ir.Constant(ir.DoubleType(), ast_expr.value)
             if not isinstance(ast_expr.value, int):
-                raise ValueError(f"Expected int constant, got {type(ast_expr.value)}")
+                raise ValueError(f"Expected int or float constant, got {type(ast_expr.value)}")
             return ir.Constant(ir.IntType(64), ast_expr.value)
         elif isinstance(ast_expr, ast.Name):
             var_ptr = self.var_symtab[ast_expr.id]
             return self.builder.load(var_ptr, name=ast_expr.id)
         elif isinstance(ast_expr, ast.BinOp):
-            left = self._convert_ast_expr(ast_expr.left)
-            right = self._convert_ast_expr(ast_expr.right)
+            left, right = self._promote_ast_operands(ast_expr.left, ast_expr.right)
+            if isinstance(left.type, ir.DoubleType):
+                if isinstance(ast_expr.op, ast.Add):
+                    return self.builder.fadd(left, right, name="fadd_tmp")
+                elif isinstance(ast_expr.op, ast.Sub):
+                    return self.builder.fsub(left, right, name="fsub_tmp")
+                elif isinstance(ast_expr.op, ast.Mult):
+                    return self.builder.fmul(left, right, name="fmul_tmp")
+                elif isinstance(ast_expr.op, ast.Div):
+                    return self.builder.fdiv(left, right, name="fdiv_tmp")
+                else:
+                    raise NotImplementedError(f"Float binary op {type(ast_expr.op).__name__} not implemented")
             if isinstance(ast_expr.op, ast.Add):
                 return self.builder.add(left, right, name="add_tmp")
             elif isinstance(ast_expr.op, ast.Sub):
@@ -1396,24 +1475,48 @@ class IRToLLVMConverter(IRVisitor):
             else:
                 raise NotImplementedError(f"Binary op {type(ast_expr.op).__name__} not implemented")
         elif isinstance(ast_expr, ast.Compare):
-            left = self._convert_ast_expr(ast_expr.left)
-            right = self._convert_ast_expr(ast_expr.comparators[0])
+            left, right = self._promote_ast_operands(ast_expr.left, ast_expr.comparators[0])
             op = ast_expr.ops[0]
             if isinstance(op, ast.Lt):
-                return self.builder.icmp_signed("<", left, right, name="cmp_tmp")
+                symbol = "<"
             elif isinstance(op, ast.Gt):
-                return self.builder.icmp_signed(">", left, right, name="cmp_tmp")
+                symbol = ">"
             elif isinstance(op, ast.Eq):
-                return self.builder.icmp_signed("==", left, right, name="cmp_tmp")
+                symbol = "=="
             elif isinstance(op, ast.LtE):
-                return self.builder.icmp_signed("<=", left, right, name="cmp_tmp")
+                symbol = "<="
             elif isinstance(op, ast.GtE):
-                return self.builder.icmp_signed(">=", left, right, name="cmp_tmp")
+                symbol = ">="
             else:
                 raise NotImplementedError(f"Compare op {type(op).__name__} not implemented")
+            if isinstance(left.type, ir.DoubleType):
+                return self.builder.fcmp_ordered(symbol, left, right, name="fcmp_tmp")
+            return self.builder.icmp_signed(symbol, left, right, name="cmp_tmp")
         else:
             raise NotImplementedError(f"AST expression {type(ast_expr).__name__} not implemented in comprehensions")
 
+    def _promote_ast_operands(self, left_expr: ast.expr, right_expr: ast.expr) -> tuple[ir.Value, ir.Value]:
+        """Convert a pair of AST operands, promoting an int operand to double when the other is a double.
+
+        Args:
+            left_expr: Left AST operand
+            right_expr: Right AST operand
+
+        Returns:
+            Tuple of (left, right) LLVM values of the same type
+        """
+        if self.builder is None:
+            raise RuntimeError("Builder not initialized")
+
+        left = self._convert_ast_expr(left_expr)
+        right = self._convert_ast_expr(right_expr)
+        double = ir.DoubleType()
+        if isinstance(left.type, ir.DoubleType) and isinstance(right.type, ir.IntType):
+            right = self.builder.sitofp(right, double, name="int_to_double")
+        elif isinstance(right.type, ir.DoubleType) and isinstance(left.type, ir.IntType):
+            left = self.builder.sitofp(left, double, name="int_to_double")
+        return left, right
+
     def visit_variable_reference(self, node: IRVariableReference) -> ir.LoadInstr:
         """Convert IR variable reference to LLVM load instruction.
 
@@ -1470,7 +1573,7 @@ class IRToLLVMConverter(IRVisitor):
             raise RuntimeError("Builder not initialized")
 
         str_bytes = (str_value + "\0").encode("utf-8")
-        str_const = ir.Constant(ir.ArrayType(ir.IntType(8), len(str_bytes)), bytearray(str_bytes))
+        str_const = ir.Constant(_get_array_type(_I8_TYPE, len(str_bytes)), bytearray(str_bytes))
 
         # Create global variable for the string
         str_global = ir.GlobalVariable(self.module, str_const.type, name=f"str_{len(self.module.globals)}")
@@ -1479,7 +1582,7 @@ class IRToLLVMConverter(IRVisitor):
         str_global.initializer = str_const
 
         # Return pointer to the string (i8*)
-        return self.builder.gep(str_global, [ir.Constant(ir.IntType(32), 0), ir.Constant(ir.IntType(32), 0)])
+        return self.builder.gep(str_global, [_I32_ZERO, _I32_ZERO])
 
     def _concat_strings(self, left: ir.Value, right: ir.Value) -> ir.Value:
         """Concatenate two strings using C library functions.
@@ -1570,30 +1673,10 @@ class IRToLLVMConverter(IRVisitor):
             value = node.arguments[1].accept(self)
 
             # Determine list type based on LLVM types
-            from llvmlite import ir as llvm_ir
-
-            list_ptr_type = list_ptr.type
-
-            # Check the pointee type to determine which vec_* type we have
-            if isinstance(list_ptr_type, llvm_ir.PointerType):
-                pointee_type_str = str(list_ptr_type.pointee)
-
-                if "vec_vec_int" in pointee_type_str:
-                    # 2D list: vec_vec_int_push(list_ptr, vec_int_ptr)
-                    vec_push_func = self.runtime.get_function("vec_vec_int_push")
-                    self.builder.call(vec_push_func, [list_ptr, value], name="")
-                elif "vec_str" in pointee_type_str:
-                    # String list: vec_str_push(list_ptr, char* value)
-                    vec_push_func = self.runtime.get_function("vec_str_push")
-                    self.builder.call(vec_push_func, [list_ptr, value], name="")
-                else:
-                    # Integer list (default): vec_int_push(list_ptr, int_value)
-                    vec_push_func = self.runtime.get_function("vec_int_push")
-                    self.builder.call(vec_push_func, [list_ptr, value], name="")
-            else:
-                # Fallback to vec_int
-                vec_push_func = self.runtime.get_function("vec_int_push")
-                self.builder.call(vec_push_func, [list_ptr, value], name="")
+            # e.g. vec_int_push(list_ptr, i64), vec_double_push(list_ptr, double),
+            # vec_vec_int_push(list_ptr, vec_int*)
+            vec_push_func = self.runtime.get_function(f"{self._get_vec_name(list_ptr)}_push")
+            self.builder.call(vec_push_func, [list_ptr, value], name="")
 
             # Return the pointer (unchanged, since append mutates in place)
             return list_ptr
@@ -1607,12 +1690,10 @@ class IRToLLVMConverter(IRVisitor):
             key_or_index = node.arguments[1].accept(self)
 
             # Determine container type based on LLVM type
-            from llvmlite import ir as llvm_ir
-
             container_type = container_ptr.type
 
             # Check the pointee type to determine which container we have
-            if isinstance(container_type, llvm_ir.PointerType):
+            if isinstance(container_type, ir.PointerType):
                 pointee_type_str = str(container_type.pointee)
 
                 if "map_str_int" in pointee_type_str:
@@ -1623,21 +1704,13 @@ class IRToLLVMConverter(IRVisitor):
                     # Dict: map_int_int_get(dict_ptr, key) returns i64
                     map_get_func = self.runtime.get_function("map_int_int_get")
                     return self.builder.call(map_get_func, [container_ptr, key_or_index], name="dict_get")
-                elif "vec_vec_int" in pointee_type_str:
-                    # 2D list: vec_vec_int_at(list_ptr, index) returns vec_int*
-                    vec_at_func = self.runtime.get_function("vec_vec_int_at")
-                    return self.builder.call(vec_at_func, [container_ptr, key_or_index], name="list_at")
-                elif "vec_str" in pointee_type_str:
-                    # String list: vec_str_at(list_ptr, index) returns char*
-                    vec_at_func = self.runtime.get_function("vec_str_at")
-                    return self.builder.call(vec_at_func, [container_ptr, key_or_index], name="list_at")
                 else:
-                    # Integer list (default): vec_int_at(list_ptr, index) returns i64
-                    vec_at_func = self.runtime.get_function("vec_int_at")
+                    # List: vec_*_at(list_ptr, index) returns the element (vec_int* for 2D lists)
+                    vec_at_func = self.runtime.get_function(f"{self._get_vec_name(container_ptr)}_at")
                     return self.builder.call(vec_at_func, [container_ptr, key_or_index], name="list_at")
             else:
-                # Fallback to vec_int
-                vec_at_func = self.runtime.get_function("vec_int_at")
+                # Fallback to the default vec_* for untyped containers
+                vec_at_func = self.runtime.get_function(f"{self._get_vec_name(container_ptr)}_at")
                 return self.builder.call(vec_at_func, [container_ptr, key_or_index], name="list_at")
 
         elif node.function_name == "__set_get_nth__":
@@ -1662,12 +1735,10 @@ class IRToLLVMConverter(IRVisitor):
             value = node.arguments[2].accept(self)
 
             # Determine container type based on LLVM type
-            from llvmlite import ir as llvm_ir
-
             container_type = container_ptr.type
 
             # Check the pointee type to determine which container we have
-            if isinstance(container_type, llvm_ir.PointerType):
+            if isinstance(container_type, ir.PointerType):
                 pointee_type_str = str(container_type.pointee)
 
                 if "map_str_int" in pointee_type_str:
@@ -1678,13 +1749,9 @@ class IRToLLVMConverter(IRVisitor):
                     # Dict: map_int_int_set(dict_ptr, key, value)
                     map_set_func = self.runtime.get_function("map_int_int_set")
                     return self.builder.call(map_set_func, [container_ptr, key_or_index, value], name="")
-                elif "vec_str" in pointee_type_str:
-                    # String list: vec_str_set(list_ptr, index, char* value)
-                    vec_set_func = self.runtime.get_function("vec_str_set")
-                    return self.builder.call(vec_set_func, [container_ptr, key_or_index, value], name="")
                 else:
-                    # Integer list (default): vec_int_set(list_ptr, index, i64 value)
-                    vec_set_func = self.runtime.get_function("vec_int_set")
+                    # List: vec_*_set(list_ptr, index, value)
+                    vec_set_func = self.runtime.get_function(f"{self._get_vec_name(container_ptr)}_set")
                     return self.builder.call(vec_set_func, [container_ptr, key_or_index, value], name="")
             else:
                 # Fallback to vec_int
@@ -1700,11 +1767,9 @@ class IRToLLVMConverter(IRVisitor):
             key = node.arguments[1].accept(self)  # Key to check
 
             # Determine container type
-            from llvmlite import ir as llvm_ir
-
             container_type = container_ptr.type
 
-            if isinstance(container_type, llvm_ir.PointerType):
+            if isinstance(container_type, ir.PointerType):
                 pointee_type_str = str(container_type.pointee)
 
                 if "map_str_int" in pointee_type_str:
@@ -1712,7 +1777,7 @@ class IRToLLVMConverter(IRVisitor):
                     map_contains_func = self.runtime.get_function("map_str_int_contains")
                     result = self.builder.call(map_contains_func, [container_ptr, key], name="contains_result")
                     # Convert i32 result to i1 (bool) by comparing with 0
-                    return self.builder.icmp_signed("!=", result, ir.Constant(ir.IntType(32), 0), name="contains_bool")
+                    return self.builder.icmp_signed("!=", result, _I32_ZERO, name="contains_bool")
                 else:
                     # TODO: Add list contains support if needed
                     raise NotImplementedError(f"__contains__ not implemented for type {pointee_type_str}")
@@ -1792,7 +1857,7 @@ class IRToLLVMConverter(IRVisitor):
             startswith_func = self.runtime.get_function("mgen_str_startswith")
             result = self.builder.call(startswith_func, [str_ptr, prefix_ptr], name="startswith_result")
             # Convert i32 result to i1 (bool) by comparing with 0
-            return self.builder.icmp_signed("!=", result, ir.Constant(ir.IntType(32), 0), name="startswith_bool")
+            return self.builder.icmp_signed("!=", result, _I32_ZERO, name="startswith_bool")
 
         elif node.function_name == "__method_endswith__":
             # str.endswith(suffix) -> mgen_str_endswith(str, suffix) returns i32
@@ -1804,7 +1869,7 @@ class IRToLLVMConverter(IRVisitor):
             endswith_func = self.runtime.get_function("mgen_str_endswith")
             result = self.builder.call(endswith_func, [str_ptr, suffix_ptr], name="endswith_result")
             # Convert i32 result to i1 (bool) by comparing with 0
-            return self.builder.icmp_signed("!=", result, ir.Constant(ir.IntType(32), 0), name="endswith_bool")
+            return self.builder.icmp_signed("!=", result, _I32_ZERO, name="endswith_bool")
 
         elif node.function_name == "__method_join__":
             # separator.join(list) -> mgen_str_join(separator, list)
@@ -1852,9 +1917,7 @@ class IRToLLVMConverter(IRVisitor):
             elif arg.result_type.base_type == IRDataType.DICT:
                 # Use map_*_size function from runtime
                 # llvm_arg is already a pointer
-                from llvmlite import ir as llvm_ir
-
-                if isinstance(llvm_arg.type, llvm_ir.PointerType):
+                if isinstance(llvm_arg.type, ir.PointerType):
                     pointee_type_str = str(llvm_arg.type.pointee)
 
                     if "map_str_int" in pointee_type_str:
@@ -1870,22 +1933,7 @@ class IRToLLVMConverter(IRVisitor):
             elif arg.result_type.base_type == IRDataType.LIST:
                 # Use vec_*_size function from runtime based on element type
                 # llvm_arg is already a pointer
-                from llvmlite import ir as llvm_ir
-
-                # Check the pointee type to determine which vec_* type we have
-                if isinstance(llvm_arg.type, llvm_ir.PointerType):
-                    pointee_type_str = str(llvm_arg.type.pointee)
-
-                    if "vec_vec_int" in pointee_type_str:
-                        vec_size_func = self.runtime.get_function("vec_vec_int_size")
-                    elif "vec_str" in pointee_type_str:
-                        vec_size_func = self.runtime.get_function("vec_str_size")
-                    else:
-                        vec_size_func = self.runtime.get_function("vec_int_size")
-                else:
-                    # Fallback to vec_int
-                    vec_size_func = self.runtime.get_function("vec_int_size")
-
+                vec_size_func = self.runtime.get_function(f"{self._get_vec_name(llvm_arg)}_size")
                 return self.builder.call(vec_size_func, [llvm_arg], name="len_tmp")
             elif arg.result_type.base_type == IRDataType.SET:
                 # Use set_int_size function from runtime
@@ -1915,14 +1963,14 @@ class IRToLLVMConverter(IRVisitor):
                     raise NotImplementedError(f"Print for type {arg.result_type.base_type} not implemented")
 
                 # Create global string constant for format
-                fmt_const = ir.Constant(ir.ArrayType(ir.IntType(8), len(fmt_bytes)), bytearray(fmt_bytes))
+                fmt_const = ir.Constant(_get_array_type(_I8_TYPE, len(fmt_bytes)), bytearray(fmt_bytes))
                 fmt_global = ir.GlobalVariable(self.module, fmt_const.type, name=f"fmt_{len(self.module.globals)}")
                 fmt_global.linkage = "internal"
                 fmt_global.global_constant = True
                 fmt_global.initializer = fmt_const
 
                 # Get pointer to the format string
-                fmt_ptr = self.builder.gep(fmt_global, [ir.Constant(ir.IntType(32), 0), ir.Constant(ir.IntType(32), 0)])
+                fmt_ptr = self.builder.gep(fmt_global, [_I32_ZERO, _I32_ZERO])
 
                 # Evaluate argument and call printf
                 llvm_arg = arg.accept(self)
@@ -1950,10 +1998,25 @@ class IRToLLVMConverter(IRVisitor):
         if self.builder is None:
             raise RuntimeError("Builder not initialized - must be inside a function")
 
-        value = node.value.accept(self)
         source_type = node.value.result_type.base_type
         target_type = node.result_type.base_type
 
+        # Same type - no cast needed, emit the operand directly
+        if source_type == target_type:
+            return node.value.accept(self)
+
+        # BOOL -> INT -> BOOL round-trip is lossless, so fold it to the original bool
+        # (INT -> BOOL -> INT and FLOAT -> INT -> FLOAT truncate and must be kept)
+        if (
+            isinstance(node.value, IRTypeCast)
+            and target_type == IRDataType.BOOL
+            and source_type == IRDataType.INT
+            and node.value.value.result_type.base_type == IRDataType.BOOL
+        ):
+            return node.value.value.accept(self)
+
+        value = node.value.accept(self)
+
         # INT to FLOAT
         if source_type == IRDataType.INT and target_type == IRDataType.FLOAT:
             llvm_target = self._convert_type(node.result_type)
@@ -1966,12 +2029,12 @@ class IRToLLVMConverter(IRVisitor):
 
         # INT to BOOL
         elif source_type == IRDataType.INT and target_type == IRDataType.BOOL:
-            zero = ir.Constant(ir.IntType(64), 0)
+            zero = _I64_ZERO
             return self.builder.icmp_signed("!=", value, zero, name="cast_tmp")
 
         # FLOAT to BOOL
         elif source_type == IRDataType.FLOAT and target_type == IRDataType.BOOL:
-            zero = ir.Constant(ir.DoubleType(), 0.0)
+            zero = _F64_ZERO
             return self.builder.fcmp_ordered("!=", value, zero, name="cast_tmp")
 
         # BOOL to INT
@@ -1979,10 +2042,6 @@ class IRToLLVMConverter(IRVisitor):
             llvm_target = self._convert_type(node.result_type)
             return self.builder.zext(value, llvm_target, name="cast_tmp")
 
-        # Same type - no cast needed
-        elif source_type == target_type:
-            return value
-
         # Unsupported cast
         else:
             raise NotImplementedError(f"Type cast from {source_type} to {target_type} not implemented")
@@ -2002,6 +2061,23 @@ class IRToLLVMConverter(IRVisitor):
         else:
             self.builder.ret_void()
 
+    def visit_raise(self, node: IRRaise) -> None:
+        """Convert IR raise statement to a call to exit(1).
+
+        Exceptions cannot be caught in the static subset, so raising ends the
+        program with the exit status of an uncaught Python exception.
+
+        Args:
+            node: IR raise statement to convert
+        """
+        if self.builder is None:
+            raise RuntimeError("Builder not initialized - must be inside a function")
+
+        exit_func = self._get_or_create_c_function("exit", ir.VoidType(), [ir.IntType(32)])
+        exit_func.attributes.add("noreturn")
+        self.builder.call(exit_func, [ir.Constant(ir.IntType(32), 1)])
+        self.builder.unreachable()
+
     def visit_break(self, node: IRBreak) -> None:
         """Convert IR break statement to LLVM branch to loop exit.
 
@@ -2057,30 +2133,40 @@ class IRToLLVMConverter(IRVisitor):
         # Evaluate condition
         cond = node.condition.accept(self)
 
-        # Create basic blocks
-        then_block = self.current_function.append_basic_block("if.then")
-        else_block = self.current_function.append_basic_block("if.else")
-        merge_block = self.current_function.append_basic_block("if.merge")
-
-        # Branch on condition
-        self.builder.cbranch(cond, then_block, else_block)
-
-        # Generate then block
-        self.builder.position_at_end(then_block)
-        for stmt in node.then_body:
-            stmt.accept(self)
-        if not self.builder.block.is_terminated:
-            self.builder.branch(merge_block)
-
-        # Generate else block
-        self.builder.position_at_end(else_block)
-        for stmt in node.else_body:
-            stmt.accept(self)
-        if not self.builder.block.is_terminated:
-            self.builder.branch(merge_block)
-
-        # Continue at merge point
-        self.builder.position_at_end(merge_block)
+        # Nothing to branch over - the condition is still evaluated for its side effects
+        if not node.then_body and not node.else_body:
+            return
+
+        # Create basic blocks, branching straight to the merge point for an empty side.
+        # With both sides present the merge block is only created once a side falls through.
+        then_block = self.current_function.append_basic_block("if.then") if node.then_body else None
+        else_block = self.current_function.append_basic_block("if.else") if node.else_body else None
+        merge_block = None if then_block and else_block else self.current_function.append_basic_block("if.merge")
+
+        # Branch on condition, passing on any static prediction to block placement
+        branch = self.builder.cbranch(cond, then_block or merge_block, else_block or merge_block)
+        if node.then_weight is not None and node.else_weight is not None:
+            branch.set_weights([node.then_weight, node.else_weight])
+            if then_block is not None and node.then_weight < node.else_weight:
+                self.cold_blocks.append(then_block)
+            elif else_block is not None and node.else_weight < node.then_weight:
+                self.cold_blocks.append(else_block)
+
+        # Generate then and else blocks
+        for block, body in ((then_block, node.then_body), (else_block, node.else_body)):
+            if block is None:
+                continue
+            self.builder.position_at_end(block)
+            self._visit_body(body)
+            if not self.builder.block.is_terminated:
+                if merge_block is None:
+                    merge_block = self.current_function.append_basic_block("if.merge")
+                self.builder.branch(merge_block)
+
+        # Continue at merge point; if both sides terminated, any following code is unreachable
+        # and the builder stays on a terminated block so _visit_body skips it
+        if merge_block is not None:
+            self.builder.position_at_end(merge_block)
 
     def visit_while(self, node: IRWhile) -> None:
         """Convert IR while loop to LLVM loop blocks.
@@ -2110,8 +2196,7 @@ class IRToLLVMConverter(IRVisitor):
 
         # Generate body block
         self.builder.position_at_end(body_block)
-        for stmt in node.body:
-            stmt.accept(self)
+        self._visit_body(node.body)
         if not self.builder.block.is_terminated:
             self.builder.branch(cond_block)  # Loop back
 
@@ -2160,40 +2245,26 @@ class IRToLLVMConverter(IRVisitor):
 
         # Determine comparison operator based on step value
         # For negative steps, use >, for positive steps use <
-        from ...frontend.static_ir import IRBinaryOperation, IRLiteral
-
-        def is_negative_step(step: Optional[IRExpression]) -> bool:
-            """Check if step is a negative constant."""
-            if step is None:
-                return False
-            if isinstance(step, IRLiteral):
-                return isinstance(step.value, int) and step.value < 0
-            # Handle negative literals encoded as 0 - N
-            if isinstance(step, IRBinaryOperation) and step.operator == "-":
-                if isinstance(step.left, IRLiteral) and step.left.value == 0:
-                    if isinstance(step.right, IRLiteral) and isinstance(step.right.value, int):
-                        return step.right.value > 0
-            return False
-
-        comparison_op = ">" if is_negative_step(node.step) else "<"
+        comparison_op = ">" if node.step_is_negative else "<"
         cond = self.builder.icmp_signed(comparison_op, loop_var_val, end_val, name="for.cond")
         self.builder.cbranch(cond, body_block, exit_block)
 
         # Body
         self.builder.position_at_end(body_block)
-        for stmt in node.body:
-            stmt.accept(self)
+        self._visit_body(node.body)
         if not self.builder.block.is_terminated:
             self.builder.branch(inc_block)
 
         # Increment
         self.builder.position_at_end(inc_block)
         loop_var_val = self.builder.load(loop_var_ptr)
-        if node.step:
-            step_val = node.step.accept(self)
+        if node.step_is_unit or node.step is None:
+            # i < end held before the increment, so i + 1 cannot overflow
+            step_one = _I64_ONE if loop_var_type is _I64_TYPE else ir.Constant(loop_var_type, 1)
+            next_val = self.builder.add(loop_var_val, step_one, name="for.inc", flags=("nsw",))
         else:
-            step_val = ir.Constant(loop_var_type, 1)
-        next_val = self.builder.add(loop_var_val, step_val, name="for.inc")
+            step_val = node.step.accept(self)
+            next_val = self.builder.add(loop_var_val, step_val, name="for.inc")
         self.builder.store(next_val, loop_var_ptr)
         self.builder.branch(cond_block)
 
@@ -2233,15 +2304,10 @@ class IRToLLVMConverter(IRVisitor):
                 if elem_type == IRDataType.LIST:
                     # 2D list: list[list[int]] -> vec_vec_int*
                     return self.runtime.get_vec_vec_int_type().as_pointer()
-                elif elem_type == IRDataType.STRING:
-                    # String list: list[str] -> vec_str*
-                    return self.runtime.get_vec_str_type().as_pointer()
-                elif elem_type == IRDataType.INT:
-                    # Integer list: list[int] -> vec_int*
-                    return self.runtime.get_vec_int_type().as_pointer()
-                else:
-                    # Default to vec_int for other types
-                    return self.runtime.get_vec_int_type().as_pointer()
+
+                # list[int] -> vec_int*, list[float] -> vec_double*,
+                # list[bool] -> vec_bool*, list[str] -> vec_str*
+                return self.runtime.get_vec_type(self._get_list_element_type(elem_type)).as_pointer()
             else:
                 # No element type info, default to vec_int
                 return self.runtime.get_vec_int_type().as_pointer()
@@ -2265,15 +2331,7 @@ class IRToLLVMConverter(IRVisitor):
             return self.runtime.get_set_int_type().as_pointer()
 
         # Base type mapping
-        type_mapping = {
-            IRDataType.VOID: ir.VoidType(),
-            IRDataType.INT: ir.IntType(64),  # 64-bit integer
-            IRDataType.FLOAT: ir.DoubleType(),  # double precision
-            IRDataType.BOOL: ir.IntType(1),  # i1
-            IRDataType.STRING: ir.IntType(8).as_pointer(),  # char*
-        }
-
-        base = type_mapping.get(ir_type.base_type, ir.VoidType())
+        base = _BASE_TYPE_MAPPING.get(ir_type.base_type, _VOID_TYPE)
 
         # Handle pointers
         if ir_type.is_pointer or ir_type.pointer_depth > 0:
@@ -2286,9 +2344,59 @@ class IRToLLVMConverter(IRVisitor):
             # Build array types from innermost to outermost
             for dim in reversed(ir_type.array_dimensions):
                 if dim:
-                    base = ir.ArrayType(base, dim)
+                    base = _get_array_type(base, dim)
                 else:
                     # Unknown dimension, use pointer
                     base = base.as_pointer()
 
         return base
+
+    def _visit_body(self, body: list[IRStatement]) -> None:
+        """Convert a statement list, stopping once the current block is terminated.
+
+        Statements after a return, break or continue (or after an if whose branches
+        all return) are unreachable and would otherwise be appended past a terminator.
+
+        Args:
+            body: IR statements to convert
+        """
+        if self.builder is None:
+            raise RuntimeError("Builder not initialized - must be inside a function")
+
+        for stmt in body:
+            if self.builder.block.is_terminated:
+                break
+            stmt.accept(self)
+
+    def _get_list_element_type(self, elem_type: Optional[IRDataType]) -> ir.Type:
+        """Get the LLVM element type of the vec_* runtime used for a list.
+
+        Args:
+            elem_type: IR element data type of the list (None if unknown)
+
+        Returns:
+            LLVM element type (i64 for ints and anything without a specialized vec)
+        """
+        if elem_type == IRDataType.FLOAT:
+            return ir.DoubleType()
+        elif elem_type == IRDataType.BOOL:
+            return ir.IntType(1)
+        elif elem_type == IRDataType.STRING:
+            return ir.IntType(8).as_pointer()
+        return ir.IntType(64)
+
+    def _get_vec_name(self, vec_ptr: ir.Value) -> str:
+        """Get the runtime vec_* name for a list pointer.
+
+        Args:
+            vec_ptr: LLVM value pointing to a vec_* struct
+
+        Returns:
+            Runtime container name (e.g. "vec_double"), defaulting to "vec_int"
+        """
+        vec_type = vec_ptr.type
+        if isinstance(vec_type, ir.PointerType) and isinstance(vec_type.pointee, ir.IdentifiedStructType):
+            struct_name = vec_type.pointee.name
+            if struct_name.startswith("struct.vec_"):
+                return struct_name[len("struct.") :]
+        return "vec_int"
@@ -0,0 +1,144 @@
+"""Content-addressed cache for generated LLVM modules.
+
+Repeated mgen invocations on unchanged input otherwise re-run the Static IR to
+LLVM IR conversion and the full optimization pipeline. This module stores the
+resulting modules as LLVM bitcode, keyed on a hash of the input, so identical
+inputs can skip both steps.
+
+Example:
+    >>> from mgen.backends.llvm.module_cache import LLVMModuleCache
+    >>> cache = LLVMModuleCache()
+    >>> key = cache.make_key("emit", source_code)
+    >>> llvm_ir = cache.get(key)
+    >>> if llvm_ir is None:
+    ...     llvm_ir = generate(source_code)
+    ...     cache.put(key, llvm_ir)
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+from llvmlite import binding as llvm  # type: ignore[import-untyped]
+
+# Sources whose contents determine the generated IR. Their bytes are folded into
+# every cache key so that upgrading mgen never serves stale modules.
+_CODEGEN_SOURCES = (
+    Path(__file__).parent / "ir_to_llvm.py",
+    Path(__file__).parent / "runtime_decls.py",
+    Path(__file__).parent / "optimizer.py",
+    Path(__file__).parent.parent.parent / "frontend" / "static_ir.py",
+)
+
+_codegen_fingerprint: Optional[bytes] = None
+
+
+def _get_codegen_fingerprint() -> bytes:
+    """Get a digest identifying the current code generator and LLVM version.
+
+    Returns:
+        Digest bytes (computed once per process)
+    """
+    global _codegen_fingerprint
+    if _codegen_fingerprint is None:
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(".".join(str(part) for part in llvm.llvm_version_info).encode())
+        for source in _CODEGEN_SOURCES:
+            if source.exists():
+                hasher.update(source.read_bytes())
+        _codegen_fingerprint = hasher.digest()
+    return _codegen_fingerprint
+
+
+class LLVMModuleCache:
+    """On-disk cache mapping input hashes to LLVM bitcode files.
+
+    Attributes:
+        cache_dir: Directory holding the cached ``.bc`` files
+    """
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None) -> None:
+        """Initialize the module cache.
+
+        Args:
+            cache_dir: Cache directory (default: ``~/.cache/mgen/llvm``)
+        """
+        if cache_dir is None:
+            cache_dir = Path.home() / ".cache" / "mgen" / "llvm"
+        self.cache_dir = Path(cache_dir)
+        self._index: dict[str, Path] = {}
+
+    def make_key(self, *parts: str) -> str:
+        """Build a cache key from the given input parts.
+
+        Args:
+            *parts: Strings identifying the input (e.g. stage name and source text)
+
+        Returns:
+            Hex digest usable as a cache key
+        """
+        hasher = hashlib.blake2b(_get_codegen_fingerprint(), digest_size=32)
+        for part in parts:
+            hasher.update(part.encode("utf-8"))
+            hasher.update(b"\0")
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a cached module.
+
+        Args:
+            key: Cache key from ``make_key``
+
+        Returns:
+            LLVM IR text of the cached module, or None on a miss
+        """
+        path = self._index.get(key)
+        if path is None:
+            path = self.cache_dir / f"{key}.bc"
+            if not path.exists():
+                return None
+
+        try:
+            # Parse in a private context so struct names are not uniqued against other modules
+            llvm_module = llvm.parse_bitcode(path.read_bytes(), context=llvm.create_context())
+        except (OSError, RuntimeError):
+            # Unreadable or corrupt entry - treat as a miss and let put() replace it
+            self._index.pop(key, None)
+            return None
+
+        self._index[key] = path
+        return str(llvm_module)
+
+    def put(self, key: str, llvm_ir: str) -> str:
+        """Store a module in the cache as bitcode.
+
+        Args:
+            key: Cache key from ``make_key``
+            llvm_ir: LLVM IR text of the module to store
+
+        Returns:
+            The module's IR text as later returned by ``get`` for this key
+        """
+        llvm_module = llvm.parse_assembly(llvm_ir, context=llvm.create_context())
+        bitcode = llvm_module.as_bitcode()
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.cache_dir / f"{key}.bc"
+
+        # Write to a temporary file first so concurrent readers never see a partial entry
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(bitcode)
+        os.replace(tmp_path, path)
+
+        self._index[key] = path
+
+        # Round-trip through bitcode so the text matches what a later hit returns
+        return str(llvm.parse_bitcode(bitcode, context=llvm.create_context()))
+
+    def clear(self) -> None:
+        """Remove all cached modules."""
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob("*.bc"):
+                path.unlink(missing_ok=True)
+        self._index.clear()
@@ -16,10 +16,12 @@ Example:
     >>> optimized_ir = optimizer.optimize(original_ir)
 """
 
-from typing import Any
+from typing import Any, Optional
 
 from llvmlite import binding as llvm  # type: ignore[import-untyped]
 
+from .module_cache import LLVMModuleCache
+
 
 class LLVMOptimizer:
     """Manages LLVM optimization passes for IR optimization.
@@ -31,18 +33,21 @@ class LLVMOptimizer:
     Attributes:
         opt_level: Optimization level (0-3)
         target_machine: LLVM target machine for platform-specific opts
+        cache: Optional module cache for skipping passes on unchanged IR
     """
 
-    def __init__(self, opt_level: int = 2) -> None:
+    def __init__(self, opt_level: int = 2, cache: Optional[LLVMModuleCache] = None) -> None:
         """Initialize the LLVM optimizer.
 
         Args:
             opt_level: Optimization level (0=none, 1=basic, 2=moderate, 3=aggressive)
+            cache: Optional module cache; optimized modules are looked up and stored there
         """
         if not 0 <= opt_level <= 3:
             raise ValueError(f"Optimization level must be 0-3, got {opt_level}")
 
         self.opt_level = opt_level
+        self.cache = cache
 
         # Initialize LLVM native target
         llvm.initialize_native_target()
@@ -68,6 +73,14 @@ class LLVMOptimizer:
             ValueError: If IR is invalid or cannot be parsed
             RuntimeError: If optimization passes fail
         """
+        # Reuse a previously optimized module for identical input
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(f"O{self.opt_level}", llvm_ir)
+            cached_ir = self.cache.get(cache_key)
+            if cached_ir is not None:
+                return cached_ir
+
         # Parse and verify IR
         try:
             llvm_module = llvm.parse_assembly(llvm_ir)
@@ -98,8 +111,13 @@ class LLVMOptimizer:
         except Exception as e:
             raise RuntimeError(f"Optimization passes failed: {e}") from e
 
+        optimized_ir = str(llvm_module)
+
+        if self.cache is not None and cache_key is not None:
+            optimized_ir = self.cache.put(cache_key, optimized_ir)
+
         # Return optimized IR
-        return str(llvm_module)
+        return optimized_ir
 
     def _configure_pipeline_options(self, pto: llvm.PipelineTuningOptions) -> None:
         """Configure pipeline tuning options based on optimization level.
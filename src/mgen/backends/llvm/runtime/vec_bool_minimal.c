@@ -0,0 +1,147 @@
+/**
+ * Minimal vec_bool runtime for LLVM backend (list[bool])
+ * Single file implementation with all dependencies included
+ */
+
+#include <stdlib.h>
+#include <stddef.h>
+#include <stdio.h>
+#include <stdbool.h>
+
+// Error handling placeholder
+#define MGEN_SET_ERROR(code, msg) ((void)0)
+#define MGEN_ERROR_MEMORY 1
+#define MGEN_ERROR_VALUE 2
+
+#define VEC_BOOL_DEFAULT_CAPACITY 8
+#define VEC_BOOL_GROWTH_FACTOR 2
+
+// Dynamic boolean array structure
+typedef struct {
+    bool* data;     // Array data (one byte per element, matches LLVM i1 storage)
+    size_t size;         // Number of elements
+    size_t capacity;     // Allocated capacity
+} vec_bool;
+
+// Internal helper function
+static void vec_bool_grow(vec_bool* vec) {
+    size_t new_capacity = (vec->capacity == 0) ? VEC_BOOL_DEFAULT_CAPACITY : vec->capacity * VEC_BOOL_GROWTH_FACTOR;
+    bool* new_data = realloc(vec->data, new_capacity * sizeof(bool));
+    if (!new_data) {
+        fprintf(stderr, "vec_bool error: Failed to allocate memory for capacity %zu\n", new_capacity);
+        exit(1);
+    }
+    vec->data = new_data;
+    vec->capacity = new_capacity;
+}
+
+// Create a new boolean vector
+vec_bool vec_bool_init(void) {
+    vec_bool vec;
+    vec.capacity = VEC_BOOL_DEFAULT_CAPACITY;
+    vec.size = 0;
+    vec.data = malloc(VEC_BOOL_DEFAULT_CAPACITY * sizeof(bool));
+    if (!vec.data) {
+        vec.capacity = 0;
+        fprintf(stderr, "vec_bool error: Failed to allocate initial memory\n");
+        exit(1);
+    }
+    return vec;
+}
+
+// Initialize vector via pointer (for LLVM calling convention)
+void vec_bool_init_ptr(vec_bool* out) {
+    if (!out) {
+        fprintf(stderr, "vec_bool error: NULL pointer passed to vec_bool_init_ptr\n");
+        exit(1);
+    }
+    *out = vec_bool_init();
+}
+
+// Append an element to the end
+void vec_bool_push(vec_bool* vec, bool value) {
+    if (!vec) {
+        fprintf(stderr, "vec_bool error: NULL pointer passed to vec_bool_push\n");
+        exit(1);
+    }
+
+    if (vec->size >= vec->capacity) {
+        vec_bool_grow(vec);
+    }
+
+    vec->data[vec->size++] = value;
+}
+
+// Get element at index
+bool vec_bool_at(vec_bool* vec, size_t index) {
+    if (!vec) {
+        fprintf(stderr, "vec_bool error: NULL pointer passed to vec_bool_at\n");
+        exit(1);
+    }
+    if (index >= vec->size) {
+        fprintf(stderr, "vec_bool error: Index %zu out of bounds (size = %zu)\n", index, vec->size);
+        exit(1);
+    }
+    return vec->data[index];
+}
+
+// Set element at index
+void vec_bool_set(vec_bool* vec, size_t index, bool value) {
+    if (!vec) {
+        fprintf(stderr, "vec_bool error: NULL pointer passed to vec_bool_set\n");
+        exit(1);
+    }
+    if (index >= vec->size) {
+        fprintf(stderr, "vec_bool error: Index %zu out of bounds for set (size = %zu)\n", index, vec->size);
+        exit(1);
+    }
+    vec->data[index] = value;
+}
+
+// Get size of vector
+size_t vec_bool_size(vec_bool* vec) {
+    if (!vec) {
+        return 0;
+    }
+    return vec->size;
+}
+
+// Free vector memory
+void vec_bool_free(vec_bool* vec) {
+    if (vec && vec->data) {
+        free(vec->data);
+        vec->data = NULL;
+        vec->size = 0;
+        vec->capacity = 0;
+    }
+}
+
+// Get pointer to data array
+bool* vec_bool_data(vec_bool* vec) {
+    if (!vec) {
+        return NULL;
+    }
+    return vec->data;
+}
+
+// Clear vector (keep capacity)
+void vec_bool_clear(vec_bool* vec) {
+    if (vec) {
+        vec->size = 0;
+    }
+}
+
+// Reserve capacity
+void vec_bool_reserve(vec_bool* vec, size_t new_capacity) {
+    if (!vec || new_capacity <= vec->capacity) {
+        return;
+    }
+
+    bool* new_data = realloc(vec->data, new_capacity * sizeof(bool));
+    if (!new_data) {
+        fprintf(stderr, "vec_bool error: Failed to reserve capacity %zu\n", new_capacity);
+        exit(1);
+    }
+    vec->data = new_data;
+    vec->capacity = new_capacity;
+}
@@ -0,0 +1,146 @@
+/**
+ * Minimal vec_double runtime for LLVM backend (list[float])
+ * Single file implementation with all dependencies included
+ */
+
+#include <stdlib.h>
+#include <stddef.h>
+#include <stdio.h>
+
+// Error handling placeholder
+#define MGEN_SET_ERROR(code, msg) ((void)0)
+#define MGEN_ERROR_MEMORY 1
+#define MGEN_ERROR_VALUE 2
+
+#define VEC_DOUBLE_DEFAULT_CAPACITY 8
+#define VEC_DOUBLE_GROWTH_FACTOR 2
+
+// Dynamic double array structure
+typedef struct {
+    double* data;     // Array data (double precision, matches LLVM double)
+    size_t size;         // Number of elements
+    size_t capacity;     // Allocated capacity
+} vec_double;
+
+// Internal helper function
+static void vec_double_grow(vec_double* vec) {
+    size_t new_capacity = (vec->capacity == 0) ? VEC_DOUBLE_DEFAULT_CAPACITY : vec->capacity * VEC_DOUBLE_GROWTH_FACTOR;
+    double* new_data = realloc(vec->data, new_capacity * sizeof(double));
+    if (!new_data) {
+        fprintf(stderr, "vec_double error: Failed to allocate memory for capacity %zu\n", new_capacity);
+        exit(1);
+    }
+    vec->data = new_data;
+    vec->capacity = new_capacity;
+}
+
+// Create a new double vector
+vec_double vec_double_init(void) {
+    vec_double vec;
+    vec.capacity = VEC_DOUBLE_DEFAULT_CAPACITY;
+    vec.size = 0;
+    vec.data = malloc(VEC_DOUBLE_DEFAULT_CAPACITY * sizeof(double));
+    if (!vec.data) {
+        vec.capacity = 0;
+        fprintf(stderr, "vec_double error: Failed to allocate initial memory\n");
+        exit(1);
+    }
+    return vec;
+}
+
+// Initialize vector via pointer (for LLVM calling convention)
+void vec_double_init_ptr(vec_double* out) {
+    if (!out) {
+        fprintf(stderr, "vec_double error: NULL pointer passed to vec_double_init_ptr\n");
+        exit(1);
+    }
+    *out = vec_double_init();
+}
+
+// Append an element to the end
+void vec_double_push(vec_double* vec, double value) {
+    if (!vec) {
+        fprintf(stderr, "vec_double error: NULL pointer passed to vec_double_push\n");
+        exit(1);
+    }
+
+    if (vec->size >= vec->capacity) {
+        vec_double_grow(vec);
+    }
+
+    vec->data[vec->size++] = value;
+}
+
+// Get element at index
+double vec_double_at(vec_double* vec, size_t index) {
+    if (!vec) {
+        fprintf(stderr, "vec_double error: NULL pointer passed to vec_double_at\n");
+        exit(1);
+    }
+    if (index >= vec->size) {
+        fprintf(stderr, "vec_double error: Index %zu out of bounds (size = %zu)\n", index, vec->size);
+        exit(1);
+    }
+    return vec->data[index];
+}
+
+// Set element at index
+void vec_double_set(vec_double* vec, size_t index, double value) {
+    if (!vec) {
+        fprintf(stderr, "vec_double error: NULL pointer passed to vec_double_set\n");
+        exit(1);
+    }
+    if (index >= vec->size) {
+        fprintf(stderr, "vec_double error: Index %zu out of bounds for set (size = %zu)\n", index, vec->size);
+        exit(1);
+    }
+    vec->data[index] = value;
+}
+
+// Get size of vector
+size_t vec_double_size(vec_double* vec) {
+    if (!vec) {
+        return 0;
+    }
+    return vec->size;
+}
+
+// Free vector memory
+void vec_double_free(vec_double* vec) {
+    if (vec && vec->data) {
+        free(vec->data);
+        vec->data = NULL;
+        vec->size = 0;
+        vec->capacity = 0;
+    }
+}
+
+// Get pointer to data array
+double* vec_double_data(vec_double* vec) {
+    if (!vec) {
+        return NULL;
+    }
+    return vec->data;
+}
+
+// Clear vector (keep capacity)
+void vec_double_clear(vec_double* vec) {
+    if (vec) {
+        vec->size = 0;
+    }
+}
+
+// Reserve capacity
+void vec_double_reserve(vec_double* vec, size_t new_capacity) {
+    if (!vec || new_capacity <= vec->capacity) {
+        return;
+    }
+
+    double* new_data = realloc(vec->data, new_capacity * sizeof(double));
+    if (!new_data) {
+        fprintf(stderr, "vec_double error: Failed to reserve capacity %zu\n", new_capacity);
+        exit(1);
+    }
+    vec->data = new_data;
+    vec->capacity = new_capacity;
+}
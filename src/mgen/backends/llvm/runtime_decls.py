@@ -1,15 +1,52 @@
 """LLVM IR runtime declarations for C runtime library.
 
 This module generates LLVM IR struct definitions and extern function declarations
-that correspond to the C runtime library (vec_int, map_int_int, set_int, etc.).
+that correspond to the C runtime library (vec_int, vec_double, map_int_int, set_int, etc.).
 """
 
+from typing import Optional
+
 from llvmlite import ir  # type: ignore[import-untyped]
 
+from ...frontend.static_ir import LIKELY_BRANCH_WEIGHT, UNLIKELY_BRANCH_WEIGHT
+
+# Element type (LLVM type string) -> suffix of the specialized vec_<suffix> runtime
+VEC_ELEMENT_SUFFIXES: dict[str, str] = {
+    "i64": "int",
+    "double": "double",
+    "i1": "bool",
+    "i8*": "str",
+}
+
+# Suffix of the specialized vec_<suffix> runtime -> LLVM element type
+VEC_SUFFIX_ELEMENT_TYPES: dict[str, ir.Type] = {
+    "int": ir.IntType(64),
+    "double": ir.DoubleType(),
+    "bool": ir.IntType(1),
+    "str": ir.IntType(8).as_pointer(),
+}
+
+# Element type (LLVM type string) -> C type name used in TBAA type descriptors
+TBAA_ELEMENT_TYPE_NAMES: dict[str, str] = {
+    "i64": "long long",
+    "double": "double",
+    "i1": "_Bool",
+    "i8*": "any pointer",
+}
+
+# vec_<suffix> accessors whose bodies are emitted in the module so they can be inlined
+INLINE_VEC_ACCESSORS = ("size", "at")
+
+# Runtime function signature: (return type, argument types)
+Signature = tuple[ir.Type, list[ir.Type]]
+
 
 class LLVMRuntimeDeclarations:
     """Generate LLVM IR declarations for C runtime library."""
 
+    # Looked up on nearly every expression visit - keep attribute access slot-based
+    __slots__ = ("module", "struct_types", "function_decls", "tbaa_tags")
+
     def __init__(self, module: ir.Module) -> None:
         """Initialize runtime declarations.
 
@@ -19,100 +56,113 @@ class LLVMRuntimeDeclarations:
         self.module = module
         self.struct_types: dict[str, ir.Type] = {}
         self.function_decls: dict[str, ir.Function] = {}
+        self.tbaa_tags: dict[str, ir.MDValue] = {}
 
-    def get_vec_int_type(self) -> ir.Type:
-        """Get or create vec_int struct type.
+    def get_vec_suffix(self, elem_type: ir.Type) -> str:
+        """Get the vec_<suffix> name suffix for an element type.
 
-        C struct definition:
+        Args:
+            elem_type: LLVM element type (i64, double, i1 or i8*)
+
+        Returns:
+            Suffix used in the runtime struct and function names (e.g. "int" for vec_int)
+
+        Raises:
+            KeyError: If there is no runtime vector for the element type
+        """
+        suffix = VEC_ELEMENT_SUFFIXES.get(str(elem_type))
+        if suffix is None:
+            raise KeyError(f"No vec runtime for element type '{elem_type}'")
+        return suffix
+
+    def get_vec_type(self, elem_type: ir.Type) -> ir.Type:
+        """Get or create the vec_<suffix> struct type for an element type.
+
+        C struct definition (T is the C element type):
             typedef struct {
-                long long* data;
+                T* data;
                 size_t size;
                 size_t capacity;
-            } vec_int;
+            } vec_<suffix>;
+
+        Args:
+            elem_type: LLVM element type (i64, double, i1 or i8*)
 
         Returns:
-            LLVM struct type for vec_int
+            LLVM struct type for vec_<suffix>
         """
-        if "vec_int" in self.struct_types:
-            return self.struct_types["vec_int"]
+        name = f"vec_{self.get_vec_suffix(elem_type)}"
+        if name in self.struct_types:
+            return self.struct_types[name]
 
         # Create named struct type (required for alloca)
-        # struct vec_int { i64*, i64, i64 }
-        # data: i64* (pointer to array of 64-bit integers)
-        # size: i64 (size_t on 64-bit systems)
-        # capacity: i64 (size_t on 64-bit systems)
-        vec_int_type = self.module.context.get_identified_type("struct.vec_int")
+        vec_type = self.module.context.get_identified_type(f"struct.{name}")
 
         # Only set body if not already defined (avoid re-definition in shared context)
-        if not vec_int_type.is_opaque:
+        if not vec_type.is_opaque:
             # Type already has a body, just use it
-            self.struct_types["vec_int"] = vec_int_type
-            return vec_int_type
+            self.struct_types[name] = vec_type
+            return vec_type
 
-        vec_int_type.set_body(
-            ir.IntType(64).as_pointer(),  # data
-            ir.IntType(64),  # size
-            ir.IntType(64),  # capacity
+        vec_type.set_body(
+            elem_type.as_pointer(),  # data
+            ir.IntType(64),  # size (size_t on 64-bit systems)
+            ir.IntType(64),  # capacity (size_t on 64-bit systems)
         )
 
-        self.struct_types["vec_int"] = vec_int_type
-        return vec_int_type
+        self.struct_types[name] = vec_type
+        return vec_type
 
-    def declare_vec_int_functions(self) -> None:
-        """Declare vec_int C runtime functions in LLVM IR."""
-        vec_int_type = self.get_vec_int_type()
-        vec_int_ptr = vec_int_type.as_pointer()
+    def declare_vec_functions(self, elem_type: ir.Type) -> None:
+        """Declare vec_<suffix> C runtime functions in LLVM IR.
+
+        Args:
+            elem_type: LLVM element type (i64, double, i1 or i8*)
+        """
+        self._declare_table(self._vec_signatures(elem_type))
+
+    def _vec_signatures(self, elem_type: ir.Type) -> dict[str, Signature]:
+        """Get the vec_<suffix> C runtime function signatures.
+
+        Args:
+            elem_type: LLVM element type (i64, double, i1 or i8*)
+
+        Returns:
+            Mapping of function name to (return type, argument types)
+        """
+        name = f"vec_{self.get_vec_suffix(elem_type)}"
+        vec_ptr = self.get_vec_type(elem_type).as_pointer()
         i64 = ir.IntType(64)
-        i64_ptr = i64.as_pointer()
         void = ir.VoidType()
 
-        # void vec_int_init_ptr(vec_int* out) - initialize via pointer
-        func_type = ir.FunctionType(void, [vec_int_ptr])
-        func = ir.Function(self.module, func_type, name="vec_int_init_ptr")
-        self.function_decls["vec_int_init_ptr"] = func
-
-        # void vec_int_push(vec_int* vec, long long value)
-        func_type = ir.FunctionType(void, [vec_int_ptr, i64])
-        func = ir.Function(self.module, func_type, name="vec_int_push")
-        self.function_decls["vec_int_push"] = func
-
-        # long long vec_int_at(vec_int* vec, size_t index)
-        func_type = ir.FunctionType(i64, [vec_int_ptr, i64])
-        func = ir.Function(self.module, func_type, name="vec_int_at")
-        self.function_decls["vec_int_at"] = func
-
-        # size_t vec_int_size(vec_int* vec)
-        func_type = ir.FunctionType(i64, [vec_int_ptr])
-        func = ir.Function(self.module, func_type, name="vec_int_size")
-        self.function_decls["vec_int_size"] = func
-
-        # void vec_int_free(vec_int* vec)
-        func_type = ir.FunctionType(void, [vec_int_ptr])
-        func = ir.Function(self.module, func_type, name="vec_int_free")
-        self.function_decls["vec_int_free"] = func
-
-        # long long* vec_int_data(vec_int* vec)
-        func_type = ir.FunctionType(i64_ptr, [vec_int_ptr])
-        func = ir.Function(self.module, func_type, name="vec_int_data")
-        self.function_decls["vec_int_data"] = func
-
-        # void vec_int_clear(vec_int* vec)
-        func_type = ir.FunctionType(void, [vec_int_ptr])
-        func = ir.Function(self.module, func_type, name="vec_int_clear")
-        self.function_decls["vec_int_clear"] = func
-
-        # void vec_int_reserve(vec_int* vec, size_t new_capacity)
-        func_type = ir.FunctionType(void, [vec_int_ptr, i64])
-        func = ir.Function(self.module, func_type, name="vec_int_reserve")
-        self.function_decls["vec_int_reserve"] = func
-
-        # void vec_int_set(vec_int* vec, size_t index, long long value)
-        func_type = ir.FunctionType(void, [vec_int_ptr, i64, i64])
-        func = ir.Function(self.module, func_type, name="vec_int_set")
-        self.function_decls["vec_int_set"] = func
+        return {
+            f"{name}_init_ptr": (void, [vec_ptr]),  # void vec_T_init_ptr(vec_T* out)
+            f"{name}_push": (void, [vec_ptr, elem_type]),  # void vec_T_push(vec_T* vec, T value)
+            f"{name}_at": (elem_type, [vec_ptr, i64]),  # T vec_T_at(vec_T* vec, size_t index)
+            f"{name}_size": (i64, [vec_ptr]),  # size_t vec_T_size(vec_T* vec)
+            f"{name}_free": (void, [vec_ptr]),  # void vec_T_free(vec_T* vec)
+            f"{name}_data": (elem_type.as_pointer(), [vec_ptr]),  # T* vec_T_data(vec_T* vec)
+            f"{name}_clear": (void, [vec_ptr]),  # void vec_T_clear(vec_T* vec)
+            f"{name}_reserve": (void, [vec_ptr, i64]),  # void vec_T_reserve(vec_T* vec, size_t new_capacity)
+            f"{name}_set": (void, [vec_ptr, i64, elem_type]),  # void vec_T_set(vec_T* vec, size_t index, T value)
+        }
+
+    def get_vec_int_type(self) -> ir.Type:
+        """Get or create vec_int struct type.
+
+        Returns:
+            LLVM struct type for vec_int
+        """
+        return self.get_vec_type(ir.IntType(64))
+
+    def declare_vec_int_functions(self) -> None:
+        """Declare vec_int C runtime functions in LLVM IR."""
+        self.declare_vec_functions(ir.IntType(64))
 
     def get_function(self, name: str) -> ir.Function:
-        """Get declared function by name.
+        """Get a runtime function, declaring it on first use.
+
+        Only the runtime functions a module actually calls end up declared in it.
 
         Args:
             name: Function name
@@ -121,11 +171,202 @@ class LLVMRuntimeDeclarations:
             LLVM function declaration
 
         Raises:
-            KeyError: If function not declared
+            KeyError: If name is not a known runtime function
         """
-        if name not in self.function_decls:
-            raise KeyError(f"Function '{name}' not declared. Call declare_*_functions() first.")
-        return self.function_decls[name]
+        # Single hash lookup on the hot path; only misses pay for the signature lookup
+        try:
+            return self.function_decls[name]
+        except KeyError:
+            pass
+
+        signature = self._find_signature(name)
+        if signature is None:
+            raise KeyError(f"Function '{name}' is not a known runtime function.")
+
+        elem_type = self._inline_accessor_element_type(name)
+        if elem_type is not None:
+            return self._define_inline_vec_accessor(name, elem_type, signature)
+        return self._declare(name, *signature)
+
+    def _find_signature(self, name: str) -> Optional[Signature]:
+        """Look up the signature of a runtime function by name.
+
+        Args:
+            name: Function name
+
+        Returns:
+            (return type, argument types), or None if name is not a runtime function
+        """
+        table: Optional[dict[str, Signature]] = None
+        if name.startswith("vec_vec_int_"):
+            table = self._vec_vec_int_signatures()
+        elif name.startswith("vec_"):
+            elem_type = VEC_SUFFIX_ELEMENT_TYPES.get(name[len("vec_") :].split("_", 1)[0])
+            if elem_type is not None:
+                table = self._vec_signatures(elem_type)
+        elif name.startswith("map_str_int_"):
+            table = self._map_str_int_signatures()
+        elif name.startswith("map_int_int_"):
+            table = self._map_int_int_signatures()
+        elif name.startswith("set_int_"):
+            table = self._set_int_signatures()
+        elif name.startswith(("mgen_str_", "mgen_string_array_")):
+            table = self._string_signatures()
+
+        return table.get(name) if table is not None else None
+
+    def _declare(self, name: str, ret_type: ir.Type, arg_types: list[ir.Type]) -> ir.Function:
+        """Add an extern function declaration to the module.
+
+        Args:
+            name: Function name
+            ret_type: LLVM return type
+            arg_types: LLVM argument types
+
+        Returns:
+            LLVM function declaration
+        """
+        func = ir.Function(self.module, ir.FunctionType(ret_type, arg_types), name=name)
+
+        # C bool is passed and returned zero-extended; i1 needs the attribute to match
+        bool_type = ir.IntType(1)
+        if ret_type == bool_type:
+            func.return_value.add_attribute("zeroext")
+        for arg in func.args:
+            if arg.type == bool_type:
+                arg.add_attribute("zeroext")
+
+        self.function_decls[name] = func
+        return func
+
+    def _inline_accessor_element_type(self, name: str) -> Optional[ir.Type]:
+        """Get the element type if name is a vec accessor that is emitted inline.
+
+        Args:
+            name: Function name
+
+        Returns:
+            LLVM element type for vec_<suffix>_size/_at, otherwise None
+        """
+        for accessor in INLINE_VEC_ACCESSORS:
+            if name.startswith("vec_") and name.endswith(f"_{accessor}"):
+                return VEC_SUFFIX_ELEMENT_TYPES.get(name[len("vec_") : -len(accessor) - 1])
+        return None
+
+    def _define_inline_vec_accessor(self, name: str, elem_type: ir.Type, signature: Signature) -> ir.Function:
+        """Define an inlinable body for a trivial vec accessor.
+
+        The C runtime is linked as a separate object, so calls to it can never be
+        inlined. vec_<suffix>_size and vec_<suffix>_at are a field load and a
+        bounds-checked element load, so an internal alwaysinline copy is emitted in
+        the module instead. The out-of-bounds path still calls the C function, which
+        reports the error exactly as before.
+
+        Args:
+            name: Function name (vec_<suffix>_size or vec_<suffix>_at)
+            elem_type: LLVM element type of the vec
+            signature: C runtime signature of the function
+
+        Returns:
+            Internal LLVM function, registered under the runtime name
+        """
+        ret_type, arg_types = signature
+        func = ir.Function(self.module, ir.FunctionType(ret_type, arg_types), name=f"{name}.inline")
+        func.linkage = "internal"
+        func.attributes.add("alwaysinline")
+        func.attributes.add("nounwind")
+
+        vec = func.args[0]
+        i32 = ir.IntType(32)
+        builder = ir.IRBuilder(func.append_basic_block("entry"))
+        is_null = builder.icmp_unsigned("==", vec, ir.Constant(vec.type, None), name="is_null")
+
+        if name.endswith("_size"):
+            # size_t vec_T_size(vec_T* vec) returns 0 for NULL
+            load_block = func.append_basic_block("load")
+            null_block = func.append_basic_block("null")
+            builder.cbranch(is_null, null_block, load_block).set_weights([UNLIKELY_BRANCH_WEIGHT, LIKELY_BRANCH_WEIGHT])
+            builder.position_at_end(null_block)
+            builder.ret(ir.Constant(ret_type, 0))
+            builder.position_at_end(load_block)
+            size_ptr = builder.gep(vec, [ir.Constant(i32, 0), ir.Constant(i32, 1)], inbounds=True)
+            size = builder.load(size_ptr, name="size")
+            size.set_metadata("tbaa", self.get_tbaa_tag("long"))
+            builder.ret(size)
+        else:
+            # T vec_T_at(vec_T* vec, size_t index) aborts on NULL or out-of-bounds index
+            extern = self._declare(name, ret_type, arg_types)
+            index = func.args[1]
+            check_block = func.append_basic_block("check")
+            load_block = func.append_basic_block("load")
+            error_block = func.append_basic_block("error")
+            builder.cbranch(is_null, error_block, check_block).set_weights(
+                [UNLIKELY_BRANCH_WEIGHT, LIKELY_BRANCH_WEIGHT]
+            )
+
+            builder.position_at_end(check_block)
+            size_ptr = builder.gep(vec, [ir.Constant(i32, 0), ir.Constant(i32, 1)], inbounds=True)
+            size = builder.load(size_ptr, name="size")
+            size.set_metadata("tbaa", self.get_tbaa_tag("long"))
+            in_bounds = builder.icmp_unsigned("<", index, size, name="in_bounds")
+            builder.cbranch(in_bounds, load_block, error_block).set_weights(
+                [LIKELY_BRANCH_WEIGHT, UNLIKELY_BRANCH_WEIGHT]
+            )
+
+            builder.position_at_end(load_block)
+            data_ptr = builder.gep(vec, [ir.Constant(i32, 0), ir.Constant(i32, 0)], inbounds=True)
+            data = builder.load(data_ptr, name="data")
+            data.set_metadata("tbaa", self.get_tbaa_tag("any pointer"))
+            elem_ptr = builder.gep(data, [index], inbounds=True)
+            elem = builder.load(elem_ptr, name="elem")
+            elem.set_metadata("tbaa", self.get_tbaa_tag(TBAA_ELEMENT_TYPE_NAMES[str(elem_type)]))
+            builder.ret(elem)
+
+            # The C runtime reports the error and exits. It is only reached from here, so
+            # marking it cold keeps the error path out of line once inlined.
+            extern.attributes.add("cold")
+            builder.position_at_end(error_block)
+            builder.ret(builder.call(extern, [vec, index]))
+
+        # Callers get the inline body; the extern (if any) stays reachable from it
+        self.function_decls[name] = func
+        return func
+
+    def get_tbaa_tag(self, type_name: str) -> ir.MDValue:
+        """Get or create a scalar TBAA access tag for a C type.
+
+        Uses the same type names and root as clang, e.g. "long" for size_t fields and
+        "any pointer" for data pointers, so loads of different container fields are
+        known not to alias.
+
+        Args:
+            type_name: C type name of the accessed scalar
+
+        Returns:
+            Metadata node to attach to loads/stores as !tbaa
+        """
+        tag = self.tbaa_tags.get(type_name)
+        if tag is not None:
+            return tag
+
+        zero = ir.Constant(ir.IntType(64), 0)
+        root = self.module.add_metadata([ir.MetaDataString(self.module, "Simple C/C++ TBAA")])
+        char_type = self.module.add_metadata([ir.MetaDataString(self.module, "omnipotent char"), root, zero])
+        scalar_type = self.module.add_metadata([ir.MetaDataString(self.module, type_name), char_type, zero])
+        tag = self.module.add_metadata([scalar_type, scalar_type, zero])
+
+        self.tbaa_tags[type_name] = tag
+        return tag
+
+    def _declare_table(self, signatures: dict[str, Signature]) -> None:
+        """Declare every not-yet-declared function in a signature table.
+
+        Args:
+            signatures: Mapping of function name to (return type, argument types)
+        """
+        for name, (ret_type, arg_types) in signatures.items():
+            if name not in self.function_decls:
+                self._declare(name, ret_type, arg_types)
 
     def get_vec_vec_int_type(self) -> ir.Type:
         """Get or create vec_vec_int struct type.
@@ -165,43 +406,34 @@ class LLVMRuntimeDeclarations:
 
     def declare_vec_vec_int_functions(self) -> None:
         """Declare vec_vec_int C runtime functions in LLVM IR."""
-        vec_vec_int_type = self.get_vec_vec_int_type()
-        vec_vec_int_ptr = vec_vec_int_type.as_pointer()
-        vec_int_type = self.get_vec_int_type()
-        vec_int_ptr = vec_int_type.as_pointer()
+        self._declare_table(self._vec_vec_int_signatures())
+
+    def _vec_vec_int_signatures(self) -> dict[str, Signature]:
+        """Get the vec_vec_int C runtime function signatures.
+
+        Returns:
+            Mapping of function name to (return type, argument types)
+        """
+        vec_vec_int_ptr = self.get_vec_vec_int_type().as_pointer()
+        vec_int_ptr = self.get_vec_int_type().as_pointer()
         i64 = ir.IntType(64)
         void = ir.VoidType()
 
-        # void vec_vec_int_init_ptr(vec_vec_int* out)
-        func_type = ir.FunctionType(void, [vec_vec_int_ptr])
-        func = ir.Function(self.module, func_type, name="vec_vec_int_init_ptr")
-        self.function_decls["vec_vec_int_init_ptr"] = func
-
-        # void vec_vec_int_push(vec_vec_int* vec, vec_int* row)
-        # Note: row is passed by pointer (avoids struct-by-value issues)
-        func_type = ir.FunctionType(void, [vec_vec_int_ptr, vec_int_ptr])
-        func = ir.Function(self.module, func_type, name="vec_vec_int_push")
-        self.function_decls["vec_vec_int_push"] = func
-
-        # vec_int* vec_vec_int_at(vec_vec_int* vec, size_t index)
-        func_type = ir.FunctionType(vec_int_ptr, [vec_vec_int_ptr, i64])
-        func = ir.Function(self.module, func_type, name="vec_vec_int_at")
-        self.function_decls["vec_vec_int_at"] = func
-
-        # size_t vec_vec_int_size(vec_vec_int* vec)
-        func_type = ir.FunctionType(i64, [vec_vec_int_ptr])
-        func = ir.Function(self.module, func_type, name="vec_vec_int_size")
-        self.function_decls["vec_vec_int_size"] = func
-
-        # void vec_vec_int_free(vec_vec_int* vec)
-        func_type = ir.FunctionType(void, [vec_vec_int_ptr])
-        func = ir.Function(self.module, func_type, name="vec_vec_int_free")
-        self.function_decls["vec_vec_int_free"] = func
-
-        # void vec_vec_int_clear(vec_vec_int* vec)
-        func_type = ir.FunctionType(void, [vec_vec_int_ptr])
-        func = ir.Function(self.module, func_type, name="vec_vec_int_clear")
-        self.function_decls["vec_vec_int_clear"] = func
+        return {
+            # void vec_vec_int_init_ptr(vec_vec_int* out)
+            "vec_vec_int_init_ptr": (void, [vec_vec_int_ptr]),
+            # void vec_vec_int_push(vec_vec_int* vec, vec_int* row)
+            # Note: row is passed by pointer (avoids struct-by-value issues)
+            "vec_vec_int_push": (void, [vec_vec_int_ptr, vec_int_ptr]),
+            # vec_int* vec_vec_int_at(vec_vec_int* vec, size_t index)
+            "vec_vec_int_at": (vec_int_ptr, [vec_vec_int_ptr, i64]),
+            # size_t vec_vec_int_size(vec_vec_int* vec)
+            "vec_vec_int_size": (i64, [vec_vec_int_ptr]),
+            # void vec_vec_int_free(vec_vec_int* vec)
+            "vec_vec_int_free": (void, [vec_vec_int_ptr]),
+            # void vec_vec_int_clear(vec_vec_int* vec)
+            "vec_vec_int_clear": (void, [vec_vec_int_ptr]),
+        }
 
     def get_string_array_type(self) -> ir.Type:
         """Get or create mgen_string_array_t struct type.
@@ -241,159 +473,57 @@ class LLVMRuntimeDeclarations:
     def get_vec_str_type(self) -> ir.Type:
         """Get or create vec_str struct type.
 
-        C struct definition:
-            typedef struct {
-                char** data;
-                size_t size;
-                size_t capacity;
-            } vec_str;
-
         Returns:
             LLVM struct type for vec_str
         """
-        if "vec_str" in self.struct_types:
-            return self.struct_types["vec_str"]
-
-        # Create named struct type
-        vec_str_type = self.module.context.get_identified_type("struct.vec_str")
-
-        if not vec_str_type.is_opaque:
-            self.struct_types["vec_str"] = vec_str_type
-            return vec_str_type
-
-        i8_ptr = ir.IntType(8).as_pointer()  # char*
-        i8_ptr_ptr = i8_ptr.as_pointer()  # char**
-
-        vec_str_type.set_body(
-            i8_ptr_ptr,  # data: char**
-            ir.IntType(64),  # size
-            ir.IntType(64),  # capacity
-        )
-
-        self.struct_types["vec_str"] = vec_str_type
-        return vec_str_type
+        return self.get_vec_type(ir.IntType(8).as_pointer())
 
     def declare_vec_str_functions(self) -> None:
         """Declare vec_str C runtime functions in LLVM IR."""
-        vec_str_type = self.get_vec_str_type()
-        vec_str_ptr = vec_str_type.as_pointer()
-        i8_ptr = ir.IntType(8).as_pointer()  # char*
-        i8_ptr_ptr = i8_ptr.as_pointer()  # char**
-        i64 = ir.IntType(64)
-        void = ir.VoidType()
-
-        # void vec_str_init_ptr(vec_str* out)
-        func_type = ir.FunctionType(void, [vec_str_ptr])
-        func = ir.Function(self.module, func_type, name="vec_str_init_ptr")
-        self.function_decls["vec_str_init_ptr"] = func
-
-        # void vec_str_push(vec_str* vec, char* value)
-        func_type = ir.FunctionType(void, [vec_str_ptr, i8_ptr])
-        func = ir.Function(self.module, func_type, name="vec_str_push")
-        self.function_decls["vec_str_push"] = func
-
-        # char* vec_str_at(vec_str* vec, size_t index)
-        func_type = ir.FunctionType(i8_ptr, [vec_str_ptr, i64])
-        func = ir.Function(self.module, func_type, name="vec_str_at")
-        self.function_decls["vec_str_at"] = func
-
-        # size_t vec_str_size(vec_str* vec)
-        func_type = ir.FunctionType(i64, [vec_str_ptr])
-        func = ir.Function(self.module, func_type, name="vec_str_size")
-        self.function_decls["vec_str_size"] = func
-
-        # void vec_str_free(vec_str* vec)
-        func_type = ir.FunctionType(void, [vec_str_ptr])
-        func = ir.Function(self.module, func_type, name="vec_str_free")
-        self.function_decls["vec_str_free"] = func
-
-        # char** vec_str_data(vec_str* vec)
-        func_type = ir.FunctionType(i8_ptr_ptr, [vec_str_ptr])
-        func = ir.Function(self.module, func_type, name="vec_str_data")
-        self.function_decls["vec_str_data"] = func
-
-        # void vec_str_clear(vec_str* vec)
-        func_type = ir.FunctionType(void, [vec_str_ptr])
-        func = ir.Function(self.module, func_type, name="vec_str_clear")
-        self.function_decls["vec_str_clear"] = func
-
-        # void vec_str_reserve(vec_str* vec, size_t new_capacity)
-        func_type = ir.FunctionType(void, [vec_str_ptr, i64])
-        func = ir.Function(self.module, func_type, name="vec_str_reserve")
-        self.function_decls["vec_str_reserve"] = func
-
-        # void vec_str_set(vec_str* vec, size_t index, char* value)
-        func_type = ir.FunctionType(void, [vec_str_ptr, i64, i8_ptr])
-        func = ir.Function(self.module, func_type, name="vec_str_set")
-        self.function_decls["vec_str_set"] = func
+        self.declare_vec_functions(ir.IntType(8).as_pointer())
 
     def declare_string_functions(self) -> None:
         """Declare string operation C runtime functions in LLVM IR."""
+        self._declare_table(self._string_signatures())
+
+    def _string_signatures(self) -> dict[str, Signature]:
+        """Get the string operation C runtime function signatures.
+
+        Returns:
+            Mapping of function name to (return type, argument types)
+        """
         i8_ptr = ir.IntType(8).as_pointer()  # char*
         i64 = ir.IntType(64)
+        i32 = ir.IntType(32)
         void = ir.VoidType()
-        string_array_type = self.get_string_array_type()
-        string_array_ptr = string_array_type.as_pointer()
-
-        # mgen_string_array_t* mgen_str_split(const char* str, const char* delimiter)
-        func_type = ir.FunctionType(string_array_ptr, [i8_ptr, i8_ptr])
-        func = ir.Function(self.module, func_type, name="mgen_str_split")
-        self.function_decls["mgen_str_split"] = func
-
-        # char* mgen_str_lower(const char* str)
-        func_type = ir.FunctionType(i8_ptr, [i8_ptr])
-        func = ir.Function(self.module, func_type, name="mgen_str_lower")
-        self.function_decls["mgen_str_lower"] = func
-
-        # char* mgen_str_strip(const char* str)
-        func_type = ir.FunctionType(i8_ptr, [i8_ptr])
-        func = ir.Function(self.module, func_type, name="mgen_str_strip")
-        self.function_decls["mgen_str_strip"] = func
-
-        # char* mgen_str_concat(const char* str1, const char* str2)
-        func_type = ir.FunctionType(i8_ptr, [i8_ptr, i8_ptr])
-        func = ir.Function(self.module, func_type, name="mgen_str_concat")
-        self.function_decls["mgen_str_concat"] = func
-
-        # const char* mgen_string_array_get(mgen_string_array_t* arr, size_t index)
-        func_type = ir.FunctionType(i8_ptr, [string_array_ptr, i64])
-        func = ir.Function(self.module, func_type, name="mgen_string_array_get")
-        self.function_decls["mgen_string_array_get"] = func
-
-        # size_t mgen_string_array_size(mgen_string_array_t* arr)
-        func_type = ir.FunctionType(i64, [string_array_ptr])
-        func = ir.Function(self.module, func_type, name="mgen_string_array_size")
-        self.function_decls["mgen_string_array_size"] = func
-
-        # void mgen_string_array_free(mgen_string_array_t* arr)
-        func_type = ir.FunctionType(void, [string_array_ptr])
-        func = ir.Function(self.module, func_type, name="mgen_string_array_free")
-        self.function_decls["mgen_string_array_free"] = func
-
-        # char* mgen_str_join(const char* separator, mgen_string_array_t* strings)
-        func_type = ir.FunctionType(i8_ptr, [i8_ptr, string_array_ptr])
-        func = ir.Function(self.module, func_type, name="mgen_str_join")
-        self.function_decls["mgen_str_join"] = func
-
-        # char* mgen_str_replace(const char* str, const char* old, const char* new_str)
-        func_type = ir.FunctionType(i8_ptr, [i8_ptr, i8_ptr, i8_ptr])
-        func = ir.Function(self.module, func_type, name="mgen_str_replace")
-        self.function_decls["mgen_str_replace"] = func
-
-        # char* mgen_str_upper(const char* str)
-        func_type = ir.FunctionType(i8_ptr, [i8_ptr])
-        func = ir.Function(self.module, func_type, name="mgen_str_upper")
-        self.function_decls["mgen_str_upper"] = func
-
-        # int mgen_str_startswith(const char* str, const char* prefix)
-        func_type = ir.FunctionType(ir.IntType(32), [i8_ptr, i8_ptr])
-        func = ir.Function(self.module, func_type, name="mgen_str_startswith")
-        self.function_decls["mgen_str_startswith"] = func
-
-        # int mgen_str_endswith(const char* str, const char* suffix)
-        func_type = ir.FunctionType(ir.IntType(32), [i8_ptr, i8_ptr])
-        func = ir.Function(self.module, func_type, name="mgen_str_endswith")
-        self.function_decls["mgen_str_endswith"] = func
+        string_array_ptr = self.get_string_array_type().as_pointer()
+
+        return {
+            # mgen_string_array_t* mgen_str_split(const char* str, const char* delimiter)
+            "mgen_str_split": (string_array_ptr, [i8_ptr, i8_ptr]),
+            # char* mgen_str_lower(const char* str)
+            "mgen_str_lower": (i8_ptr, [i8_ptr]),
+            # char* mgen_str_strip(const char* str)
+            "mgen_str_strip": (i8_ptr, [i8_ptr]),
+            # char* mgen_str_concat(const char* str1, const char* str2)
+            "mgen_str_concat": (i8_ptr, [i8_ptr, i8_ptr]),
+            # const char* mgen_string_array_get(mgen_string_array_t* arr, size_t index)
+            "mgen_string_array_get": (i8_ptr, [string_array_ptr, i64]),
+            # size_t mgen_string_array_size(mgen_string_array_t* arr)
+            "mgen_string_array_size": (i64, [string_array_ptr]),
+            # void mgen_string_array_free(mgen_string_array_t* arr)
+            "mgen_string_array_free": (void, [string_array_ptr]),
+            # char* mgen_str_join(const char* separator, mgen_string_array_t* strings)
+            "mgen_str_join": (i8_ptr, [i8_ptr, string_array_ptr]),
+            # char* mgen_str_replace(const char* str, const char* old, const char* new_str)
+            "mgen_str_replace": (i8_ptr, [i8_ptr, i8_ptr, i8_ptr]),
+            # char* mgen_str_upper(const char* str)
+            "mgen_str_upper": (i8_ptr, [i8_ptr]),
+            # int mgen_str_startswith(const char* str, const char* prefix)
+            "mgen_str_startswith": (i32, [i8_ptr, i8_ptr]),
+            # int mgen_str_endswith(const char* str, const char* suffix)
+            "mgen_str_endswith": (i32, [i8_ptr, i8_ptr]),
+        }
 
     def get_map_str_int_type(self) -> ir.Type:
         """Get or create map_str_int struct type.
@@ -435,42 +565,34 @@ class LLVMRuntimeDeclarations:
 
     def declare_map_str_int_functions(self) -> None:
         """Declare map_str_int C runtime functions in LLVM IR."""
-        map_str_int_type = self.get_map_str_int_type()
-        map_str_int_ptr = map_str_int_type.as_pointer()
+        self._declare_table(self._map_str_int_signatures())
+
+    def _map_str_int_signatures(self) -> dict[str, Signature]:
+        """Get the map_str_int C runtime function signatures.
+
+        Returns:
+            Mapping of function name to (return type, argument types)
+        """
+        map_str_int_ptr = self.get_map_str_int_type().as_pointer()
         i8_ptr = ir.IntType(8).as_pointer()  # char*
         i64 = ir.IntType(64)
         i32 = ir.IntType(32)  # for boolean return
         void = ir.VoidType()
 
-        # void map_str_int_init_ptr(map_str_int* out)
-        func_type = ir.FunctionType(void, [map_str_int_ptr])
-        func = ir.Function(self.module, func_type, name="map_str_int_init_ptr")
-        self.function_decls["map_str_int_init_ptr"] = func
-
-        # void map_str_int_set(map_str_int* map, const char* key, long long value)
-        func_type = ir.FunctionType(void, [map_str_int_ptr, i8_ptr, i64])
-        func = ir.Function(self.module, func_type, name="map_str_int_set")
-        self.function_decls["map_str_int_set"] = func
-
-        # long long map_str_int_get(map_str_int* map, const char* key)
-        func_type = ir.FunctionType(i64, [map_str_int_ptr, i8_ptr])
-        func = ir.Function(self.module, func_type, name="map_str_int_get")
-        self.function_decls["map_str_int_get"] = func
-
-        # int map_str_int_contains(map_str_int* map, const char* key)
-        func_type = ir.FunctionType(i32, [map_str_int_ptr, i8_ptr])
-        func = ir.Function(self.module, func_type, name="map_str_int_contains")
-        self.function_decls["map_str_int_contains"] = func
-
-        # size_t map_str_int_size(map_str_int* map)
-        func_type = ir.FunctionType(i64, [map_str_int_ptr])
-        func = ir.Function(self.module, func_type, name="map_str_int_size")
-        self.function_decls["map_str_int_size"] = func
-
-        # void map_str_int_free(map_str_int* map)
-        func_type = ir.FunctionType(void, [map_str_int_ptr])
-        func = ir.Function(self.module, func_type, name="map_str_int_free")
-        self.function_decls["map_str_int_free"] = func
+        return {
+            # void map_str_int_init_ptr(map_str_int* out)
+            "map_str_int_init_ptr": (void, [map_str_int_ptr]),
+            # void map_str_int_set(map_str_int* map, const char* key, long long value)
+            "map_str_int_set": (void, [map_str_int_ptr, i8_ptr, i64]),
+            # long long map_str_int_get(map_str_int* map, const char* key)
+            "map_str_int_get": (i64, [map_str_int_ptr, i8_ptr]),
+            # int map_str_int_contains(map_str_int* map, const char* key)
+            "map_str_int_contains": (i32, [map_str_int_ptr, i8_ptr]),
+            # size_t map_str_int_size(map_str_int* map)
+            "map_str_int_size": (i64, [map_str_int_ptr]),
+            # void map_str_int_free(map_str_int* map)
+            "map_str_int_free": (void, [map_str_int_ptr]),
+        }
 
     def get_map_int_int_type(self) -> ir.Type:
         """Get or create map_int_int struct type.
@@ -511,61 +633,41 @@ class LLVMRuntimeDeclarations:
 
     def declare_map_int_int_functions(self) -> None:
         """Declare map_int_int C runtime functions in LLVM IR."""
-        map_int_int_type = self.get_map_int_int_type()
-        map_int_int_ptr = map_int_int_type.as_pointer()
+        self._declare_table(self._map_int_int_signatures())
+
+    def _map_int_int_signatures(self) -> dict[str, Signature]:
+        """Get the map_int_int C runtime function signatures.
+
+        Returns:
+            Mapping of function name to (return type, argument types)
+        """
+        map_int_int_ptr = self.get_map_int_int_type().as_pointer()
         i64 = ir.IntType(64)
         i32 = ir.IntType(32)  # for boolean return
         void = ir.VoidType()
 
-        # void map_int_int_init_ptr(map_int_int* out)
-        func_type = ir.FunctionType(void, [map_int_int_ptr])
-        func = ir.Function(self.module, func_type, name="map_int_int_init_ptr")
-        self.function_decls["map_int_int_init_ptr"] = func
-
-        # void map_int_int_set(map_int_int* map, long long key, long long value)
-        func_type = ir.FunctionType(void, [map_int_int_ptr, i64, i64])
-        func = ir.Function(self.module, func_type, name="map_int_int_set")
-        self.function_decls["map_int_int_set"] = func
-
-        # long long map_int_int_get(map_int_int* map, long long key)
-        func_type = ir.FunctionType(i64, [map_int_int_ptr, i64])
-        func = ir.Function(self.module, func_type, name="map_int_int_get")
-        self.function_decls["map_int_int_get"] = func
-
-        # int map_int_int_contains(map_int_int* map, long long key)
-        func_type = ir.FunctionType(i32, [map_int_int_ptr, i64])
-        func = ir.Function(self.module, func_type, name="map_int_int_contains")
-        self.function_decls["map_int_int_contains"] = func
-
-        # size_t map_int_int_size(map_int_int* map)
-        func_type = ir.FunctionType(i64, [map_int_int_ptr])
-        func = ir.Function(self.module, func_type, name="map_int_int_size")
-        self.function_decls["map_int_int_size"] = func
-
-        # void map_int_int_free(map_int_int* map)
-        func_type = ir.FunctionType(void, [map_int_int_ptr])
-        func = ir.Function(self.module, func_type, name="map_int_int_free")
-        self.function_decls["map_int_int_free"] = func
-
-        # size_t map_int_int_capacity(map_int_int* map)
-        func_type = ir.FunctionType(i64, [map_int_int_ptr])
-        func = ir.Function(self.module, func_type, name="map_int_int_capacity")
-        self.function_decls["map_int_int_capacity"] = func
-
-        # int map_int_int_entry_is_occupied(map_int_int* map, size_t index)
-        func_type = ir.FunctionType(i32, [map_int_int_ptr, i64])
-        func = ir.Function(self.module, func_type, name="map_int_int_entry_is_occupied")
-        self.function_decls["map_int_int_entry_is_occupied"] = func
-
-        # long long map_int_int_entry_key(map_int_int* map, size_t index)
-        func_type = ir.FunctionType(i64, [map_int_int_ptr, i64])
-        func = ir.Function(self.module, func_type, name="map_int_int_entry_key")
-        self.function_decls["map_int_int_entry_key"] = func
-
-        # long long map_int_int_entry_value(map_int_int* map, size_t index)
-        func_type = ir.FunctionType(i64, [map_int_int_ptr, i64])
-        func = ir.Function(self.module, func_type, name="map_int_int_entry_value")
-        self.function_decls["map_int_int_entry_value"] = func
+        return {
+            # void map_int_int_init_ptr(map_int_int* out)
+            "map_int_int_init_ptr": (void, [map_int_int_ptr]),
+            # void map_int_int_set(map_int_int* map, long long key, long long value)
+            "map_int_int_set": (void, [map_int_int_ptr, i64, i64]),
+            # long long map_int_int_get(map_int_int* map, long long key)
+            "map_int_int_get": (i64, [map_int_int_ptr, i64]),
+            # int map_int_int_contains(map_int_int* map, long long key)
+            "map_int_int_contains": (i32, [map_int_int_ptr, i64]),
+            # size_t map_int_int_size(map_int_int* map)
+            "map_int_int_size": (i64, [map_int_int_ptr]),
+            # void map_int_int_free(map_int_int* map)
+            "map_int_int_free": (void, [map_int_int_ptr]),
+            # size_t map_int_int_capacity(map_int_int* map)
+            "map_int_int_capacity": (i64, [map_int_int_ptr]),
+            # int map_int_int_entry_is_occupied(map_int_int* map, size_t index)
+            "map_int_int_entry_is_occupied": (i32, [map_int_int_ptr, i64]),
+            # long long map_int_int_entry_key(map_int_int* map, size_t index)
+            "map_int_int_entry_key": (i64, [map_int_int_ptr, i64]),
+            # long long map_int_int_entry_value(map_int_int* map, size_t index)
+            "map_int_int_entry_value": (i64, [map_int_int_ptr, i64]),
+        }
 
     def get_set_int_type(self) -> ir.Type:
         """Get or create set_int struct type.
@@ -605,51 +707,46 @@ class LLVMRuntimeDeclarations:
 
     def declare_set_int_functions(self) -> None:
         """Declare set_int C runtime functions in LLVM IR."""
+        self._declare_table(self._set_int_signatures())
+
+    def _set_int_signatures(self) -> dict[str, Signature]:
+        """Get the set_int C runtime function signatures.
+
+        Returns:
+            Mapping of function name to (return type, argument types)
+        """
         set_int_type = self.get_set_int_type()
         set_int_ptr = set_int_type.as_pointer()
         i64 = ir.IntType(64)
-        i32 = ir.IntType(32)  # for boolean return (in C, bool -> int)
         i1 = ir.IntType(1)  # for bool return
         void = ir.VoidType()
 
-        # set_int set_int_init(void)
-        func_type = ir.FunctionType(set_int_type, [])
-        func = ir.Function(self.module, func_type, name="set_int_init")
-        self.function_decls["set_int_init"] = func
-
-        # void set_int_init_ptr(set_int* out) - initialize via pointer
-        func_type = ir.FunctionType(void, [set_int_ptr])
-        func = ir.Function(self.module, func_type, name="set_int_init_ptr")
-        self.function_decls["set_int_init_ptr"] = func
-
-        # bool set_int_insert(set_int* set, int value)
-        func_type = ir.FunctionType(i1, [set_int_ptr, i64])
-        func = ir.Function(self.module, func_type, name="set_int_insert")
-        self.function_decls["set_int_insert"] = func
-
-        # bool set_int_contains(const set_int* set, int value)
-        func_type = ir.FunctionType(i1, [set_int_ptr, i64])
-        func = ir.Function(self.module, func_type, name="set_int_contains")
-        self.function_decls["set_int_contains"] = func
-
-        # size_t set_int_size(const set_int* set)
-        func_type = ir.FunctionType(i64, [set_int_ptr])
-        func = ir.Function(self.module, func_type, name="set_int_size")
-        self.function_decls["set_int_size"] = func
-
-        # long long set_int_get_nth_element(const set_int* set, size_t n)
-        func_type = ir.FunctionType(i64, [set_int_ptr, i64])
-        func = ir.Function(self.module, func_type, name="set_int_get_nth_element")
-        self.function_decls["set_int_get_nth_element"] = func
-
-        # void set_int_drop(set_int* set)
-        func_type = ir.FunctionType(void, [set_int_ptr])
-        func = ir.Function(self.module, func_type, name="set_int_drop")
-        self.function_decls["set_int_drop"] = func
+        return {
+            # set_int set_int_init(void)
+            "set_int_init": (set_int_type, []),
+            # void set_int_init_ptr(set_int* out) - initialize via pointer
+            "set_int_init_ptr": (void, [set_int_ptr]),
+            # bool set_int_insert(set_int* set, int value)
+            "set_int_insert": (i1, [set_int_ptr, i64]),
+            # bool set_int_contains(const set_int* set, int value)
+            "set_int_contains": (i1, [set_int_ptr, i64]),
+            # size_t set_int_size(const set_int* set)
+            "set_int_size": (i64, [set_int_ptr]),
+            # long long set_int_get_nth_element(const set_int* set, size_t n)
+            "set_int_get_nth_element": (i64, [set_int_ptr, i64]),
+            # void set_int_drop(set_int* set)
+            "set_int_drop": (void, [set_int_ptr]),
+        }
 
     def declare_all(self) -> None:
-        """Declare all runtime library functions and types."""
+        """Declare all runtime library functions and types.
+
+        Not needed for code generation, which declares functions on first use via
+        get_function(); useful when a module must expose the complete runtime interface.
+        """
         self.declare_vec_int_functions()
+        self.declare_vec_functions(ir.DoubleType())
+        self.declare_vec_functions(ir.IntType(1))
         self.declare_vec_vec_int_functions()
         self.declare_vec_str_functions()
         self.declare_map_str_int_functions()
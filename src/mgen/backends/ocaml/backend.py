@@ -39,7 +39,7 @@ class OCamlBackend(LanguageBackend):
 
     def get_builder(self) -> AbstractBuilder:
         """Get OCaml build system."""
-        return OCamlBuilder()
+        return OCamlBuilder(self.preferences)
 
     def get_container_system(self) -> AbstractContainerSystem:
         """Get OCaml container system."""
@@ -47,7 +47,7 @@ class OCamlBackend(LanguageBackend):
 
     def get_build_system(self) -> str:
         """Get the build system used by OCaml."""
-        return "dune / ocamlc"
+        return "dune / ocamlopt"
 
     def get_description(self) -> str:
         """Get a description of the OCaml backend."""
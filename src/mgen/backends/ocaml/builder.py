@@ -1,12 +1,133 @@
 """OCaml builder for compiling generated OCaml code."""
 
+import asyncio
+import functools
+import logging
+import os
+import shutil
 import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Optional
 
 from ..base import AbstractBuilder
 from ..preferences import BackendPreferences, OCamlPreferences
 
+logger = logging.getLogger(__name__)
+
+# ocamlopt names executables with .exe on Windows
+_EXE_SUFFIX = ".exe" if sys.platform == "win32" else ""
+
+# Packaged runtime sources, resolved once so builds never re-walk symlinks
+_RUNTIME_DIR: Path = Path(__file__).resolve().parent / "runtime"
+
+# Compiler command the staged runtime unit was last built with
+_RUNTIME_STAMP = "mgen_runtime.flags"
+
+# ocamlopt flags for each "optimization" preference. The -O levels are only
+# understood by flambda compilers; -compact works with any native compiler.
+_OPTIMIZATION_FLAGS = {
+    "classic": ["-Oclassic"],
+    "o2": ["-O2"],
+    "o3": ["-O3", "-unbox-closures"],
+    "compact": ["-compact"],
+}
+_FLAMBDA_OPTIMIZATIONS = frozenset({"classic", "o2", "o3"})
+
+_DUNE_PROJECT_TEMPLATE = """(lang dune 3.0)
+
+(package
+ (name {name})
+ (depends ocaml dune))
+"""
+
+_DUNE_TEMPLATE = """(executable
+ (public_name {name})
+ (name {name})
+ (modules mgen_runtime {modules}){flags})
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _runtime_manifest() -> dict[str, bytes]:
+    """Read the OCaml runtime sources shipped with the package.
+
+    The runtime never changes while mgen runs, so it is read once per process.
+
+    Returns:
+        Mapping of runtime file name to its contents
+    """
+    if not _RUNTIME_DIR.exists():
+        return {}
+
+    with os.scandir(_RUNTIME_DIR) as entries:
+        return {entry.name: Path(entry.path).read_bytes() for entry in entries if entry.name.endswith(".ml")}
+
+
+# One lock per output directory, so concurrent builds into it stage and compile
+# the shared runtime one at a time
+_RUNTIME_LOCKS: dict[Path, threading.Lock] = {}
+_RUNTIME_LOCKS_GUARD = threading.Lock()
+
+
+def _runtime_lock(base_path: Path) -> threading.Lock:
+    """Get the lock guarding the runtime staged in a directory.
+
+    Args:
+        base_path: Directory the runtime is staged in
+
+    Returns:
+        Lock shared by every build targeting that directory
+    """
+    key = base_path.resolve()
+    with _RUNTIME_LOCKS_GUARD:
+        lock = _RUNTIME_LOCKS.get(key)
+        if lock is None:
+            lock = _RUNTIME_LOCKS[key] = threading.Lock()
+        return lock
+
+
+def _log_compiler_error(stderr: bytes) -> None:
+    """Log the output of a failed compiler run.
+
+    The captured bytes are only decoded here, on the failure path.
+
+    Args:
+        stderr: Raw stderr of the compiler process
+    """
+    if stderr:
+        logger.error("OCaml compilation error: %s", stderr.decode(errors="replace"))
+
+
+# Infix of directories renamed aside by _remove_tree_in_background
+_TRASH_INFIX = ".trash."
+
+
+def _remove_tree_in_background(path: str, rename: bool = True) -> None:
+    """Remove a directory tree without waiting for the walk to finish.
+
+    The tree is first renamed aside (one syscall), so its original name is free
+    immediately, and then deleted on a daemon thread. A tree still being deleted
+    when the interpreter exits is left behind under its trash name; the next
+    ``clean()`` of that directory removes it.
+
+    Args:
+        path: Directory to remove
+        rename: Whether to rename the tree aside first (False for leftover trash)
+    """
+    trash_path = f"{path}{_TRASH_INFIX}{os.getpid()}.{threading.get_ident()}" if rename else path
+    if rename:
+        try:
+            os.rename(path, trash_path)
+        except OSError:
+            # Renaming failed (e.g. a stale trash dir is in the way) - delete in place
+            shutil.rmtree(path, ignore_errors=True)
+            return
+
+    threading.Thread(target=shutil.rmtree, args=(trash_path,), kwargs={"ignore_errors": True}, daemon=True).start()
+
 
 class OCamlBuilder(AbstractBuilder):
     """Builder for OCaml code compilation and execution."""
@@ -33,132 +154,351 @@ class OCamlBuilder(AbstractBuilder):
         except Exception:
             return False
 
-    def _compile_direct(self, output_file: str) -> bool:
-        """Compile OCaml code directly using ocamlc via opam."""
-        base_path = Path(output_file).parent
-        runtime_path = base_path / "mgen_runtime.ml"
+    @staticmethod
+    def _split(output_file: str) -> tuple[Path, str, Path]:
+        """Split a source path into its directory, stem and executable path.
 
-        # Copy runtime file if it doesn't exist
-        if not runtime_path.exists():
-            self._copy_runtime_files(base_path)
+        Args:
+            output_file: The OCaml source file
 
-        # Compile with OCaml compiler via opam
-        executable = output_file.replace(".ml", "")
-        cmd = ["opam", "exec", "--", "ocamlc", "-o", executable, str(runtime_path), output_file]
+        Returns:
+            Tuple of (source directory, module stem, executable path)
+        """
+        path = Path(output_file)
+        parent = path.parent
+        return parent, path.stem, parent / f"{path.stem}{_EXE_SUFFIX}"
+
+    def _get_compiler_command(self) -> list[str]:
+        """Get the opam-wrapped compiler invocation including optimization flags.
+
+        Native compilation (ocamlopt) is used unless the ``native`` preference is
+        disabled, in which case bytecode is produced with ocamlc.
+
+        Returns:
+            Command prefix to which output and source arguments are appended
+        """
+        native = self.preferences.get("native", True)
+        return ["opam", "exec", "--", "ocamlopt" if native else "ocamlc", *self._get_native_flags()]
+
+    def _get_native_flags(self) -> list[str]:
+        """Get the ocamlopt flags selected by the build preferences.
+
+        The ``release``, ``optimization`` and ``inline_threshold`` preferences
+        select the flags. They are empty for bytecode builds.
+
+        Returns:
+            List of ocamlopt flags
+        """
+        if not self.preferences.get("native", True):
+            return []
+
+        flags = []
+        release = self.preferences.get("release", False)
+        if release:
+            flags.append("-unsafe")
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        # "auto" keeps the release default: -O3 when the compiler has flambda
+        optimization = self.preferences.get("optimization", "auto")
+        if optimization == "auto":
+            optimization = "o3" if release else ""
+        if optimization in _FLAMBDA_OPTIMIZATIONS and not self.preferences.get("flambda", False):
+            optimization = ""
+        flags.extend(_OPTIMIZATION_FLAGS.get(optimization, []))
+
+        inline_threshold = self.preferences.get("inline_threshold")
+        if inline_threshold is not None:
+            flags.extend(["-inline", str(inline_threshold)])
+
+        return flags
+
+    def _get_dune_flags_stanza(self) -> str:
+        """Get the dune ``ocamlopt_flags`` field matching direct native builds.
+
+        Returns:
+            Stanza text to append inside the executable stanza (empty if no flags)
+        """
+        flags = self._get_native_flags()
+        if not flags:
+            return ""
+        return f"\n (ocamlopt_flags (:standard {' '.join(flags)}))"
+
+    def _compile_direct(self, output_file: str) -> bool:
+        """Compile OCaml code directly using ocamlopt (or ocamlc) via opam."""
+        cmd = self._prepare_direct_compile(output_file)
+
+        # Discard stdout and keep stderr as raw bytes - it is only read on failure
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=False)
 
         if result.returncode == 0:
             return True
         else:
+            _log_compiler_error(result.stderr)
             return False
 
+    async def build_async(self, output_file: str) -> bool:
+        """Build the OCaml code without blocking the event loop.
+
+        Runtime staging runs in a worker thread and the compiler as an asyncio
+        subprocess, so callers can overlap several builds with ``asyncio.gather``.
+
+        Args:
+            output_file: The OCaml source file to compile
+
+        Returns:
+            True if build succeeded, False otherwise
+        """
+        try:
+            cmd = await asyncio.to_thread(self._prepare_direct_compile, output_file)
+
+            process = await asyncio.create_subprocess_exec(
+                *cmd, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE
+            )
+            _, stderr = await process.communicate()
+
+            if process.returncode != 0:
+                _log_compiler_error(stderr)
+                return False
+            return True
+        except Exception:
+            return False
+
+    def build_many(self, source_files: list[str], target: str) -> bool:
+        """Compile several OCaml modules in parallel and link them into one executable.
+
+        Each module is compiled with ``-c`` on its own worker and only the final
+        link runs serially. Modules may depend on the runtime but not on each
+        other, since they are compiled concurrently.
+
+        Args:
+            source_files: OCaml source files, in link order
+            target: Path of the executable to produce
+
+        Returns:
+            True if every module compiled and the link succeeded, False otherwise
+        """
+        if not source_files:
+            return False
+
+        try:
+            sources = [Path(source_file) for source_file in source_files]
+            base_path = sources[0].parent
+
+            runtime_unit = self._stage_runtime(base_path)
+            if runtime_unit.suffix == ".ml":
+                return False
+
+            compiler = [*self._get_compiler_command(), "-I", str(base_path)]
+
+            def compile_unit(source: Path) -> subprocess.CompletedProcess[bytes]:
+                return subprocess.run(
+                    [*compiler, "-c", str(source)], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=False
+                )
+
+            # The work happens in the compiler processes, so threads are enough to fan out
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                results = list(executor.map(compile_unit, sources))
+
+            for result in results:
+                if result.returncode != 0:
+                    _log_compiler_error(result.stderr)
+                    return False
+
+            units = [str(source.with_suffix(runtime_unit.suffix)) for source in sources]
+            link = subprocess.run(
+                [*compiler, "-o", target, str(runtime_unit), *units],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                check=False,
+            )
+            if link.returncode != 0:
+                _log_compiler_error(link.stderr)
+                return False
+            return True
+        except Exception:
+            return False
+
+    def _prepare_direct_compile(self, output_file: str) -> list[str]:
+        """Stage runtime files next to the source and build the compile command.
+
+        Args:
+            output_file: The OCaml source file to compile
+
+        Returns:
+            Compiler command producing an executable next to the source
+        """
+        base_path, _, executable_path = self._split(output_file)
+
+        # Link against the compiled runtime so only the user module is rebuilt
+        runtime_unit = self._stage_runtime(base_path)
+
+        # Compile with OCaml compiler via opam (strip only the final .ml suffix)
+        executable = str(executable_path)
+        return [
+            *self._get_compiler_command(),
+            "-I", str(base_path),
+            "-o", executable,
+            str(runtime_unit),
+            output_file,
+        ]
+
+    def _stage_runtime(self, base_path: Path) -> Path:
+        """Copy the runtime next to the sources (if missing) and compile it.
+
+        Both steps run under the directory's runtime lock, so a concurrent build
+        never links a half-written runtime source or object.
+
+        Args:
+            base_path: Directory holding the sources being built
+
+        Returns:
+            Path of the compiled runtime unit, or of the source if compilation failed
+        """
+        with _runtime_lock(base_path):
+            if not (base_path / "mgen_runtime.ml").exists():
+                self._copy_runtime_files(base_path)
+            return self._ensure_runtime_compiled(base_path)
+
+    def _ensure_runtime_compiled(self, base_path: Path) -> Path:
+        """Compile the staged runtime once and reuse the object on later builds.
+
+        The runtime is recompiled when its ``.cmx`` (or ``.cmo`` for bytecode) is
+        missing, older than ``mgen_runtime.ml``, or was built with a different
+        compiler command than the one recorded in ``mgen_runtime.flags``.
+
+        Args:
+            base_path: Directory holding ``mgen_runtime.ml``
+
+        Returns:
+            Path of the compiled runtime unit, or of the source if compilation failed
+        """
+        runtime_source = base_path / "mgen_runtime.ml"
+        runtime_unit = runtime_source.with_suffix(".cmx" if self.preferences.get("native", True) else ".cmo")
+        runtime_stamp = base_path / _RUNTIME_STAMP
+        compiler = self._get_compiler_command()
+        stamp = "\n".join(compiler)
+
+        try:
+            if (
+                runtime_unit.stat().st_mtime >= runtime_source.stat().st_mtime
+                and runtime_stamp.read_text(encoding="utf-8") == stamp
+            ):
+                return runtime_unit
+        except OSError:
+            pass
+
+        try:
+            result = subprocess.run(
+                [*compiler, "-c", str(runtime_source)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                check=False,
+            )
+        except OSError:
+            return runtime_source
+
+        if result.returncode != 0:
+            # Fall back to compiling the runtime source as part of the link step
+            return runtime_source
+        runtime_stamp.write_text(stamp, encoding="utf-8")
+        return runtime_unit
+
     def _generate_dune_project(self, output_file: str) -> bool:
         """Generate a dune-project file for the OCaml project."""
-        base_path = Path(output_file).parent
-        project_name = Path(output_file).stem
+        base_path, project_name, _ = self._split(output_file)
 
-        # Copy runtime files
-        self._copy_runtime_files(base_path)
+        # Copy runtime files unless an earlier build already staged them
+        with _runtime_lock(base_path):
+            if not (base_path / "mgen_runtime.ml").exists():
+                self._copy_runtime_files(base_path)
 
         # Generate dune-project
-        dune_project_content = f"""(lang dune 3.0)
-
-(package
- (name {project_name})
- (depends ocaml dune))
-"""
-
-        dune_project_path = base_path / "dune-project"
-        with open(dune_project_path, "w") as f:
-            f.write(dune_project_content)
+        (base_path / "dune-project").write_text(_DUNE_PROJECT_TEMPLATE.format(name=project_name), encoding="utf-8")
 
         # Generate dune file
-        dune_content = f"""(executable
- (public_name {project_name})
- (name {project_name})
- (modules mgen_runtime {project_name}))
-"""
-
-        dune_file_path = base_path / "dune"
-        with open(dune_file_path, "w") as f:
-            f.write(dune_content)
+        dune = _DUNE_TEMPLATE.format(name=project_name, modules=project_name, flags=self._get_dune_flags_stanza())
+        (base_path / "dune").write_text(dune, encoding="utf-8")
 
         return True
 
     def _copy_runtime_files(self, target_dir: Path) -> None:
-        """Copy OCaml runtime files to the target directory."""
-        import shutil
+        """Copy OCaml runtime files to the target directory.
 
-        # Get the path to the runtime directory
-        current_dir = Path(__file__).parent
-        runtime_dir = current_dir / "runtime"
+        Files are written from the in-memory runtime manifest, so each copy is a
+        single write with no read of the packaged source and no metadata copy
+        (mtimes are irrelevant to the OCaml build).
 
-        if runtime_dir.exists():
-            # Copy all .ml files from runtime directory
-            for runtime_file in runtime_dir.glob("*.ml"):
-                target_file = target_dir / runtime_file.name
-                if not target_file.exists():
-                    shutil.copy2(runtime_file, target_file)
+        Args:
+            target_dir: Directory to stage the runtime in
+        """
+        # One listing of the target instead of an exists() check per file
+        existing = set(os.listdir(target_dir))
+
+        # Write all missing runtime files (contents only - timestamps don't matter)
+        for name, data in _runtime_manifest().items():
+            if name not in existing:
+                (target_dir / name).write_bytes(data)
 
     def get_build_command(self, output_file: str) -> list[str]:
         """Get the command to build the OCaml file."""
-        base_name = Path(output_file).stem
-        return ["opam", "exec", "--", "ocamlc", "-o", base_name, "mgen_runtime.ml", output_file]
+        _, base_name, _ = self._split(output_file)
+        return [*self._get_compiler_command(), "-o", f"{base_name}{_EXE_SUFFIX}", "mgen_runtime.ml", output_file]
 
     def get_run_command(self, output_file: str) -> list[str]:
         """Get the command to run the compiled OCaml executable."""
-        executable = Path(output_file).stem
-        return [f"./{executable}"]
+        _, base_name, _ = self._split(output_file)
+        return [f"./{base_name}{_EXE_SUFFIX}"]
 
     def clean(self, output_file: str) -> bool:
         """Clean build artifacts."""
-        base_path = Path(output_file).parent
-        base_name = Path(output_file).stem
+        base_path, base_name, _ = self._split(output_file)
 
         # Remove common OCaml build artifacts
-        artifacts = [
-            base_name,  # executable
-            f"{base_name}.cmi",  # compiled interface
-            f"{base_name}.cmo",  # compiled object
-            "mgen_runtime.cmi",
-            "mgen_runtime.cmo",
-            "_build",  # dune build directory
-            "dune-project",
-            "dune",
-        ]
-
-        removed_count = 0
-        for artifact in artifacts:
-            artifact_path = base_path / artifact
-            try:
-                if artifact_path.is_file():
-                    artifact_path.unlink()
-                    removed_count += 1
-                elif artifact_path.is_dir():
-                    import shutil
-
-                    shutil.rmtree(artifact_path)
-                    removed_count += 1
-            except Exception:
-                continue
+        targets = frozenset(
+            {
+                f"{base_name}{_EXE_SUFFIX}",  # executable
+                f"{base_name}.cmi",  # compiled interface
+                f"{base_name}.cmo",  # compiled object (bytecode)
+                f"{base_name}.cmx",  # compiled object (native)
+                f"{base_name}.o",  # native object file
+                "mgen_runtime.cmi",
+                "mgen_runtime.cmo",
+                "mgen_runtime.cmx",
+                _RUNTIME_STAMP,
+                "mgen_runtime.o",
+                "_build",  # dune build directory
+                "dune-project",
+                "dune",
+            }
+        )
+
+        # One directory scan instead of a stat per candidate artifact
+        try:
+            with os.scandir(base_path) as entries:
+                for entry in entries:
+                    # Trees left half-deleted by an earlier clean() keep their original name as a prefix
+                    name, trash, _ = entry.name.partition(_TRASH_INFIX)
+                    if name not in targets:
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            _remove_tree_in_background(entry.path, rename=not trash)
+                        elif not trash:
+                            os.unlink(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
 
         return True
 
     def generate_build_file(self, source_files: list[str], target_name: str) -> str:
         """Generate dune-project build configuration."""
-        dune_project_content = f"""(lang dune 3.0)
-
-(package
- (name {target_name})
- (depends ocaml dune))
-"""
-
-        dune_content = f"""(executable
- (public_name {target_name})
- (name {target_name})
- (modules mgen_runtime {" ".join(Path(f).stem for f in source_files)}))
-"""
+        dune_project_content = _DUNE_PROJECT_TEMPLATE.format(name=target_name)
+        dune_content = _DUNE_TEMPLATE.format(
+            name=target_name,
+            modules=" ".join(os.path.splitext(os.path.basename(f))[0] for f in source_files),
+            flags=self._get_dune_flags_stanza(),
+        )
 
         return dune_project_content + "\n" + dune_content
 
@@ -167,37 +507,33 @@ class OCamlBuilder(AbstractBuilder):
         return "dune-project"
 
     def compile_direct(self, source_file: str, output_dir: str, **kwargs: Any) -> bool:
-        """Compile OCaml source directly using ocamlc via opam."""
+        """Compile OCaml source directly using ocamlopt (or ocamlc) via opam."""
         source_path = Path(source_file).absolute()
         out_dir = Path(output_dir).absolute()
-        executable_name = source_path.stem
+        executable_name = f"{source_path.stem}{_EXE_SUFFIX}"
 
         # Determine source directory (where .ml files are)
         source_dir = source_path.parent
 
-        # Copy runtime file to source directory (OCaml looks for modules there)
-        runtime_path = source_dir / "mgen_runtime.ml"
-        if not runtime_path.exists():
-            self._copy_runtime_files(source_dir)
+        # Stage the runtime in the source directory (OCaml looks for modules there)
+        runtime_unit = self._stage_runtime(source_dir)
 
         # Compile with OCaml compiler via opam
         # Use absolute paths for all files and include source directory for module resolution
         executable = out_dir / executable_name
         cmd = [
-            "opam", "exec", "--", "ocamlc",
+            *self._get_compiler_command(),
             "-I", str(source_dir),  # Add include path for module resolution
             "-o", str(executable),
-            str(runtime_path),
+            str(runtime_unit),
             str(source_path)
         ]
 
         # Run compilation (don't set cwd to avoid path issues)
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=False)
 
         if result.returncode != 0:
-            # Print error for debugging
-            if result.stderr:
-                print(f"OCaml compilation error: {result.stderr}")
+            _log_compiler_error(result.stderr)
             return False
 
         return True
@@ -1,7 +1,9 @@
 """Enhanced OCaml code emitter for MGen with comprehensive Python language support."""
 
 import ast
-from typing import TYPE_CHECKING, Any, Optional, Union
+import functools
+import io
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Optional, Union
 
 from ..converter_utils import (
     get_standard_binary_operator,
@@ -15,6 +17,347 @@ if TYPE_CHECKING:
     from ..loop_conversion_strategies import ForLoopConverter
 
 
+# Escapes backslashes and double quotes in a single pass
+_OCAML_STRING_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
+
+def _quote_ocaml_string(value: str) -> str:
+    """Quote a Python string as an OCaml string literal, escaping quotes and backslashes."""
+    return '"' + value.translate(_OCAML_STRING_ESCAPES) + '"'
+
+
+# Exact constant type -> OCaml literal formatter
+_CONSTANT_HANDLERS: dict[type, Callable[[Any], str]] = {
+    bool: lambda value: "true" if value else "false",
+    int: str,
+    float: str,
+    str: _quote_ocaml_string,
+    type(None): lambda value: "()",
+}
+
+
+# OCaml-specific operators, keyed by AST operator class; others use converter_utils
+_BINOP_MAP: dict[type, str] = {
+    ast.FloorDiv: "/",  # OCaml doesn't have floor division
+    ast.Mod: "mod",
+    ast.Pow: "**",
+    ast.BitOr: "lor",
+    ast.BitXor: "lxor",
+    ast.BitAnd: "land",
+    ast.LShift: "lsl",
+    ast.RShift: "lsr",
+}
+
+
+# Unary operator class -> prefix placed before the operand
+_UNOP_MAP: dict[type, str] = {
+    ast.UAdd: "+",
+    ast.USub: "-",
+    ast.Not: "not ",
+    ast.Invert: "lnot ",
+}
+
+
+_CMP_MAP: dict[type, str] = {
+    ast.NotEq: "<>",  # OCaml uses <> instead of !=
+}
+
+
+def _string_find(converter: "MGenPythonToOCamlConverter", obj_name: str, args: list[ast.expr]) -> str:
+    """Convert str.find()."""
+    if not args:
+        raise UnsupportedFeatureError("find() requires an argument")
+    return f"find {obj_name} {converter._convert_expression(args[0])}"
+
+
+def _string_replace(converter: "MGenPythonToOCamlConverter", obj_name: str, args: list[ast.expr]) -> str:
+    """Convert str.replace()."""
+    if len(args) < 2:
+        raise UnsupportedFeatureError("replace() requires two arguments")
+    old_str = converter._convert_expression(args[0])
+    new_str = converter._convert_expression(args[1])
+    return f"replace {obj_name} {old_str} {new_str}"
+
+
+def _string_split(converter: "MGenPythonToOCamlConverter", obj_name: str, args: list[ast.expr]) -> str:
+    """Convert str.split(), defaulting to a space delimiter."""
+    if not args:
+        return f'split {obj_name} " "'
+    return f"split {obj_name} {converter._convert_expression(args[0])}"
+
+
+# String method name -> converter(converter, OCaml object expression, call args)
+_STRING_METHOD_HANDLERS: dict[str, Callable[["MGenPythonToOCamlConverter", str, list[ast.expr]], str]] = {
+    "upper": lambda converter, obj_name, args: f"upper {obj_name}",
+    "lower": lambda converter, obj_name, args: f"lower {obj_name}",
+    "strip": lambda converter, obj_name, args: f"strip {obj_name}",
+    "find": _string_find,
+    "replace": _string_replace,
+    "split": _string_split,
+}
+
+
+def _self_attr_name(target: ast.AST) -> Optional[str]:
+    """Get the attribute name of a ``self.<attr>`` assignment target, or None for any other target."""
+    if isinstance(target, ast.Attribute) and isinstance(target.value, ast.Name) and target.value.id == "self":
+        return target.attr
+    return None
+
+
+def _is_docstring(stmt: ast.AST) -> bool:
+    """Check whether a statement is a bare string expression (docstring)."""
+    return (
+        type(stmt) is ast.Expr
+        and type(stmt.value) is ast.Constant
+        and type(stmt.value.value) is str
+    )
+
+
+# Subtrees skipped when looking for a recursive call. Nested function and class
+# bodies are still searched: a nested helper may call the enclosing function.
+_SELF_CALL_SKIPPED_NODES = frozenset({ast.arguments, ast.arg, ast.Import, ast.ImportFrom})
+
+
+# range() call template indexed by argument count - 1
+_RANGE_TEMPLATES = (
+    "range_list (range {})",
+    "range_list (range2 {} {})",
+    "range_list (range3 {} {} {})",
+)
+
+
+# Tracked variable type -> function turning it into a string for print (None: already a string)
+_PRINT_CONVERSIONS: dict[Optional[str], Optional[str]] = {
+    "string": None,
+    "str": None,
+    "float": "string_of_float",
+    "bool": "Conversions.string_of_bool",
+}
+
+
+# Builtins lowered by _convert_builtin_call
+_BUILTIN_CALLS: frozenset[str] = frozenset({"abs", "bool", "len", "min", "max", "sum"})
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_cached(python_code: str) -> ast.Module:
+    """Parse Python source, reusing the tree for repeated conversions of the same code.
+
+    Sharing trees is safe because the converter never mutates the AST; per-node
+    conversion state lives in converter-side caches cleared for each module.
+    """
+    return ast.parse(python_code)
+
+
+# Reserved OCaml words; identifiers that collide get a trailing underscore
+_OCAML_KEYWORDS: frozenset[str] = frozenset(
+    {
+        "and",
+        "as",
+        "assert",
+        "begin",
+        "class",
+        "constraint",
+        "do",
+        "done",
+        "downto",
+        "else",
+        "end",
+        "exception",
+        "external",
+        "false",
+        "for",
+        "fun",
+        "function",
+        "functor",
+        "if",
+        "in",
+        "include",
+        "inherit",
+        "initializer",
+        "lazy",
+        "let",
+        "match",
+        "method",
+        "module",
+        "mutable",
+        "new",
+        "object",
+        "of",
+        "open",
+        "or",
+        "private",
+        "rec",
+        "sig",
+        "struct",
+        "then",
+        "to",
+        "true",
+        "try",
+        "type",
+        "val",
+        "virtual",
+        "when",
+        "while",
+        "with",
+    }
+)
+
+
+# Exact constant type -> inferred OCaml type
+_CONSTANT_TYPES: dict[type, str] = {
+    bool: "bool",
+    int: "int",
+    float: "float",
+    str: "string",
+    type(None): "unit",
+}
+
+
+# Container literal node class -> inferred OCaml type
+_LITERAL_NODE_TYPES: dict[type, str] = {
+    ast.List: "'a list",
+    ast.Dict: "(string * 'a) list",
+}
+
+
+# OCaml type -> default initial value for fields declared without one
+_DEFAULT_VALUES: dict[str, str] = {
+    "int": "0",
+    "float": "0.0",
+    "bool": "false",
+    "string": '""',
+    "unit": "()",
+    "'a list": "[]",
+    "(string * 'a) list": "[]",
+}
+
+
+def _is_dict_type(var_type: str) -> bool:
+    """Check whether a tracked variable type denotes a dict.
+
+    Bare ``dict`` annotations are tracked by name; ``dict[K, V]`` lowers to
+    the association list ``(K * V) list`` for any key type.
+    """
+    return "dict" in var_type or " * " in var_type
+
+
+def _sequence_statements(stmts: list[str]) -> str:
+    """Properly sequence OCaml statements with semicolons where needed."""
+    if not stmts:
+        return "()"
+    if len(stmts) == 1:
+        # Single statement - if it ends with 'in', add ()
+        if stmts[0].rstrip().endswith(" in"):
+            return stmts[0] + "\n    ()"
+        return stmts[0]
+
+    # Add semicolons between statements that don't end with 'in'
+    result = []
+    last = len(stmts) - 1
+    for i, stmt in enumerate(stmts):
+        ends_with_in = stmt.rstrip().endswith(" in")
+        if i < last:  # Not the last statement
+            # If this statement doesn't end with 'in', add semicolon
+            result.append(stmt if ends_with_in else stmt + ";")
+        else:
+            # Last statement - if it ends with 'in', add ()
+            result.append(stmt)
+            if ends_with_in:
+                result.append("()")
+
+    return "(\n    " + "\n    ".join(result) + "\n  )"
+
+
+def _has_self_call(node: ast.AST, name: str) -> bool:
+    """Check whether a function body contains a direct call to ``name``.
+
+    Walks the tree with an explicit stack and returns on the first match. Only the
+    function body is searched, including nested function and class bodies; parameters,
+    decorators and annotation subtrees are skipped.
+
+    Args:
+        node: Function definition to search
+        name: Function name to look for
+
+    Returns:
+        True if a call to ``name`` was found
+    """
+    body = getattr(node, "body", None)
+    stack: list[ast.AST] = list(body) if isinstance(body, list) else list(ast.iter_child_nodes(node))
+    while stack:
+        child = stack.pop()
+        if type(child) is ast.Call:
+            func = child.func
+            if type(func) is ast.Name and func.id == name:
+                return True
+        elif type(child) in _SELF_CALL_SKIPPED_NODES:
+            continue
+        elif type(child) is ast.AnnAssign:
+            # Only the target and value can contain calls that run
+            stack.append(child.target)
+            if child.value is not None:
+                stack.append(child.value)
+            continue
+        stack.extend(ast.iter_child_nodes(child))
+    return False
+
+
+# Node classes a pure-numeric function body may contain (operator nodes are checked separately)
+_PURE_NUMERIC_NODES = frozenset(
+    {ast.Return, ast.If, ast.IfExp, ast.BinOp, ast.UnaryOp, ast.Compare, ast.Name, ast.Constant, ast.Load}
+)
+
+
+# Annotations that mark a numeric parameter or result
+_NUMERIC_PARAM_TYPES = frozenset({"int", "float"})
+_NUMERIC_RESULT_TYPES = frozenset({"int", "float", "bool"})
+
+
+def _is_pure_numeric(node: ast.FunctionDef, body: list[ast.stmt]) -> bool:
+    """Check whether a function only computes on its int/float parameters.
+
+    Such functions take annotated ``int``/``float`` parameters, return an
+    ``int``/``float``/``bool``, and have a body built solely from returns, ifs,
+    arithmetic, comparisons, numeric constants and parameter references. They make
+    no calls, so they are never recursive and are safe to mark for inlining.
+
+    Args:
+        node: Function definition to inspect
+        body: Function body with docstrings removed
+
+    Returns:
+        True if the function is pure numeric
+    """
+    args = node.args
+    if not args.args or args.vararg or args.kwarg or args.kwonlyargs:
+        return False
+    returns = node.returns
+    if type(returns) is not ast.Name or returns.id not in _NUMERIC_RESULT_TYPES:
+        return False
+    params = set()
+    for arg in args.args:
+        annotation = arg.annotation
+        if type(annotation) is not ast.Name or annotation.id not in _NUMERIC_PARAM_TYPES:
+            return False
+        params.add(arg.arg)
+
+    stack: list[ast.AST] = list(body)
+    while stack:
+        child = stack.pop()
+        if type(child) not in _PURE_NUMERIC_NODES:
+            if not isinstance(child, (ast.operator, ast.unaryop, ast.cmpop)):
+                return False
+        elif type(child) is ast.Name:
+            if child.id not in params:
+                return False
+        elif type(child) is ast.Constant:
+            if type(child.value) not in (int, float, bool):
+                return False
+        stack.extend(ast.iter_child_nodes(child))
+    return True
+
+
 class MGenPythonToOCamlConverter:
     """Sophisticated Python-to-OCaml converter with comprehensive language support."""
 
@@ -40,81 +383,73 @@ class MGenPythonToOCamlConverter:
         self.current_class: Optional[str] = None
         self.mutable_vars: set[str] = set()  # Variables that need to be refs
 
+        # Identifier normalization caches (names repeat heavily within a module)
+        self._var_name_cache: dict[str, str] = {}
+        self._type_name_cache: dict[str, str] = {}
+        self._annotation_cache: dict[int, str] = {}
+        self._init_fields_cache: dict[int, list[tuple[str, str, str]]] = {}
+
         # Lazy-initialized loop converter
         self._loop_converter: Optional[ForLoopConverter] = None
 
     def convert_code(self, python_code: str) -> str:
         """Convert Python source code to OCaml."""
         try:
-            tree = ast.parse(python_code)
+            tree = _parse_cached(python_code)
             return self._convert_module(tree)
         except SyntaxError as e:
             raise UnsupportedFeatureError(f"Python syntax error: {e}") from e
 
     def _convert_module(self, node: ast.Module) -> str:
         """Convert a Python module to OCaml."""
+        self._annotation_cache.clear()
+        self._init_fields_cache.clear()
+
         # Include runtime library
-        ocaml_code = ["(* Generated OCaml code from Python *)"]
-        ocaml_code.append("")
-        ocaml_code.append("open Mgen_runtime")
-        ocaml_code.append("")
+        buf = io.StringIO()
+        write = buf.write
+        write("(* Generated OCaml code from Python *)\n\nopen Mgen_runtime\n\n")
 
         # Track if main function exists
+        # Convert all statements, writing each straight into the output buffer
+        # and noting a top-level main() on the way
         has_main = False
         for stmt in node.body:
-            if isinstance(stmt, ast.FunctionDef) and stmt.name == "main":
+            if type(stmt) is ast.FunctionDef and stmt.name == "main":
                 has_main = True
-                break
-
-        # Convert all statements
-        for stmt in node.body:
             converted = self._convert_statement(stmt)
             if converted:
                 if isinstance(converted, list):
-                    ocaml_code.extend(converted)
+                    for line in converted:
+                        write(line)
+                        write("\n")
                 else:
-                    ocaml_code.append(converted)
-                ocaml_code.append("")
+                    write(converted)
+                    write("\n")
+                write("\n")
 
         # Add main execution
-        ocaml_code.append("(* Main execution *)")
+        write("(* Main execution *)\n")
         if has_main:
-            ocaml_code.append("let () = ignore (main ())")
+            write("let () = ignore (main ())")
         else:
-            ocaml_code.append('let () = print_value "Generated OCaml code executed successfully"')
+            write('let () = print_value "Generated OCaml code executed successfully"')
 
-        return "\n".join(ocaml_code)
+        return buf.getvalue()
 
     def _convert_statement(self, node: ast.AST) -> Union[str, list[str]]:
         """Convert a Python statement to OCaml."""
-        if isinstance(node, ast.FunctionDef):
-            return self._convert_function_def(node)
-        elif isinstance(node, ast.ClassDef):
-            return self._convert_class_def(node)
-        elif isinstance(node, ast.Assign):
-            return self._convert_assignment(node)
-        elif isinstance(node, ast.AnnAssign):
-            return self._convert_annotated_assignment(node)
-        elif isinstance(node, ast.AugAssign):
-            return self._convert_augmented_assignment(node)
-        elif isinstance(node, ast.Expr):
-            return self._convert_expression_statement(node)
-        elif isinstance(node, ast.Return):
-            return self._convert_return(node)
-        elif isinstance(node, ast.If):
-            return self._convert_if_statement(node)
-        elif isinstance(node, ast.While):
-            return self._convert_while_statement(node)
-        elif isinstance(node, ast.For):
-            return self._convert_for_statement(node)
-        elif isinstance(node, ast.ImportFrom):
-            # Ignore ImportFrom statements (like "from __future__ import annotations")
-            # These are Python-specific directives that don't need translation
-            return "(* Import statement ignored *)"
-        elif isinstance(node, ast.Assert):
-            return self._convert_assert_statement(node)
-        else:
+        handler = self._STMT_HANDLERS.get(type(node))
+        if handler is None:
             raise UnsupportedFeatureError(f"Unsupported statement: {type(node).__name__}")
+        return handler(self, node)
+
+    def _convert_import_from(self, node: ast.ImportFrom) -> str:
+        """Ignore ImportFrom statements (like "from __future__ import annotations").
+
+        These are Python-specific directives that don't need translation.
+        """
+        return "(* Import statement ignored *)"
 
     def _convert_assert_statement(self, node: ast.Assert) -> str:
         """Convert Python assert statement to OCaml assert.
@@ -147,14 +482,9 @@ class MGenPythonToOCamlConverter:
 
     def _convert_function_def(self, node: ast.FunctionDef) -> list[str]:
         """Convert Python function definition to OCaml."""
-        self._to_ocaml_var_name(node.name)
-
-        # Extract parameter information
-        params = []
-        for arg in node.args.args:
-            param_name = self._to_ocaml_var_name(arg.arg)
-            param_type = self._get_type_annotation(arg.annotation) if arg.annotation else "'a"
-            params.append((param_name, param_type))
+        # Extract parameter names (OCaml signatures are emitted without parameter types)
+        to_var_name = self._to_ocaml_var_name
+        param_names = [to_var_name(arg.arg) for arg in node.args.args]
 
         # Get return type
         return_type = self._get_type_annotation(node.returns) if node.returns else "'a"
@@ -163,20 +493,16 @@ class MGenPythonToOCamlConverter:
         if self.current_class:
             # This is a method
             if node.name == "__init__":
-                return self._convert_constructor(node, params)
+                return self._convert_constructor(node, param_names)
             else:
-                return self._convert_method(node, params, return_type)
+                return self._convert_method(node, param_names, return_type)
         else:
             # This is a regular function
-            return self._convert_regular_function(node, params, return_type)
+            return self._convert_regular_function(node, param_names, return_type)
 
     def _is_recursive_function(self, node: ast.FunctionDef, func_name: str) -> bool:
         """Check if a function is recursive by looking for calls to itself."""
-        for child in ast.walk(node):
-            if isinstance(child, ast.Call):
-                if isinstance(child.func, ast.Name) and child.func.id == func_name:
-                    return True
-        return False
+        return _has_self_call(node, func_name)
 
     def _find_mutable_variables(self, node: ast.FunctionDef) -> set[str]:
         """Find all variables that are mutated in a function.
@@ -204,7 +530,7 @@ class MGenPythonToOCamlConverter:
                                 mutable.add(target.id)
         return mutable
 
-    def _convert_regular_function(self, node: ast.FunctionDef, params: list[tuple], return_type: str) -> list[str]:
+    def _convert_regular_function(self, node: ast.FunctionDef, param_names: list[str], return_type: str) -> list[str]:
         """Convert a regular function definition."""
         func_name = self._to_ocaml_var_name(node.name)
 
@@ -212,33 +538,29 @@ class MGenPythonToOCamlConverter:
         self.mutable_vars = self._find_mutable_variables(node)
 
         # Exclude function parameters from mutable vars (they're passed normally, not as refs)
-        param_names = {name for name, _ in params}
-        self.mutable_vars = self.mutable_vars - param_names
+        self.mutable_vars.difference_update(param_names)
 
         # Check if function is recursive
         is_recursive = self._is_recursive_function(node, node.name)
 
+        # Filter out docstrings first
+        filtered_body = [stmt for stmt in node.body if not _is_docstring(stmt)]
+
         # Function signature
-        rec_keyword = "rec " if is_recursive else ""
-        if params:
-            param_list = " ".join([name for name, _ in params])
-            signature = f"let {rec_keyword}{func_name} {param_list} ="
+        if is_recursive:
+            let_keyword = "let rec"
+        elif self.preferences and self.preferences.get("inline_hints") and _is_pure_numeric(node, filtered_body):
+            # Small call-free arithmetic: ask ocamlopt to inline it at every call site
+            let_keyword = "let[@inline]"
         else:
-            signature = f"let {rec_keyword}{func_name} () ="
+            let_keyword = "let"
+        if param_names:
+            signature = f"{let_keyword} {func_name} {' '.join(param_names)} ="
+        else:
+            signature = f"{let_keyword} {func_name} () ="
 
         lines = [signature]
 
-        # Filter out docstrings first
-        filtered_body = []
-        for stmt in node.body:
-            if (
-                isinstance(stmt, ast.Expr)
-                and isinstance(stmt.value, ast.Constant)
-                and isinstance(stmt.value.value, str)
-            ):
-                continue
-            filtered_body.append(stmt)
-
         # Check for early return pattern: if cond: return X; return Y
         if (
             len(filtered_body) == 2
@@ -252,50 +574,48 @@ class MGenPythonToOCamlConverter:
             condition = self._convert_expression(filtered_body[0].test)
             then_expr = filtered_body[0].body[0].value
             else_expr = filtered_body[1].value
-            if then_expr and else_expr:
-                then_value = self._convert_expression(then_expr)
-                else_value = self._convert_expression(else_expr)
-                lines.append(f"  if {condition} then {then_value} else {else_value}")
-            else:
-                # Fall back to normal conversion if return values are None
-                then_value = self._convert_expression(then_expr) if then_expr else "()"
-                else_value = self._convert_expression(else_expr) if else_expr else "()"
-                lines.append(f"  if {condition} then {then_value} else {else_value}")
+            # Bare returns become unit
+            then_value = "()" if then_expr is None else self._convert_expression(then_expr)
+            else_value = "()" if else_expr is None else self._convert_expression(else_expr)
+            lines.append(f"  if {condition} then {then_value} else {else_value}")
         elif len(filtered_body) == 1 and isinstance(filtered_body[0], ast.Return):
             # Single return statement
-            expr = self._convert_expression(filtered_body[0].value) if filtered_body[0].value else "()"
+            value = filtered_body[0].value
+            expr = "()" if value is None else self._convert_expression(value)
             lines.append(f"  {expr}")
         else:
             # Multiple statements - use let expressions
             body_lines = []
-            for _i, stmt in enumerate(filtered_body):
-                if isinstance(stmt, ast.Return):
-                    if stmt.value:
-                        body_lines.append(self._convert_expression(stmt.value))
-                    else:
-                        body_lines.append("()")
+            # Dispatch straight through the handler table; Return never reaches it
+            dispatch = self._STMT_HANDLERS
+            for stmt in filtered_body:
+                if type(stmt) is ast.Return:
+                    value = stmt.value
+                    body_lines.append("()" if value is None else self._convert_expression(value))
                 else:
-                    converted = self._convert_statement(stmt)
+                    stmt_type = type(stmt)
+                    handler = dispatch.get(stmt_type)
+                    if handler is None:
+                        raise UnsupportedFeatureError(f"Unsupported statement: {stmt_type.__name__}")
+                    converted = handler(self, stmt)
                     if isinstance(converted, list):
                         body_lines.extend(converted)
                     else:
                         body_lines.append(converted)
 
             # Properly sequence statements with semicolons where needed
+            # Each line is indented exactly once, as it is emitted
             if body_lines:
+                last = len(body_lines) - 1
                 for i, line in enumerate(body_lines):
-                    if i < len(body_lines) - 1:  # Not the last statement
-                        if not line.rstrip().endswith(" in"):
-                            lines.append(f"  {line};")
-                        else:
-                            lines.append(f"  {line}")
+                    ends_with_in = line.rstrip().endswith(" in")
+                    if i < last:  # Not the last statement
+                        lines.append(f"  {line}" if ends_with_in else f"  {line};")
                     else:
                         # Last statement - if it ends with 'in', add ()
-                        if line.rstrip().endswith(" in"):
-                            lines.append(f"  {line}")
+                        lines.append(f"  {line}")
+                        if ends_with_in:
                             lines.append("  ()")
-                        else:
-                            lines.append(f"  {line}")
             else:
                 lines.append("  ()")
 
@@ -319,12 +639,13 @@ class MGenPythonToOCamlConverter:
 
         lines = []
 
-        # Generate record type
+        # Generate record type (one scan of __init__ feeds both the type and the constructor)
+        init_fields: list[tuple[str, str, str]] = []
         if init_method:
-            fields = self._extract_class_fields(init_method)
-            if fields:
+            init_fields = self._scan_init(init_method)
+            if init_fields:
                 lines.append(f"type {class_name.lower()} = {{")
-                for field_name, field_type in fields:
+                for field_name, field_type, _ in init_fields:
                     lines.append(f"  {field_name} : {field_type};")
                 lines.append("}")
                 lines.append("")
@@ -335,7 +656,7 @@ class MGenPythonToOCamlConverter:
 
         # Generate constructor function
         if init_method:
-            constructor_lines = self._convert_constructor(init_method, [])
+            constructor_lines = self._convert_constructor(init_method, [], init_fields)
             lines.extend(constructor_lines)
             lines.append("")
 
@@ -348,93 +669,92 @@ class MGenPythonToOCamlConverter:
         self.current_class = None
         return lines
 
-    def _extract_class_fields(self, init_method: ast.FunctionDef) -> list[tuple]:
-        """Extract field definitions from __init__ method."""
-        fields = []
+    def _scan_init(self, init_method: ast.FunctionDef) -> list[tuple[str, str, str]]:
+        """Collect field definitions from __init__ in a single pass.
+
+        The result is remembered per __init__ node for the rest of the module, so
+        later passes over the same class reuse it.
+
+        Args:
+            init_method: The class's __init__ method
+
+        Returns:
+            List of (field name, OCaml type, OCaml initial value) tuples
+        """
+        cached = self._init_fields_cache.get(id(init_method))
+        if cached is not None:
+            return cached
+
+        fields: list[tuple[str, str, str]] = []
+        fields_append = fields.append
+        to_var_name = self._to_ocaml_var_name
+        convert = self._convert_expression
 
         for stmt in init_method.body:
             if isinstance(stmt, ast.Assign):
                 for target in stmt.targets:
-                    if (
-                        isinstance(target, ast.Attribute)
-                        and isinstance(target.value, ast.Name)
-                        and target.value.id == "self"
-                    ):
-                        field_name = self._to_ocaml_var_name(target.attr)
+                    attr = _self_attr_name(target)
+                    if attr is not None:
                         field_type = self._infer_type_from_value(stmt.value)
-                        fields.append((field_name, field_type))
+                        fields_append((to_var_name(attr), field_type, convert(stmt.value)))
             elif isinstance(stmt, ast.AnnAssign):
-                if (
-                    isinstance(stmt.target, ast.Attribute)
-                    and isinstance(stmt.target.value, ast.Name)
-                    and stmt.target.value.id == "self"
-                ):
-                    field_name = self._to_ocaml_var_name(stmt.target.attr)
+                attr = _self_attr_name(stmt.target)
+                if attr is not None:
                     field_type = self._get_type_annotation(stmt.annotation) if stmt.annotation else "'a"
-                    fields.append((field_name, field_type))
+                    if stmt.value:
+                        field_value = convert(stmt.value)
+                    else:
+                        # Use default value based on type
+                        field_value = self._get_default_value(field_type)
+                    fields_append((to_var_name(attr), field_type, field_value))
 
+        self._init_fields_cache[id(init_method)] = fields
         return fields
 
-    def _convert_constructor(self, node: ast.FunctionDef, params: list[tuple]) -> list[str]:
-        """Convert __init__ method to constructor function."""
+    def _convert_constructor(
+        self, node: ast.FunctionDef, param_names: list[str], fields: Optional[list[tuple[str, str, str]]] = None
+    ) -> list[str]:
+        """Convert __init__ method to constructor function.
+
+        Args:
+            node: The __init__ method
+            param_names: Converted parameter names (unused; taken from ``node`` without self)
+            fields: Result of ``_scan_init`` for ``node`` if already computed
+
+        Returns:
+            Lines of the OCaml constructor function
+        """
         if self.current_class is None:
             raise ValueError("Constructor called outside of class context")
         class_name = self.current_class.lower()
 
         # Extract constructor parameters (excluding self)
-        constructor_params = []
-        for arg in node.args.args[1:]:  # Skip 'self'
-            param_name = self._to_ocaml_var_name(arg.arg)
-            param_type = self._get_type_annotation(arg.annotation) if arg.annotation else "'a"
-            constructor_params.append((param_name, param_type))
+        to_var_name = self._to_ocaml_var_name
+        constructor_params = [to_var_name(arg.arg) for arg in node.args.args[1:]]  # Skip 'self'
 
         # Constructor function signature
         if constructor_params:
-            param_list = " ".join([name for name, _ in constructor_params])
-            signature = f"let create_{class_name} {param_list} ="
+            signature = f"let create_{class_name} {' '.join(constructor_params)} ="
         else:
             signature = f"let create_{class_name} () ="
 
         lines = [signature]
 
         # Extract field assignments
-        field_assignments = []
-        for stmt in node.body:
-            if isinstance(stmt, ast.Assign):
-                for target in stmt.targets:
-                    if (
-                        isinstance(target, ast.Attribute)
-                        and isinstance(target.value, ast.Name)
-                        and target.value.id == "self"
-                    ):
-                        field_name = self._to_ocaml_var_name(target.attr)
-                        field_value = self._convert_expression(stmt.value)
-                        field_assignments.append(f"    {field_name} = {field_value};")
-            elif isinstance(stmt, ast.AnnAssign):
-                if (
-                    isinstance(stmt.target, ast.Attribute)
-                    and isinstance(stmt.target.value, ast.Name)
-                    and stmt.target.value.id == "self"
-                ):
-                    field_name = self._to_ocaml_var_name(stmt.target.attr)
-                    if stmt.value:
-                        field_value = self._convert_expression(stmt.value)
-                    else:
-                        # Use default value based on type
-                        field_type = self._get_type_annotation(stmt.annotation) if stmt.annotation else "int"
-                        field_value = self._get_default_value(field_type)
-                    field_assignments.append(f"    {field_name} = {field_value};")
+        if fields is None:
+            fields = self._scan_init(node)
 
-        if field_assignments:
+        if fields:
             lines.append("  {")
-            lines.extend(field_assignments)
+            # Stream the assignments straight into the output lines
+            lines.extend(f"    {field_name} = {field_value};" for field_name, _, field_value in fields)
             lines.append("  }")
         else:
             lines.append("  ()")
 
         return lines
 
-    def _convert_method(self, node: ast.FunctionDef, params: list[tuple], return_type: str) -> list[str]:
+    def _convert_method(self, node: ast.FunctionDef, param_names: list[str], return_type: str) -> list[str]:
         """Convert class method to OCaml function."""
         if self.current_class is None:
             raise ValueError("Method called outside of class context")
@@ -454,12 +774,11 @@ class MGenPythonToOCamlConverter:
         lines = [signature]
 
         # Convert method body (simplified - methods often just return default values)
-        if len(node.body) == 1 and isinstance(node.body[0], ast.Return):
-            if node.body[0].value:
-                expr = self._convert_expression(node.body[0].value)
-                lines.append(f"  {expr}")
-            else:
-                lines.append("  ()")
+        body = [stmt for stmt in node.body if not _is_docstring(stmt)]
+        first = body[0] if len(body) == 1 else None
+        if type(first) is ast.Return:
+            value = first.value
+            lines.append("  ()" if value is None else f"  {self._convert_expression(value)}")
         else:
             # For complex methods, provide a placeholder
             if return_type == "unit":
@@ -478,57 +797,18 @@ class MGenPythonToOCamlConverter:
 
     def _convert_expression(self, node: ast.AST) -> str:
         """Convert Python expression to OCaml."""
-        if isinstance(node, ast.Constant):
-            return self._convert_constant(node)
-        elif isinstance(node, ast.Name):
-            return self._convert_name(node)
-        elif isinstance(node, ast.BinOp):
-            return self._convert_binary_operation(node)
-        elif isinstance(node, ast.UnaryOp):
-            return self._convert_unary_operation(node)
-        elif isinstance(node, ast.Compare):
-            return self._convert_comparison(node)
-        elif isinstance(node, ast.Call):
-            return self._convert_function_call(node)
-        elif isinstance(node, ast.Attribute):
-            return self._convert_attribute_access(node)
-        elif isinstance(node, ast.Subscript):
-            return self._convert_subscript(node)
-        elif isinstance(node, ast.List):
-            return self._convert_list_literal(node)
-        elif isinstance(node, ast.Dict):
-            return self._convert_dict_literal(node)
-        elif isinstance(node, ast.Set):
-            return self._convert_set_literal(node)
-        elif isinstance(node, ast.ListComp):
-            return self._convert_list_comprehension(node)
-        elif isinstance(node, ast.DictComp):
-            return self._convert_dict_comprehension(node)
-        elif isinstance(node, ast.SetComp):
-            return self._convert_set_comprehension(node)
-        elif isinstance(node, ast.IfExp):
-            return self._convert_ternary_expression(node)
-        elif isinstance(node, ast.JoinedStr):
-            return self._convert_f_string(node)
-        else:
+        handler = self._EXPR_HANDLERS.get(type(node))
+        if handler is None:
             raise UnsupportedFeatureError(f"Unsupported expression: {type(node).__name__}")
+        return handler(self, node)
 
     def _convert_constant(self, node: ast.Constant) -> str:
         """Convert Python constant to OCaml."""
-        if isinstance(node.value, bool):
-            return "true" if node.value else "false"
-        elif isinstance(node.value, int):
-            return str(node.value)
-        elif isinstance(node.value, float):
-            return str(node.value)
-        elif isinstance(node.value, str):
-            # Escape quotes and backslashes
-            escaped = node.value.replace("\\", "\\\\").replace('"', '\\"')
-            return f'"{escaped}"'
-        elif node.value is None:
-            return "()"
-        else:
+        # Exact-type lookup: type(True) is bool, so bool never falls through to int
+        handler = _CONSTANT_HANDLERS.get(type(node.value))
+        if handler is None:
             raise UnsupportedFeatureError(f"Unsupported constant type: {type(node.value)}")
+        return handler(node.value)
 
     def _convert_name(self, node: ast.Name) -> str:
         """Convert Python name to OCaml variable name."""
@@ -546,28 +826,9 @@ class MGenPythonToOCamlConverter:
         right = self._convert_expression(node.right)
 
         # Handle OCaml-specific operators
-        if isinstance(node.op, ast.FloorDiv):
-            op = "/"  # OCaml doesn't have floor division
-        elif isinstance(node.op, ast.Mod):
-            op = "mod"
-        elif isinstance(node.op, ast.Pow):
-            op = "**"
-        elif isinstance(node.op, ast.BitOr):
-            op = "lor"
-        elif isinstance(node.op, ast.BitXor):
-            op = "lxor"
-        elif isinstance(node.op, ast.BitAnd):
-            op = "land"
-        elif isinstance(node.op, ast.LShift):
-            op = "lsl"
-        elif isinstance(node.op, ast.RShift):
-            op = "lsr"
-        else:
-            # Use standard operator mapping from converter_utils for common operators
-            op_result = get_standard_binary_operator(node.op)
-            if op_result is None:
-                raise UnsupportedFeatureError(f"Unsupported binary operator: {type(node.op).__name__}")
-            op = op_result
+        op = _BINOP_MAP.get(type(node.op)) or get_standard_binary_operator(node.op)
+        if op is None:
+            raise UnsupportedFeatureError(f"Unsupported binary operator: {type(node.op).__name__}")
 
         return f"({left} {op} {right})"
 
@@ -575,16 +836,10 @@ class MGenPythonToOCamlConverter:
         """Convert Python unary operation to OCaml."""
         operand = self._convert_expression(node.operand)
 
-        if isinstance(node.op, ast.UAdd):
-            return f"(+{operand})"
-        elif isinstance(node.op, ast.USub):
-            return f"(-{operand})"
-        elif isinstance(node.op, ast.Not):
-            return f"(not {operand})"
-        elif isinstance(node.op, ast.Invert):
-            return f"(lnot {operand})"
-        else:
+        prefix = _UNOP_MAP.get(type(node.op))
+        if prefix is None:
             raise UnsupportedFeatureError(f"Unsupported unary operator: {type(node.op).__name__}")
+        return f"({prefix}{operand})"
 
     def _convert_comparison(self, node: ast.Compare) -> str:
         """Convert Python comparison to OCaml."""
@@ -595,24 +850,18 @@ class MGenPythonToOCamlConverter:
         right = self._convert_expression(node.comparators[0])
         op = node.ops[0]
 
-        # Handle OCaml-specific comparison operators
-        if isinstance(op, ast.NotEq):
-            ocaml_op = "<>"  # OCaml uses <> instead of !=
-            return f"({left} {ocaml_op} {right})"
-        elif isinstance(op, ast.In):
-            # Use List.mem_assoc for membership in association lists (dicts)
+        # Membership tests use List.mem_assoc for association lists (dicts)
+        op_type = type(op)
+        if op_type is ast.In:
             return f"(List.mem_assoc {left} {right})"
-        elif isinstance(op, ast.NotIn):
-            # Use not with List.mem_assoc
+        elif op_type is ast.NotIn:
             return f"(not (List.mem_assoc {left} {right}))"
-        else:
-            # Use standard operator mapping from converter_utils for common operators
-            op_result = get_standard_comparison_operator(op)
-            if op_result is None:
-                raise UnsupportedFeatureError(f"Unsupported comparison operator: {type(op).__name__}")
-            # OCaml uses = for equality (same as standard)
-            ocaml_op = op_result
-            return f"({left} {ocaml_op} {right})"
+
+        # OCaml-specific operators first, then the standard mapping (OCaml also uses = for equality)
+        ocaml_op = _CMP_MAP.get(op_type) or get_standard_comparison_operator(op)
+        if ocaml_op is None:
+            raise UnsupportedFeatureError(f"Unsupported comparison operator: {op_type.__name__}")
+        return f"({left} {ocaml_op} {right})"
 
     def _convert_function_call(self, node: ast.Call) -> str:
         """Convert Python function call to OCaml."""
@@ -620,39 +869,12 @@ class MGenPythonToOCamlConverter:
             func_name = node.func.id
 
             # Handle built-in functions
-            if func_name in ["abs", "bool", "len", "min", "max", "sum"]:
+            if func_name in _BUILTIN_CALLS:
                 return self._convert_builtin_call(func_name, node.args)
             elif func_name == "range":
                 return self._convert_range_call(node.args)
             elif func_name == "print":
-                if node.args:
-                    arg_node = node.args[0]
-                    arg = self._convert_expression(arg_node)
-
-                    # Determine the conversion function based on type
-                    conversion_func: Optional[str] = "string_of_int"  # Default to int
-
-                    # Check if argument is a variable with known type
-                    if isinstance(arg_node, ast.Name):
-                        var_name = self._to_ocaml_var_name(arg_node.id)
-                        if var_name in self.variables:
-                            var_type = self.variables[var_name]
-                            if var_type == "string" or var_type == "str":
-                                conversion_func = None  # No conversion needed
-                            elif var_type == "float":
-                                conversion_func = "string_of_float"
-                            elif var_type == "bool":
-                                conversion_func = "Conversions.string_of_bool"
-                    # Check if argument is a string literal
-                    elif isinstance(arg_node, ast.Constant) and isinstance(arg_node.value, str):
-                        conversion_func = None  # No conversion needed
-
-                    if conversion_func:
-                        return f"print_value ({conversion_func} {arg})"
-                    else:
-                        return f"print_value {arg}"
-                else:
-                    return 'print_value ""'
+                return self._convert_print_call(node.args)
             else:
                 # Regular function call
                 args = [self._convert_expression(arg) for arg in node.args]
@@ -665,6 +887,37 @@ class MGenPythonToOCamlConverter:
         else:
             raise UnsupportedFeatureError(f"Unsupported function call: {type(node.func).__name__}")
 
+    def _convert_print_call(self, args: list[ast.expr]) -> str:
+        """Convert print() to print_value, stringifying the argument by its tracked type.
+
+        Args:
+            args: Arguments of the print call (only the first is printed)
+
+        Returns:
+            OCaml print_value expression
+        """
+        if not args:
+            return 'print_value ""'
+
+        arg_node = args[0]
+        arg = self._convert_expression(arg_node)
+
+        # Determine the conversion function based on type
+        conversion_func: Optional[str] = "string_of_int"  # Default to int
+
+        # Check if argument is a variable with known type
+        if isinstance(arg_node, ast.Name):
+            var_type = self.variables.get(self._to_ocaml_var_name(arg_node.id))
+            conversion_func = _PRINT_CONVERSIONS.get(var_type, "string_of_int")
+        # Check if argument is a string literal
+        elif isinstance(arg_node, ast.Constant) and isinstance(arg_node.value, str):
+            conversion_func = None  # No conversion needed
+
+        if conversion_func:
+            return f"print_value ({conversion_func} {arg})"
+        else:
+            return f"print_value {arg}"
+
     def _convert_builtin_call(self, func_name: str, args: list[ast.expr]) -> str:
         """Convert built-in function calls."""
         if not args:
@@ -722,20 +975,10 @@ class MGenPythonToOCamlConverter:
 
     def _convert_range_call(self, args: list[ast.expr]) -> str:
         """Convert range() call to OCaml."""
-        if len(args) == 1:
-            stop = self._convert_expression(args[0])
-            return f"range_list (range {stop})"
-        elif len(args) == 2:
-            start = self._convert_expression(args[0])
-            stop = self._convert_expression(args[1])
-            return f"range_list (range2 {start} {stop})"
-        elif len(args) == 3:
-            start = self._convert_expression(args[0])
-            stop = self._convert_expression(args[1])
-            step = self._convert_expression(args[2])
-            return f"range_list (range3 {start} {stop} {step})"
-        else:
+        if not 1 <= len(args) <= 3:
             raise UnsupportedFeatureError("range() requires 1-3 arguments")
+        converted = [self._convert_expression(arg) for arg in args]
+        return _RANGE_TEMPLATES[len(args) - 1].format(*converted)
 
     def _convert_method_call(self, node: ast.Call) -> str:
         """Convert method call to OCaml function call."""
@@ -761,7 +1004,7 @@ class MGenPythonToOCamlConverter:
                 obj_expr = f"({obj_expr})"
 
             # Handle string methods
-            if method_name in ["upper", "lower", "strip", "find", "replace", "split"]:
+            if method_name in _STRING_METHOD_HANDLERS:
                 return self._convert_string_method(obj_expr, method_name, node.args)
             # Handle dict methods
             elif method_name == "items":
@@ -775,10 +1018,9 @@ class MGenPythonToOCamlConverter:
                 return f"List.map snd {obj_expr}"
             # Handle list/array methods
             elif method_name == "append":
-                # Append to array (mutation, so this should be a statement)
-                args = [self._convert_expression(arg) for arg in node.args]
-                if args:
-                    return f"array_append {obj_expr} {args[0]}"
+                # Append to array (mutation, so this should be a statement); only the element is converted
+                if node.args:
+                    return f"array_append {obj_expr} {self._convert_expression(node.args[0])}"
                 else:
                     raise UnsupportedFeatureError("append() requires an argument")
             else:
@@ -793,33 +1035,10 @@ class MGenPythonToOCamlConverter:
 
     def _convert_string_method(self, obj_name: str, method_name: str, args: list[ast.expr]) -> str:
         """Convert string method calls."""
-        if method_name == "upper":
-            return f"upper {obj_name}"
-        elif method_name == "lower":
-            return f"lower {obj_name}"
-        elif method_name == "strip":
-            return f"strip {obj_name}"
-        elif method_name == "find":
-            if args:
-                substr = self._convert_expression(args[0])
-                return f"find {obj_name} {substr}"
-            else:
-                raise UnsupportedFeatureError("find() requires an argument")
-        elif method_name == "replace":
-            if len(args) >= 2:
-                old_str = self._convert_expression(args[0])
-                new_str = self._convert_expression(args[1])
-                return f"replace {obj_name} {old_str} {new_str}"
-            else:
-                raise UnsupportedFeatureError("replace() requires two arguments")
-        elif method_name == "split":
-            if args:
-                delimiter = self._convert_expression(args[0])
-                return f"split {obj_name} {delimiter}"
-            else:
-                return f'split {obj_name} " "'  # Default to space
-        else:
+        handler = _STRING_METHOD_HANDLERS.get(method_name)
+        if handler is None:
             raise UnsupportedFeatureError(f"Unsupported string method: {method_name}")
+        return handler(self, obj_name, args)
 
     def _convert_attribute_access(self, node: ast.Attribute) -> str:
         """Convert attribute access to OCaml field access."""
@@ -836,24 +1055,41 @@ class MGenPythonToOCamlConverter:
         Note: We use arrays instead of lists because Python lists are mutable
         and support subscript assignment, which OCaml lists don't support.
         """
-        elements = [self._convert_expression(elt) for elt in node.elts]
-        return "[|" + "; ".join(elements) + "|]"
+        return "[|" + self._convert_elements(node.elts) + "|]"
 
     def _convert_dict_literal(self, node: ast.Dict) -> str:
         """Convert Python dict literal to OCaml association list."""
-        pairs = []
-        for key, value in zip(node.keys, node.values):
-            if key is None:
-                raise UnsupportedFeatureError("Dictionary unpacking (**) not supported")
-            key_expr = self._convert_expression(key)
-            value_expr = self._convert_expression(value)
-            pairs.append(f"({key_expr}, {value_expr})")
+        if None in node.keys:
+            raise UnsupportedFeatureError("Dictionary unpacking (**) not supported")
+        convert = self._convert_expression
+        pairs = [
+            f"({convert(key)}, {convert(value)})"  # type: ignore[arg-type]  # keys checked above
+            for key, value in zip(node.keys, node.values)
+        ]
         return "[" + "; ".join(pairs) + "]"
 
     def _convert_set_literal(self, node: ast.Set) -> str:
         """Convert Python set literal to OCaml list (sets represented as lists)."""
-        elements = [self._convert_expression(elt) for elt in node.elts]
-        return "[" + "; ".join(elements) + "]"
+        return "[" + self._convert_elements(node.elts) + "]"
+
+    def _convert_elements(self, elts: list[ast.expr]) -> str:
+        """Convert sequence literal elements into the body of an OCaml list or array literal."""
+        return "; ".join([self._convert_expression(elt) for elt in elts])
+
+    def _convert_conditions(self, ifs: list[ast.expr]) -> str:
+        """Convert comprehension filter clauses into one OCaml condition.
+
+        Args:
+            ifs: The generator's ``if`` clauses (at least one)
+
+        Returns:
+            The conditions joined with ``&&``
+        """
+        if len(ifs) == 1:
+            # Common case: a single filter needs no list or join
+            return self._convert_expression(ifs[0])
+        # join() materializes its argument anyway, so a list beats a generator here
+        return " && ".join([self._convert_expression(if_clause) for if_clause in ifs])
 
     def _convert_list_comprehension(self, node: ast.ListComp) -> str:
         """Convert Python list comprehension to OCaml."""
@@ -863,16 +1099,17 @@ class MGenPythonToOCamlConverter:
             raise UnsupportedFeatureError("Multiple generators in comprehensions not supported")
 
         gen = node.generators[0]
-        target = self._to_ocaml_var_name(gen.target.id) if isinstance(gen.target, ast.Name) else "x"
+        target_node = gen.target
+        target = self._to_ocaml_var_name(target_node.id) if type(target_node) is ast.Name else "x"
         iterable = self._convert_expression(gen.iter)
 
         # Wrap iterable in parentheses if it contains spaces (function calls)
         if " " in iterable and not iterable.startswith("("):
             iterable = f"({iterable})"
 
-        if gen.ifs:
-            conditions = [self._convert_expression(if_clause) for if_clause in gen.ifs]
-            condition = " && ".join(conditions)
+        ifs = gen.ifs
+        if ifs:
+            condition = self._convert_conditions(ifs)
             return f"list_comprehension_with_filter {iterable} (fun {target} -> {condition}) (fun {target} -> {expr})"
         else:
             return f"list_comprehension {iterable} (fun {target} -> {expr})"
@@ -886,22 +1123,21 @@ class MGenPythonToOCamlConverter:
             raise UnsupportedFeatureError("Multiple generators in comprehensions not supported")
 
         gen = node.generators[0]
+        target_node = gen.target
 
         # Handle tuple unpacking: for k, v in dict.items()
-        if isinstance(gen.target, ast.Tuple):
+        if type(target_node) is ast.Tuple:
             # For dict comprehensions with unpacking, we expect (k, v) pattern
-            if len(gen.target.elts) == 2:
-                key_var = (
-                    self._to_ocaml_var_name(gen.target.elts[0].id) if isinstance(gen.target.elts[0], ast.Name) else "k"
-                )
-                value_var = (
-                    self._to_ocaml_var_name(gen.target.elts[1].id) if isinstance(gen.target.elts[1], ast.Name) else "v"
-                )
+            elts = target_node.elts
+            if len(elts) == 2:
+                key_node, value_node = elts
+                key_var = self._to_ocaml_var_name(key_node.id) if type(key_node) is ast.Name else "k"
+                value_var = self._to_ocaml_var_name(value_node.id) if type(value_node) is ast.Name else "v"
                 target = f"({key_var}, {value_var})"
             else:
                 raise UnsupportedFeatureError("Dict comprehension with tuple unpacking requires exactly 2 elements")
-        elif isinstance(gen.target, ast.Name):
-            target = self._to_ocaml_var_name(gen.target.id)
+        elif type(target_node) is ast.Name:
+            target = self._to_ocaml_var_name(target_node.id)
         else:
             target = "x"
 
@@ -911,9 +1147,9 @@ class MGenPythonToOCamlConverter:
         if " " in iterable and not iterable.startswith("("):
             iterable = f"({iterable})"
 
-        if gen.ifs:
-            conditions = [self._convert_expression(if_clause) for if_clause in gen.ifs]
-            condition = " && ".join(conditions)
+        ifs = gen.ifs
+        if ifs:
+            condition = self._convert_conditions(ifs)
             return f"dict_comprehension_with_filter {iterable} (fun {target} -> {condition}) (fun {target} -> {key_expr}) (fun {target} -> {value_expr})"
         else:
             return f"dict_comprehension {iterable} (fun {target} -> {key_expr}) (fun {target} -> {value_expr})"
@@ -926,16 +1162,17 @@ class MGenPythonToOCamlConverter:
             raise UnsupportedFeatureError("Multiple generators in comprehensions not supported")
 
         gen = node.generators[0]
-        target = self._to_ocaml_var_name(gen.target.id) if isinstance(gen.target, ast.Name) else "x"
+        target_node = gen.target
+        target = self._to_ocaml_var_name(target_node.id) if type(target_node) is ast.Name else "x"
         iterable = self._convert_expression(gen.iter)
 
         # Wrap iterable in parentheses if it contains spaces (function calls)
         if " " in iterable and not iterable.startswith("("):
             iterable = f"({iterable})"
 
-        if gen.ifs:
-            conditions = [self._convert_expression(if_clause) for if_clause in gen.ifs]
-            condition = " && ".join(conditions)
+        ifs = gen.ifs
+        if ifs:
+            condition = self._convert_conditions(ifs)
             return f"set_comprehension_with_filter {iterable} (fun {target} -> {condition}) (fun {target} -> {expr})"
         else:
             return f"set_comprehension {iterable} (fun {target} -> {expr})"
@@ -963,46 +1200,7 @@ class MGenPythonToOCamlConverter:
             else:
                 return f"let {var_name} = {value} in"
         elif isinstance(target, ast.Subscript):
-            # Handle subscript assignment: container[index] = value
-            index = self._convert_expression(target.slice)
-
-            # Get base variable name (without dereferencing for refs)
-            base_var_name = None
-            if isinstance(target.value, ast.Name):
-                base_var_name = self._to_ocaml_var_name(target.value.id)
-
-            # Determine if this is dict or array assignment
-            is_dict = False
-
-            # Check if the base variable has a tracked dict type
-            if base_var_name:
-                var_type = self.variables.get(base_var_name, "")
-                if "dict" in var_type or "string * " in var_type:
-                    is_dict = True
-
-            # Also check if the slice is a string constant
-            if isinstance(target.slice, ast.Constant) and isinstance(target.slice.value, str):
-                is_dict = True
-
-            # Check if the base variable is a ref (mutable)
-            is_ref = isinstance(target.value, ast.Name) and target.value.id in self.mutable_vars
-
-            if is_dict:
-                # Dictionary assignment
-                if is_ref:
-                    # Use ref assignment for mutable dicts
-                    return f"{base_var_name} := update_assoc_list !{base_var_name} {index} {value}"
-                else:
-                    container = self._convert_expression(target.value)
-                    return f"let {container} = update_assoc_list {container} {index} {value} in"
-            else:
-                # Array assignment
-                if is_ref:
-                    # For array refs, just modify the element (no need to reassign the ref)
-                    return f"let _ = !{base_var_name}.({index}) <- {value} in"
-                else:
-                    container = self._convert_expression(target.value)
-                    return f"let _ = {container}.({index}) <- {value} in"
+            return self._convert_subscript_assignment(target, value)
         else:
             raise UnsupportedFeatureError("Complex assignment targets not supported")
 
@@ -1039,88 +1237,84 @@ class MGenPythonToOCamlConverter:
             else:
                 return f"let {var_name} = {value} in"
         elif isinstance(target, ast.Subscript):
-            # Handle subscript assignment: container[index] = value
-            index = self._convert_expression(target.slice)
+            return self._convert_subscript_assignment(target, value)
+        else:
+            raise UnsupportedFeatureError("Complex assignment targets not supported")
 
-            # Get base variable name (without dereferencing for refs)
-            base_var_name = None
-            if isinstance(target.value, ast.Name):
-                base_var_name = self._to_ocaml_var_name(target.value.id)
+    def _convert_operator(self, op_node: ast.operator) -> str:
+        """Convert AST operator to OCaml operator string."""
+        op = _BINOP_MAP.get(type(op_node)) or get_standard_binary_operator(op_node)
+        if op is None:
+            raise UnsupportedFeatureError(f"Unsupported operator: {type(op_node).__name__}")
+        return op
 
-            # Determine if this is dict or array assignment
-            is_dict = False
+    def _convert_subscript_assignment(self, target: ast.Subscript, value: str) -> str:
+        """Convert assignment to a subscript target (container[index] = value).
 
-            # Check if the base variable has a tracked dict type
-            if base_var_name:
-                var_type = self.variables.get(base_var_name, "")
-                if "dict" in var_type or "string * " in var_type:
-                    is_dict = True
+        Args:
+            target: Subscript assignment target
+            value: Already converted OCaml value expression
 
-            # Also check if the slice is a string constant
-            if isinstance(target.slice, ast.Constant) and isinstance(target.slice.value, str):
+        Returns:
+            OCaml statement updating the array element or association list
+        """
+        index = self._convert_expression(target.slice)
+
+        # Get base variable name (without dereferencing for refs)
+        base_var_name = None
+        if isinstance(target.value, ast.Name):
+            base_var_name = self._to_ocaml_var_name(target.value.id)
+
+        # Determine if this is dict or array assignment
+        is_dict = False
+
+        # Check if the base variable has a tracked dict type
+        if base_var_name:
+            var_type = self.variables.get(base_var_name, "")
+            if _is_dict_type(var_type):
                 is_dict = True
 
-            # Check if the base variable is a ref (mutable)
-            is_ref = isinstance(target.value, ast.Name) and target.value.id in self.mutable_vars
+        # Also check if the slice is a string constant
+        if isinstance(target.slice, ast.Constant) and isinstance(target.slice.value, str):
+            is_dict = True
 
-            if is_dict:
-                # Dictionary assignment
-                if is_ref:
-                    # Use ref assignment for mutable dicts
-                    return f"{base_var_name} := update_assoc_list !{base_var_name} {index} {value}"
-                else:
-                    container = self._convert_expression(target.value)
-                    return f"let {container} = update_assoc_list {container} {index} {value} in"
-            else:
-                # Array assignment
-                if is_ref:
-                    # For array refs, just modify the element (no need to reassign the ref)
-                    return f"let _ = !{base_var_name}.({index}) <- {value} in"
-                else:
-                    container = self._convert_expression(target.value)
-                    return f"let _ = {container}.({index}) <- {value} in"
-        else:
-            raise UnsupportedFeatureError("Complex assignment targets not supported")
+        # Check if the base variable is a ref (mutable)
+        is_ref = isinstance(target.value, ast.Name) and target.value.id in self.mutable_vars
 
-    def _convert_operator(self, op_node: ast.operator) -> str:
-        """Convert AST operator to OCaml operator string."""
-        if isinstance(op_node, ast.FloorDiv):
-            return "/"  # OCaml doesn't have floor division
-        elif isinstance(op_node, ast.Mod):
-            return "mod"
-        elif isinstance(op_node, ast.Pow):
-            return "**"
-        elif isinstance(op_node, ast.BitOr):
-            return "lor"
-        elif isinstance(op_node, ast.BitXor):
-            return "lxor"
-        elif isinstance(op_node, ast.BitAnd):
-            return "land"
-        elif isinstance(op_node, ast.LShift):
-            return "lsl"
-        elif isinstance(op_node, ast.RShift):
-            return "lsr"
+        if is_dict:
+            # Dictionary assignment
+            if is_ref:
+                # Use ref assignment for mutable dicts
+                return f"{base_var_name} := update_assoc_list !{base_var_name} {index} {value}"
+            else:
+                container = self._convert_expression(target.value)
+                return f"let {container} = update_assoc_list {container} {index} {value} in"
         else:
-            # Use standard operator mapping from converter_utils for common operators
-            op_result = get_standard_binary_operator(op_node)
-            if op_result is None:
-                raise UnsupportedFeatureError(f"Unsupported operator: {type(op_node).__name__}")
-            return op_result
+            # Array assignment
+            if is_ref:
+                # For array refs, just modify the element (no need to reassign the ref)
+                return f"let _ = !{base_var_name}.({index}) <- {value} in"
+            else:
+                container = self._convert_expression(target.value)
+                return f"let _ = {container}.({index}) <- {value} in"
 
     def _convert_augmented_assignment(self, node: ast.AugAssign) -> str:
         """Convert Python augmented assignment to OCaml."""
-        if isinstance(node.target, ast.Name):
-            var_name = self._to_ocaml_var_name(node.target.id)
+        target_node = node.target
+        if type(target_node) is ast.Name:
+            # Plain names skip the expression dispatcher and hit the name cache
+            name = target_node.id
+            var_name = self._to_ocaml_var_name(name)
             value = self._convert_expression(node.value)
             op = self._convert_operator(node.op)
 
             # If this is a mutable variable (ref), use := for assignment
-            if node.target.id in self.mutable_vars:
+            if name in self.mutable_vars:
                 return f"{var_name} := (!{var_name}) {op} ({value})"
             else:
                 return f"let {var_name} = {var_name} {op} {value} in"
         else:
-            target = self._convert_expression(node.target)
+            target = self._convert_expression(target_node)
             value = self._convert_expression(node.value)
             op = self._convert_operator(node.op)
             return f"let {target} = {target} {op} {value} in"
@@ -1128,100 +1322,68 @@ class MGenPythonToOCamlConverter:
     def _convert_expression_statement(self, node: ast.Expr) -> str:
         """Convert expression statement."""
         # Ignore docstrings (string constants)
-        if isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
+        if _is_docstring(node):
             return ""  # Ignore docstrings
 
         # Special handling for .append() method calls - treat as assignment
+        value = node.value
         if (
-            isinstance(node.value, ast.Call)
-            and isinstance(node.value.func, ast.Attribute)
-            and node.value.func.attr == "append"
-            and isinstance(node.value.func.value, ast.Name)
+            type(value) is ast.Call
+            and type(value.func) is ast.Attribute
+            and value.func.attr == "append"
+            and type(value.func.value) is ast.Name
         ):
-            var_name = self._to_ocaml_var_name(node.value.func.value.id)
-            args = [self._convert_expression(arg) for arg in node.value.args]
-            if args:
+            receiver = value.func.value.id
+            var_name = self._to_ocaml_var_name(receiver)
+            if value.args:
+                element = self._convert_expression(value.args[0])
                 # If this is a mutable variable (ref), use := assignment
-                if node.value.func.value.id in self.mutable_vars:
-                    return f"{var_name} := array_append !{var_name} {args[0]}"
+                if receiver in self.mutable_vars:
+                    return f"{var_name} := array_append !{var_name} {element}"
                 else:
                     # data.append(x) -> let data = array_append data x in
-                    return f"let {var_name} = array_append {var_name} {args[0]} in"
+                    return f"let {var_name} = array_append {var_name} {element} in"
             else:
                 raise UnsupportedFeatureError("append() requires an argument")
 
-        expr = self._convert_expression(node.value)
+        expr = self._convert_expression(value)
         return f"let _ = {expr} in"
 
     def _convert_return(self, node: ast.Return) -> str:
         """Convert return statement."""
-        if node.value:
-            return self._convert_expression(node.value)
-        else:
-            return "()"
+        value = node.value
+        return "()" if value is None else self._convert_expression(value)
 
     def _convert_if_statement(self, node: ast.If) -> str:
         """Convert if statement to OCaml match or if expression."""
         condition = self._convert_expression(node.test)
 
         # Convert then branch
-        then_stmts = []
-        for stmt in node.body:
-            converted = self._convert_statement(stmt)
-            if converted:
-                if isinstance(converted, list):
-                    then_stmts.extend(converted)
-                else:
-                    then_stmts.append(converted)
-
-        # Build proper OCaml statement sequences
-        def sequence_statements(stmts: list[str]) -> str:
-            """Properly sequence OCaml statements with semicolons where needed."""
-            if not stmts:
-                return "()"
-            if len(stmts) == 1:
-                # Single statement - if it ends with 'in', add ()
-                if stmts[0].rstrip().endswith(" in"):
-                    return stmts[0] + "\n    ()"
-                return stmts[0]
-
-            # Add semicolons between statements that don't end with 'in'
-            result = []
-            for i, stmt in enumerate(stmts):
-                if i < len(stmts) - 1:  # Not the last statement
-                    # If this statement doesn't end with 'in', add semicolon
-                    if not stmt.rstrip().endswith(" in"):
-                        result.append(stmt + ";")
-                    else:
-                        result.append(stmt)
-                else:
-                    # Last statement - if it ends with 'in', add ()
-                    if stmt.rstrip().endswith(" in"):
-                        result.append(stmt)
-                        result.append("()")
-                    else:
-                        result.append(stmt)
+        then_part = _sequence_statements(self._convert_block(node.body))
 
-            return "(\n    " + "\n    ".join(result) + "\n  )"
+        # Convert else branch
+        else_part = _sequence_statements(self._convert_block(node.orelse)) if node.orelse else "()"
 
-        then_part = sequence_statements(then_stmts)
+        return f"if {condition} then {then_part} else {else_part}"
 
-        # Convert else branch
-        if node.orelse:
-            else_stmts = []
-            for stmt in node.orelse:
-                converted = self._convert_statement(stmt)
-                if converted:
-                    if isinstance(converted, list):
-                        else_stmts.extend(converted)
-                    else:
-                        else_stmts.append(converted)
+    def _convert_block(self, stmts: list[ast.stmt]) -> list[str]:
+        """Convert a statement block into a flat list of OCaml statements.
 
-            else_part = sequence_statements(else_stmts)
-        else:
-            else_part = "()"
+        Args:
+            stmts: Python statements of the block
 
-        return f"if {condition} then {then_part} else {else_part}"
+        Returns:
+            Converted statements, with empty results dropped
+        """
+        lines: list[str] = []
+        for stmt in stmts:
+            converted = self._convert_statement(stmt)
+            if converted:
+                if isinstance(converted, list):
+                    lines.extend(converted)
+                else:
+                    lines.append(converted)
+        return lines
 
     def _convert_while_statement(self, node: ast.While) -> str:
         """Convert while statement (simplified)."""
@@ -1298,109 +1460,86 @@ class MGenPythonToOCamlConverter:
         return ["(* Unsupported for loop pattern *)"]
 
     def _to_ocaml_var_name(self, name: str) -> str:
-        """Convert Python variable name to OCaml style."""
+        """Convert Python variable name to OCaml style.
+
+        Results are cached per converter, so the ``naming_convention`` preference
+        must be set before conversion begins.
+        """
+        cached = self._var_name_cache.get(name)
+        if cached is not None:
+            return cached
+        result = self._compute_ocaml_var_name(name)
+        self._var_name_cache[name] = result
+        return result
+
+    def _compute_ocaml_var_name(self, name: str) -> str:
+        """Compute the OCaml-style variable name (uncached)."""
         # Handle naming convention preferences
-        if self.preferences and self.preferences.get("naming_convention") == "camelCase":
-            # Convert snake_case to camelCase
+        if "_" in name and self.preferences and self.preferences.get("naming_convention") == "camelCase":
+            # Convert snake_case to camelCase (single-word names never need splitting)
             components = name.split("_")
-            if len(components) > 1:
-                return components[0] + "".join(word.capitalize() for word in components[1:])
+            return components[0] + "".join([word.capitalize() for word in components[1:]])
 
         # Default: keep snake_case but ensure it's valid OCaml
         ocaml_name = name.replace("__", "_").lower()
 
         # Handle OCaml keywords
-        keywords = {
-            "and",
-            "as",
-            "assert",
-            "begin",
-            "class",
-            "constraint",
-            "do",
-            "done",
-            "downto",
-            "else",
-            "end",
-            "exception",
-            "external",
-            "false",
-            "for",
-            "fun",
-            "function",
-            "functor",
-            "if",
-            "in",
-            "include",
-            "inherit",
-            "initializer",
-            "lazy",
-            "let",
-            "match",
-            "method",
-            "module",
-            "mutable",
-            "new",
-            "object",
-            "of",
-            "open",
-            "or",
-            "private",
-            "rec",
-            "sig",
-            "struct",
-            "then",
-            "to",
-            "true",
-            "try",
-            "type",
-            "val",
-            "virtual",
-            "when",
-            "while",
-            "with",
-        }
-
-        if ocaml_name in keywords:
+        if ocaml_name in _OCAML_KEYWORDS:
             return f"{ocaml_name}_"
 
         return ocaml_name
 
     def _to_ocaml_type_name(self, name: str) -> str:
         """Convert Python class name to OCaml type name."""
+        cached = self._type_name_cache.get(name)
+        if cached is not None:
+            return cached
         # Capitalize first letter for OCaml type names
-        return name[0].upper() + name[1:] if name else name
+        result = name[0].upper() + name[1:] if name else name
+        self._type_name_cache[name] = result
+        return result
 
     def _get_type_annotation(self, annotation: ast.AST) -> str:
         """Convert Python type annotation to OCaml type."""
-        if isinstance(annotation, ast.Name):
+        # AST nodes are identity-stable while a module is converted (cache cleared per module)
+        key = id(annotation)
+        cached = self._annotation_cache.get(key)
+        if cached is not None:
+            return cached
+        result = self._compute_type_annotation(annotation)
+        self._annotation_cache[key] = result
+        return result
+
+    def _compute_type_annotation(self, annotation: ast.AST) -> str:
+        """Convert Python type annotation to OCaml type (uncached)."""
+        if type(annotation) is ast.Name:
             return self.type_map.get(annotation.id, annotation.id.lower())
-        elif isinstance(annotation, ast.Constant) and annotation.value is None:
+        elif type(annotation) is ast.Constant and annotation.value is None:
             return "unit"
-        elif isinstance(annotation, ast.Subscript):
+        elif type(annotation) is ast.Subscript:
             # Handle subscripted types like list[int], list[list[int]], dict[str, int]
-            if isinstance(annotation.value, ast.Name):
+            if type(annotation.value) is ast.Name:
                 container_type = annotation.value.id
                 if container_type == "list":
                     # list[int] -> int list, list[list[int]] -> int list list
-                    if isinstance(annotation.slice, ast.Name):
+                    if type(annotation.slice) is ast.Name:
                         element_type = self.type_map.get(annotation.slice.id, annotation.slice.id.lower())
                         return f"{element_type} list"
-                    elif isinstance(annotation.slice, ast.Subscript):
+                    elif type(annotation.slice) is ast.Subscript:
                         # Recursively handle nested lists like list[list[int]]
                         element_type = self._get_type_annotation(annotation.slice)
                         return f"{element_type} list"
                     return "'a list"  # Default to 'a list
                 elif container_type == "dict":
                     # dict[str, int] -> (string * int) list
-                    if isinstance(annotation.slice, ast.Tuple) and len(annotation.slice.elts) == 2:
+                    if type(annotation.slice) is ast.Tuple and len(annotation.slice.elts) == 2:
                         key_type = self._get_type_annotation(annotation.slice.elts[0])
                         value_type = self._get_type_annotation(annotation.slice.elts[1])
                         return f"({key_type} * {value_type}) list"
                     return "('a * 'b) list"  # Default
                 elif container_type == "set":
                     # set[int] -> int list (OCaml doesn't have built-in sets in basic list operations)
-                    if isinstance(annotation.slice, ast.Name):
+                    if type(annotation.slice) is ast.Name:
                         element_type = self.type_map.get(annotation.slice.id, annotation.slice.id.lower())
                         return f"{element_type} list"
                     return "'a list"  # Default
@@ -1411,36 +1550,13 @@ class MGenPythonToOCamlConverter:
 
     def _infer_type_from_value(self, value: ast.AST) -> str:
         """Infer OCaml type from Python value."""
-        if isinstance(value, ast.Constant):
-            if isinstance(value.value, bool):
-                return "bool"
-            elif isinstance(value.value, int):
-                return "int"
-            elif isinstance(value.value, float):
-                return "float"
-            elif isinstance(value.value, str):
-                return "string"
-            elif value.value is None:
-                return "unit"
-        elif isinstance(value, ast.List):
-            return "'a list"
-        elif isinstance(value, ast.Dict):
-            return "(string * 'a) list"
-
-        return "'a"
+        if type(value) is ast.Constant:
+            return _CONSTANT_TYPES.get(type(value.value), "'a")
+        return _LITERAL_NODE_TYPES.get(type(value), "'a")
 
     def _get_default_value(self, type_name: str) -> str:
         """Get default value for a type."""
-        defaults = {
-            "int": "0",
-            "float": "0.0",
-            "bool": "false",
-            "string": '""',
-            "unit": "()",
-            "'a list": "[]",
-            "(string * 'a) list": "[]",
-        }
-        return defaults.get(type_name, 'failwith "default value not implemented"')
+        return _DEFAULT_VALUES.get(type_name, 'failwith "default value not implemented"')
 
     def _convert_subscript(self, node: ast.Subscript) -> str:
         """Convert subscript access (e.g., list[0], dict[key])."""
@@ -1454,7 +1570,7 @@ class MGenPythonToOCamlConverter:
         if isinstance(node.value, ast.Name):
             var_name = self._to_ocaml_var_name(node.value.id)
             var_type = self.variables.get(var_name, "")
-            if "dict" in var_type or "string * " in var_type:
+            if _is_dict_type(var_type):
                 is_dict = True
 
         # Also check if the slice is a string constant (clear indicator of dict)
@@ -1481,8 +1597,7 @@ class MGenPythonToOCamlConverter:
             if isinstance(value, ast.Constant):
                 # Literal string part - escape properly
                 if isinstance(value.value, str):
-                    escaped = value.value.replace("\\", "\\\\").replace('"', '\\"')
-                    parts.append(f'"{escaped}"')
+                    parts.append(_quote_ocaml_string(value.value))
             elif isinstance(value, ast.FormattedValue):
                 # Expression to be converted to string
                 expr_code = self._convert_expression(value.value)
@@ -1534,3 +1649,38 @@ class MGenPythonToOCamlConverter:
 
         # Default to string_of_int (most common case)
         return f'(string_of_int {expr_code})'
+
+    # Node type -> handler tables, built once when the class is defined. Handlers are
+    # plain functions, so dispatch is one dict lookup plus a call with self.
+    _STMT_HANDLERS: ClassVar[dict[type, Callable[..., Union[str, list[str]]]]] = {
+        ast.FunctionDef: _convert_function_def,
+        ast.ClassDef: _convert_class_def,
+        ast.Assign: _convert_assignment,
+        ast.AnnAssign: _convert_annotated_assignment,
+        ast.AugAssign: _convert_augmented_assignment,
+        ast.Expr: _convert_expression_statement,
+        ast.Return: _convert_return,
+        ast.If: _convert_if_statement,
+        ast.While: _convert_while_statement,
+        ast.For: _convert_for_statement,
+        ast.ImportFrom: _convert_import_from,
+        ast.Assert: _convert_assert_statement,
+    }
+    _EXPR_HANDLERS: ClassVar[dict[type, Callable[..., str]]] = {
+        ast.Constant: _convert_constant,
+        ast.Name: _convert_name,
+        ast.BinOp: _convert_binary_operation,
+        ast.UnaryOp: _convert_unary_operation,
+        ast.Compare: _convert_comparison,
+        ast.Call: _convert_function_call,
+        ast.Attribute: _convert_attribute_access,
+        ast.Subscript: _convert_subscript,
+        ast.List: _convert_list_literal,
+        ast.Dict: _convert_dict_literal,
+        ast.Set: _convert_set_literal,
+        ast.ListComp: _convert_list_comprehension,
+        ast.DictComp: _convert_dict_comprehension,
+        ast.SetComp: _convert_set_comprehension,
+        ast.IfExp: _convert_ternary_expression,
+        ast.JoinedStr: _convert_f_string,
+    }
@@ -29,16 +29,17 @@ class OCamlSimpleAssignmentStrategy(ForLoopStrategy):
         """Check for simple assignment pattern."""
         converter: MGenPythonToOCamlConverter = context.converter  # type: ignore
 
-        if len(node.body) != 1:
+        body = node.body
+        if len(body) != 1:
             return False
 
-        # Check for no mutations (simple case)
-        mutated_vars = converter._has_mutations(node.body)
-        if mutated_vars:
+        # Cheap shape test before the mutation scan
+        stmt = body[0]
+        if not (type(stmt) is ast.Assign and len(stmt.targets) == 1 and type(stmt.targets[0]) is ast.Name):
             return False
 
-        stmt = node.body[0]
-        return isinstance(stmt, ast.Assign) and len(stmt.targets) == 1 and isinstance(stmt.targets[0], ast.Name)
+        # Check for no mutations (simple case)
+        return not converter._has_mutations(body)
 
     def convert(self, node: ast.For, context: LoopContext) -> str:
         """Convert simple assignment to List.fold_left."""
@@ -51,12 +52,13 @@ class OCamlSimpleAssignmentStrategy(ForLoopStrategy):
         iter_expr = converter._convert_expression(node.iter)
 
         stmt = node.body[0]
-        assert isinstance(stmt, ast.Assign)
-        updated_var = converter._to_ocaml_var_name(stmt.targets[0].id)  # type: ignore
+        assert isinstance(stmt, ast.Assign) and isinstance(stmt.targets[0], ast.Name)
+        assigned = stmt.targets[0].id
+        updated_var = converter._to_ocaml_var_name(assigned)
         value_expr = converter._convert_expression(stmt.value)
 
         # Check if this is a mutable variable (ref)
-        if stmt.targets[0].id in converter.mutable_vars:  # type: ignore
+        if assigned in converter.mutable_vars:
             # Use ref assignment
             return f"{updated_var} := List.fold_left (fun _ {target} -> {value_expr}) !{updated_var} ({iter_expr})"
         else:
@@ -80,16 +82,17 @@ class OCamlAccumulationStrategy(ForLoopStrategy):
         """Check for accumulation pattern."""
         converter: MGenPythonToOCamlConverter = context.converter  # type: ignore
 
-        if len(node.body) != 1:
+        body = node.body
+        if len(body) != 1:
             return False
 
-        # Check for single mutation (the accumulation variable)
-        mutated_vars = converter._has_mutations(node.body)
-        if len(mutated_vars) != 1:
+        # Cheap shape test before the mutation scan
+        stmt = body[0]
+        if not (type(stmt) is ast.AugAssign and type(stmt.target) is ast.Name):
             return False
 
-        stmt = node.body[0]
-        return isinstance(stmt, ast.AugAssign) and isinstance(stmt.target, ast.Name)
+        # Check for single mutation (the accumulation variable)
+        return len(converter._has_mutations(body)) == 1
 
     def convert(self, node: ast.For, context: LoopContext) -> str:
         """Convert accumulation to List.fold_left."""
@@ -102,13 +105,14 @@ class OCamlAccumulationStrategy(ForLoopStrategy):
         iter_expr = converter._convert_expression(node.iter)
 
         stmt = node.body[0]
-        assert isinstance(stmt, ast.AugAssign)
-        updated_var = converter._to_ocaml_var_name(stmt.target.id)  # type: ignore
+        assert isinstance(stmt, ast.AugAssign) and isinstance(stmt.target, ast.Name)
+        accumulator = stmt.target.id
+        updated_var = converter._to_ocaml_var_name(accumulator)
         value_expr = converter._convert_expression(stmt.value)
         op = converter._convert_operator(stmt.op)
 
         # Check if this is a mutable variable (ref)
-        if stmt.target.id in converter.mutable_vars:  # type: ignore
+        if accumulator in converter.mutable_vars:
             # Use ref assignment
             return f"{updated_var} := List.fold_left (fun acc {target} -> acc {op} ({value_expr})) !{updated_var} ({iter_expr})"
         else:
@@ -141,31 +145,22 @@ class OCamlGeneralLoopStrategy(ForLoopStrategy):
         target = converter._to_ocaml_var_name(node.target.id)
         iter_expr = converter._convert_expression(node.iter)
 
-        # Convert body to let expressions
-        body_lines = []
-        for stmt in node.body:
-            converted = converter._convert_statement(stmt)
-            if isinstance(converted, list):
-                body_lines.extend(converted)
-            else:
-                body_lines.append(converted)
+        # Convert body to let expressions (already flattened to one list)
+        body_lines = converter._convert_block(node.body)
 
         if body_lines:
             # Properly sequence statements with semicolons where needed
             sequenced = []
+            last = len(body_lines) - 1
             for i, line in enumerate(body_lines):
-                if i < len(body_lines) - 1:  # Not the last statement
-                    if not line.rstrip().endswith(" in"):
-                        sequenced.append(line + ";")
-                    else:
-                        sequenced.append(line)
+                ends_with_in = line.rstrip().endswith(" in")
+                if i < last:  # Not the last statement
+                    sequenced.append(line if ends_with_in else line + ";")
                 else:
                     # Last statement - if it ends with 'in', add ()
-                    if line.rstrip().endswith(" in"):
-                        sequenced.append(line)
+                    sequenced.append(line)
+                    if ends_with_in:
                         sequenced.append("()")
-                    else:
-                        sequenced.append(line)
 
             body_str = " ".join(sequenced)
             return f"List.iter (fun {target} -> {body_str}) ({iter_expr})"
@@ -225,7 +225,13 @@ class OCamlPreferences(BackendPreferences):
                 # Performance preferences
                 "lazy_evaluation": False,  # Use lazy values
                 "mutable_optimization": False,  # Mutable optimizations where safe
-                "inline_hints": False,  # Compiler inline hints
+                "inline_hints": False,  # let[@inline] on small call-free int/float functions
+                # Build preferences
+                "native": True,  # Compile with ocamlopt (native code) instead of ocamlc (bytecode)
+                "release": False,  # Add -unsafe (no bounds checks) and, with flambda, -O3
+                "flambda": False,  # Toolchain is flambda-enabled (ocamlfind ocamlopt -config)
+                "optimization": "auto",  # auto, classic, o2, o3, compact (classic/o2/o3 need flambda)
+                "inline_threshold": None,  # Passed to ocamlopt as -inline N when set
             }
         )
 
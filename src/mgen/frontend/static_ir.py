@@ -13,6 +13,10 @@ from typing import Any, Optional
 
 from .ast_analyzer import StaticComplexity
 
+# Branch weights for statically predicted if statements (see IRIf.then_weight)
+LIKELY_BRANCH_WEIGHT = 2000
+UNLIKELY_BRANCH_WEIGHT = 1
+
 
 class IRNodeType(Enum):
     """Types of IR nodes."""
@@ -518,6 +522,25 @@ class IRContinue(IRStatement):
         return visitor.visit_continue(self)
 
 
+class IRRaise(IRStatement):
+    """IR representation of raise statements.
+
+    Exceptions cannot be caught in the static subset, so a raise ends the program.
+    """
+
+    def __init__(self, exception: Optional[str] = None, location: Optional[IRLocation] = None):
+        super().__init__(location)
+        self.exception = exception  # Name of the raised exception class, if known
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize raise statement to dictionary representation."""
+        return {"type": "raise", "exception": self.exception}
+
+    def accept(self, visitor: "IRVisitor") -> Any:
+        """Accept a visitor for traversal (visitor pattern)."""
+        return visitor.visit_raise(self)
+
+
 class IRExpressionStatement(IRStatement):
     """IR representation of expression statements (e.g., void function calls)."""
 
@@ -544,11 +567,16 @@ class IRIf(IRStatement):
         then_body: list[IRStatement],
         else_body: Optional[list[IRStatement]] = None,
         location: Optional[IRLocation] = None,
+        then_weight: Optional[int] = None,
+        else_weight: Optional[int] = None,
     ):
         super().__init__(location)
         self.condition = condition
         self.then_body = then_body
         self.else_body = else_body or []
+        # Relative branch likelihoods, or None when nothing is known about them
+        self.then_weight = then_weight
+        self.else_weight = else_weight
 
         self.add_child(condition)
         for stmt in self.then_body:
@@ -610,6 +638,11 @@ class IRFor(IRStatement):
         self.step = step
         self.body = body
 
+        # Classify the step once here so backends don't re-analyze it per loop
+        step_value = self._constant_step_value(step)
+        self.step_is_negative = step_value is not None and step_value < 0
+        self.step_is_unit = step is None or step_value == 1
+
         self.add_child(variable)
         self.add_child(start)
         self.add_child(end)
@@ -629,6 +662,18 @@ class IRFor(IRStatement):
             "body": [s.to_dict() for s in self.body],
         }
 
+    @staticmethod
+    def _constant_step_value(step: Optional[IRExpression]) -> Optional[int]:
+        """Get the value of a constant integer step, or None if not constant."""
+        if isinstance(step, IRLiteral):
+            return step.value if isinstance(step.value, int) else None
+        # Handle negative literals encoded as 0 - N
+        if isinstance(step, IRBinaryOperation) and step.operator == "-":
+            if isinstance(step.left, IRLiteral) and step.left.value == 0:
+                if isinstance(step.right, IRLiteral) and isinstance(step.right.value, int):
+                    return -step.right.value
+        return None
+
     def accept(self, visitor: "IRVisitor") -> Any:
         """Accept a visitor for traversal (visitor pattern)."""
         return visitor.visit_for(self)
@@ -730,6 +775,11 @@ class IRVisitor(ABC):
         """Visit a continue statement node."""
         pass
 
+    @abstractmethod
+    def visit_raise(self, node: "IRRaise") -> Any:
+        """Visit a raise statement node."""
+        pass
+
     @abstractmethod
     def visit_expression_statement(self, node: "IRExpressionStatement") -> Any:
         """Visit an expression statement node."""
@@ -849,6 +899,8 @@ class IRBuilder:
             return IRBreak(self._get_location(node))
         elif isinstance(node, ast.Continue):
             return IRContinue(self._get_location(node))
+        elif isinstance(node, ast.Raise):
+            return self._build_raise(node)
         elif isinstance(node, ast.Expr):
             # Expression statement (e.g., void function call)
             expr = self._build_expression(node.value)
@@ -1315,8 +1367,12 @@ class IRBuilder:
 
         # Create a synthetic function call for subscript operation
         # Backend will translate this to appropriate indexing code
-        # Return type depends on container element type (for now assume INT)
+        # Lists yield their element type (so list[float] arithmetic stays float);
+        # other containers default to INT
         return_type = IRType(IRDataType.INT)
+        base_type = base.result_type
+        if base_type.base_type == IRDataType.LIST and base_type.element_type:
+            return_type = base_type.element_type
         return IRFunctionCall("__getitem__", [base, index], return_type, self._get_location(node))
 
     def _build_return(self, node: ast.Return) -> IRReturn:
@@ -1361,7 +1417,26 @@ class IRBuilder:
             else_body_raw = [self._build_statement(stmt) for stmt in node.orelse]
             else_body = [stmt for stmt in else_body_raw if stmt is not None]
 
-        return IRIf(condition, then_body, else_body, self._get_location(node))
+        # A branch that ends by raising is an error path - mark it unlikely
+        then_weight: Optional[int] = None
+        else_weight: Optional[int] = None
+        if self._ends_in_raise(node.body):
+            then_weight, else_weight = UNLIKELY_BRANCH_WEIGHT, LIKELY_BRANCH_WEIGHT
+        elif self._ends_in_raise(node.orelse):
+            then_weight, else_weight = LIKELY_BRANCH_WEIGHT, UNLIKELY_BRANCH_WEIGHT
+
+        return IRIf(condition, then_body, else_body, self._get_location(node), then_weight, else_weight)
+
+    def _build_raise(self, node: ast.Raise) -> IRRaise:
+        """Build raise statement, keeping the exception class name."""
+        exc = node.exc.func if isinstance(node.exc, ast.Call) else node.exc
+        exception = exc.id if isinstance(exc, ast.Name) else None
+        return IRRaise(exception, self._get_location(node))
+
+    @staticmethod
+    def _ends_in_raise(body: list[ast.stmt]) -> bool:
+        """Check if a statement list ends with a raise."""
+        return bool(body) and isinstance(body[-1], ast.Raise)
 
     def _build_while(self, node: ast.While) -> IRWhile:
         """Build while loop."""
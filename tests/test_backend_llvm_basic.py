@@ -90,6 +90,97 @@ def square(x: int) -> int:
         assert "store" in llvm_ir
         assert "mul" in llvm_ir  # Multiplication
 
+    def test_identity_and_round_trip_casts(self):
+        """Test that identity and bool->int->bool casts emit no instructions."""
+        python_code = """
+def same(x: int) -> int:
+    return int(x)
+
+def round_trip(flag: bool) -> bool:
+    return bool(int(flag))
+"""
+
+        ir_module = build_ir_from_code(python_code)
+        converter = IRToLLVMConverter()
+        llvm_module = converter.visit_module(ir_module)
+        llvm_ir = str(llvm_module)
+
+        assert "cast_tmp" not in llvm_ir
+
+    def test_lossy_round_trip_cast_is_kept(self):
+        """Test that int->bool->int casts are still emitted."""
+        python_code = """
+def normalize(x: int) -> int:
+    return int(bool(x))
+"""
+
+        ir_module = build_ir_from_code(python_code)
+        converter = IRToLLVMConverter()
+        llvm_module = converter.visit_module(ir_module)
+        llvm_ir = str(llvm_module)
+
+        assert "icmp ne i64" in llvm_ir
+        assert "zext i1" in llvm_ir
+
+    def test_runtime_functions_declared_on_use(self):
+        """Test that only runtime functions the module calls are declared."""
+        python_code = """
+def total(xs: list[int]) -> int:
+    return len(xs)
+"""
+
+        ir_module = build_ir_from_code(python_code)
+        converter = IRToLLVMConverter()
+        llvm_module = converter.visit_module(ir_module)
+        llvm_ir = str(llvm_module)
+
+        assert '@"vec_int_size.inline"' in llvm_ir
+        assert "vec_int_push" not in llvm_ir
+        assert "map_str_int" not in llvm_ir
+        assert "mgen_str_" not in llvm_ir
+
+    def test_vec_accessors_are_inlinable(self):
+        """Test that vec size/at get internal alwaysinline bodies backed by the C runtime."""
+        python_code = """
+def first(xs: list[int]) -> int:
+    return xs[0]
+"""
+
+        ir_module = build_ir_from_code(python_code)
+        converter = IRToLLVMConverter()
+        llvm_module = converter.visit_module(ir_module)
+        llvm_ir = str(llvm_module)
+
+        assert 'define internal i64 @"vec_int_at.inline"' in llvm_ir
+        assert "alwaysinline" in llvm_ir
+        # Out-of-bounds accesses still go through the C runtime's error reporting
+        assert 'declare i64 @"vec_int_at"(%"struct.vec_int"* %".1", i64 %".2") cold' in llvm_ir
+
+    def test_vec_accessor_loads_have_tbaa(self):
+        """Test that container field and element loads carry distinct TBAA tags."""
+        python_code = """
+def first(xs: list[int]) -> int:
+    return xs[0]
+"""
+
+        ir_module = build_ir_from_code(python_code)
+        converter = IRToLLVMConverter()
+        llvm_module = converter.visit_module(ir_module)
+        llvm_ir = str(llvm_module)
+
+        assert '!"Simple C/C++ TBAA"' in llvm_ir
+        assert '!"long"' in llvm_ir  # size field
+        assert '!"any pointer"' in llvm_ir  # data field
+        assert '!"long long"' in llvm_ir  # elements
+        assert llvm_ir.count("!tbaa") == 3
+
+    def test_unknown_runtime_function(self):
+        """Test that requesting an unknown runtime function raises KeyError."""
+        converter = IRToLLVMConverter()
+
+        with pytest.raises(KeyError):
+            converter.runtime.get_function("vec_int_nonexistent")
+
 
 class TestLLVMBackend:
     """Test LLVM backend integration."""
@@ -6,6 +6,7 @@ import tempfile
 from pathlib import Path
 
 import pytest
+from llvmlite import binding as llvm
 
 from mgen.backends.llvm import IRToLLVMConverter
 from mgen.frontend.static_ir import IRBuilder
@@ -112,6 +113,104 @@ def max_val(a: int, b: int) -> int:
         assert "if.then:" in llvm_ir
         assert "if.else:" in llvm_ir
 
+    def test_if_without_else_skips_else_block(self):
+        """Test that an if without else branches directly to the merge block."""
+        python_code = """
+def clamp(a: int) -> int:
+    if a < 0:
+        return 0
+    return a
+"""
+        llvm_ir = self._convert_to_llvm(python_code)
+
+        assert 'label %"if.then", label %"if.merge"' in llvm_ir
+        assert "if.else" not in llvm_ir
+
+    def test_if_with_both_branches_returning_has_no_merge_block(self):
+        """Test that no merge block is emitted when neither branch falls through."""
+        python_code = """
+def max_val(a: int, b: int) -> int:
+    if a > b:
+        return a
+    else:
+        return b
+"""
+        llvm_ir = self._convert_to_llvm(python_code)
+
+        assert "if.merge" not in llvm_ir
+        assert llvm_ir.count("ret i64") == 2
+
+    def test_statements_after_return_are_skipped(self):
+        """Test that unreachable statements after a return are not emitted."""
+        python_code = """
+def early(a: int) -> int:
+    if a > 0:
+        return 1
+        a = a * 7
+    return a
+"""
+        llvm_ir = self._convert_to_llvm(python_code)
+
+        assert "mul" not in llvm_ir
+
+    def test_raise_branch_is_unlikely(self):
+        """Test that a branch which only raises gets branch weight metadata."""
+        python_code = """
+def check(a: int) -> int:
+    if a < 0:
+        raise ValueError("negative")
+    else:
+        a = a + 1
+    return a
+"""
+        llvm_ir = self._convert_to_llvm(python_code)
+
+        assert "!prof" in llvm_ir
+        assert '!"branch_weights", i32 1, i32 2000' in llvm_ir
+
+    def test_raise_only_guard_is_unlikely(self):
+        """Test that an if guard with only a raise and no else keeps its branch."""
+        python_code = """
+def check(a: int) -> int:
+    if a < 0:
+        raise ValueError("negative")
+    return a + 1
+"""
+        llvm_ir = self._convert_to_llvm(python_code)
+
+        assert '!"branch_weights", i32 1, i32 2000' in llvm_ir
+        assert 'call void @"exit"(i32 1)' in llvm_ir
+        assert "unreachable" in llvm_ir
+        llvm.parse_assembly(llvm_ir).verify()
+
+    def test_error_branch_is_laid_out_last(self):
+        """Test that a branch ending in raise is moved after the hot path."""
+        python_code = """
+def check(a: int) -> int:
+    if a < 0:
+        a = 0 - a
+        raise ValueError("negative")
+    else:
+        a = a + 1
+    return a
+"""
+        llvm_ir = self._convert_to_llvm(python_code)
+
+        assert llvm_ir.index("if.merge:") < llvm_ir.index("if.then:")
+        assert '!"branch_weights", i32 1, i32 2000' in llvm_ir
+
+    def test_plain_if_has_no_branch_weights(self):
+        """Test that unpredicted if statements carry no branch weights."""
+        python_code = """
+def max_val(a: int, b: int) -> int:
+    if a > b:
+        return a
+    return b
+"""
+        llvm_ir = self._convert_to_llvm(python_code)
+
+        assert "!prof" not in llvm_ir
+
     def test_while_loop(self):
         """Test while loop."""
         python_code = """
@@ -218,6 +317,65 @@ def test_not(a: int) -> int:
         # Check for comparison (not is implemented as comparison with false/0)
         assert "icmp" in llvm_ir
 
+    def test_float_list(self):
+        """Test that list[float] uses vec_double."""
+        python_code = """
+def total(xs: list[float]) -> float:
+    xs.append(1.5)
+    n: int = len(xs)
+    return xs[0] + xs[n - 1]
+"""
+        llvm_ir = self._convert_to_llvm(python_code)
+
+        assert '%"struct.vec_double" = type {double*, i64, i64}' in llvm_ir
+        assert 'call void @"vec_double_push"' in llvm_ir
+        assert 'call double @"vec_double_at.inline"' in llvm_ir
+        assert 'call i64 @"vec_double_size.inline"' in llvm_ir
+        assert 'fadd double %"list_at", %"list_at.1"' in llvm_ir
+        llvm.parse_assembly(llvm_ir).verify()
+
+    def test_bool_list(self):
+        """Test that list[bool] uses vec_bool."""
+        python_code = """
+def first(flags: list[bool]) -> bool:
+    flags[0] = True
+    return flags[0]
+"""
+        llvm_ir = self._convert_to_llvm(python_code)
+
+        assert '%"struct.vec_bool" = type {i1*, i64, i64}' in llvm_ir
+        assert '@"vec_bool_set"' in llvm_ir
+        assert 'call i1 @"vec_bool_at.inline"' in llvm_ir
+        assert 'ret i1 %"list_at' in llvm_ir
+        llvm.parse_assembly(llvm_ir).verify()
+
+    def test_float_list_comprehension(self):
+        """Test that a comprehension over list[float] builds a vec_double."""
+        python_code = """
+def scale(xs: list[float]) -> list[float]:
+    return [x * 2.0 for x in xs if x > 0.5]
+"""
+        llvm_ir = self._convert_to_llvm(python_code)
+
+        assert 'call i64 @"vec_double_size.inline"' in llvm_ir
+        assert 'call double @"vec_double_at.inline"' in llvm_ir
+        assert "fmul double" in llvm_ir
+        assert "fcmp ogt double" in llvm_ir
+        assert 'call void @"vec_double_push"' in llvm_ir
+        assert '@"vec_int_' not in llvm_ir
+        llvm.parse_assembly(llvm_ir).verify()
+
+    def test_int_list(self):
+        """Test that list[int] still uses vec_int."""
+        python_code = """
+def first(xs: list[int]) -> int:
+    return xs[0]
+"""
+        llvm_ir = self._convert_to_llvm(python_code)
+
+        assert 'call i64 @"vec_int_at.inline"' in llvm_ir
+        llvm.parse_assembly(llvm_ir).verify()
+
 
 @pytest.mark.skipif(not LLVM_LLI_PATH, reason="LLVM lli not available")
 class TestLLVMExecution:
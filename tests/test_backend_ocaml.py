@@ -1,5 +1,10 @@
 """Tests for OCaml backend functionality."""
 
+import asyncio
+import os
+import sys
+import time
+
 import pytest
 
 from mgen.backends.ocaml.converter import MGenPythonToOCamlConverter
@@ -53,6 +58,55 @@ def calculate(x: int, y: int) -> int:
         assert "let product = (x * y)" in ocaml_code
         assert "(sum_val + product)" in ocaml_code
 
+    def test_recursive_function(self):
+        """Test that only direct self-calls mark a function as recursive."""
+        python_code = """
+def fact(n: int) -> int:
+    if n <= 1:
+        return 1
+    return n * fact(n - 1)
+
+def twice(n: int) -> int:
+    return fact(n) + fact(n)
+"""
+        ocaml_code = self.converter.convert_code(python_code)
+
+        assert "let rec fact n =" in ocaml_code
+        assert "let twice n =" in ocaml_code
+
+    def test_recursive_through_nested_helper(self):
+        """Test that a call to the enclosing function from a nested helper marks it recursive."""
+        python_code = """
+def walk(n: int) -> int:
+    def step(k: int) -> int:
+        return walk(k - 1)
+    if n <= 0:
+        return 0
+    return step(n)
+"""
+        ocaml_code = self.converter.convert_code(python_code)
+
+        assert "let rec walk n =" in ocaml_code
+
+    def test_repeated_conversion_is_stable(self):
+        """Test that converting the same source again (cached parse) gives the same output."""
+        python_code = """
+class Counter:
+    def __init__(self, start: int):
+        self.count: int = start
+
+def main() -> int:
+    total_count: int = 0
+    return total_count
+"""
+        first = self.converter.convert_code(python_code)
+        assert self.converter.convert_code(python_code) == first
+
+        prefs = OCamlPreferences()
+        prefs.set('naming_convention', 'camelCase')
+        assert "totalCount" in MGenPythonToOCamlConverter(prefs).convert_code(python_code)
+        assert MGenPythonToOCamlConverter().convert_code(python_code) == first
+
     def test_backend_with_preferences(self):
         """Test OCaml backend with custom preferences."""
         prefs = OCamlPreferences()
@@ -63,6 +117,34 @@ def calculate(x: int, y: int) -> int:
         assert converter.preferences.get('use_pattern_matching') == False
         assert converter.preferences.get('prefer_immutable') == False
 
+    def test_inline_hints_for_pure_numeric_functions(self):
+        """Test that inline_hints marks only call-free numeric functions."""
+        python_code = """
+def scale(x: float, k: float) -> float:
+    return x * k
+
+def clamp(n: int) -> int:
+    if n < 0:
+        return 0
+    return n
+
+def twice(n: int) -> int:
+    return scale(n, 2)
+
+def label(n: int) -> str:
+    return "n"
+"""
+        assert "let[@inline]" not in self.converter.convert_code(python_code)
+
+        prefs = OCamlPreferences()
+        prefs.set('inline_hints', True)
+        ocaml_code = MGenPythonToOCamlConverter(prefs).convert_code(python_code)
+
+        assert "let[@inline] scale x k =" in ocaml_code
+        assert "let[@inline] clamp n =" in ocaml_code
+        assert "let twice n =" in ocaml_code
+        assert "let label n =" in ocaml_code
+
     def test_class_conversion(self):
         """Test class conversion to OCaml."""
         python_code = """
@@ -84,6 +166,21 @@ class Calculator:
         assert 'calculator_add' in ocaml_code
         assert 'calculator_get_result' in ocaml_code
 
+    def test_method_docstring_ignored(self):
+        """Test that a docstring does not hide a method's single return."""
+        python_code = """
+class Counter:
+    def __init__(self) -> None:
+        self.count: int = 0
+
+    def get(self) -> int:
+        \"\"\"Return the count.\"\"\"
+        return self.count
+"""
+        ocaml_code = self.converter.convert_code(python_code)
+
+        assert 'Method not implemented' not in ocaml_code
+
     def test_list_comprehension_runtime(self):
         """Test list comprehension with runtime consistency."""
         python_code = """
@@ -121,6 +218,33 @@ def process_text(text: str) -> str:
 
         assert 'upper' in ocaml_code
 
+    def test_int_keyed_dict_subscript(self):
+        """Test that int-keyed dict access uses association lists, not arrays."""
+        python_code = """
+def lookup() -> int:
+    squares: dict[int, int] = {1: 1, 2: 4}
+    squares[3] = 9
+    return squares[2]
+"""
+        ocaml_code = self.converter.convert_code(python_code)
+
+        assert 'List.assoc 2 squares' in ocaml_code
+        assert 'squares.(' not in ocaml_code
+
+    def test_loop_body_skips_bare_strings(self):
+        """Test that string expressions in a loop body leave no empty statement."""
+        python_code = """
+def show(items: list[int]) -> None:
+    for x in items:
+        \"\"\"Print each item.\"\"\"
+        print(x)
+        print(x)
+"""
+        ocaml_code = self.converter.convert_code(python_code)
+
+        assert 'List.iter (fun x -> let _ =' in ocaml_code
+        assert '-> ;' not in ocaml_code
+
 
 class TestOCamlContainers:
     """Test OCaml container system."""
@@ -192,10 +316,56 @@ class TestOCamlBuilder:
     def test_build_commands(self):
         """Test build command generation."""
         commands = self.builder.get_build_command('test.ml')
-        assert 'ocamlc' in commands
+        assert 'ocamlopt' in commands
         assert 'test.ml' in commands
         assert 'mgen_runtime.ml' in commands
 
+    def test_bytecode_build_commands(self):
+        """Test that disabling native compilation falls back to ocamlc."""
+        prefs = OCamlPreferences()
+        prefs.set('native', False)
+
+        commands = OCamlBuilder(prefs).get_build_command('test.ml')
+        assert 'ocamlc' in commands
+        assert 'ocamlopt' not in commands
+
+    def test_release_build_flags(self):
+        """Test release and flambda optimization flags."""
+        prefs = OCamlPreferences()
+        prefs.set('release', True)
+        assert '-unsafe' in OCamlBuilder(prefs).get_build_command('test.ml')
+        assert '-O3' not in OCamlBuilder(prefs).get_build_command('test.ml')
+
+        prefs.set('flambda', True)
+        commands = OCamlBuilder(prefs).get_build_command('test.ml')
+        assert '-O3' in commands
+        assert '-unbox-closures' in commands
+
+    def test_optimization_preference_flags(self):
+        """Test that the optimization preference selects ocamlopt flags."""
+        prefs = OCamlPreferences()
+        prefs.set('optimization', 'compact')
+        prefs.set('inline_threshold', 50)
+        command = OCamlBuilder(prefs).get_build_command('test.ml')
+        assert '-compact' in command
+        assert command[command.index('-inline') + 1] == '50'
+
+        prefs.set('optimization', 'classic')
+        assert '-Oclassic' not in OCamlBuilder(prefs).get_build_command('test.ml')
+
+        prefs.set('flambda', True)
+        assert '-Oclassic' in OCamlBuilder(prefs).get_build_command('test.ml')
+
+    def test_dune_flags_follow_preferences(self):
+        """Test that dune builds get the same native flags as direct builds."""
+        assert 'ocamlopt_flags' not in self.builder.generate_build_file(['test.ml'], 'test')
+
+        prefs = OCamlPreferences()
+        prefs.set('release', True)
+        prefs.set('flambda', True)
+        build_content = OCamlBuilder(prefs).generate_build_file(['test.ml'], 'test')
+        assert '(ocamlopt_flags (:standard -unsafe -O3 -unbox-closures))' in build_content
+
     def test_run_commands(self):
         """Test run command generation."""
         commands = self.builder.get_run_command('test.ml')
@@ -212,6 +382,151 @@ class TestOCamlBuilder:
         flags = self.builder.get_compile_flags()
         assert isinstance(flags, list)
 
+    def test_dune_project_with_non_ascii_name(self, tmp_path):
+        """Test that dune files are written for a non-ASCII project name."""
+        assert self.builder.build(str(tmp_path / 'café.ml'), makefile=True)
+
+        assert '(name café)' in (tmp_path / 'dune-project').read_text(encoding='utf-8')
+        assert '(modules mgen_runtime café)' in (tmp_path / 'dune').read_text(encoding='utf-8')
+
+    def test_runtime_files_copied(self, tmp_path):
+        """Test that runtime files are copied once and existing files are kept."""
+        self.builder._copy_runtime_files(tmp_path)
+        runtime_file = tmp_path / 'mgen_runtime.ml'
+        assert runtime_file.exists()
+
+        runtime_file.write_text('(* local edit *)')
+        self.builder._copy_runtime_files(tmp_path)
+        assert runtime_file.read_text() == '(* local edit *)'
+
+    def test_direct_compile_executable_path(self, tmp_path):
+        """Test that only the trailing .ml suffix is stripped from the executable."""
+        source_dir = tmp_path / 'out.ml.d'
+        source_dir.mkdir()
+
+        cmd = self.builder._prepare_direct_compile(str(source_dir / 'prog.ml'))
+
+        assert cmd[cmd.index('-o') + 1] == str(source_dir / 'prog')
+
+    def test_compiled_runtime_reused(self, tmp_path):
+        """Test that an up-to-date compiled runtime is linked instead of the source."""
+        self.builder._copy_runtime_files(tmp_path)
+        (tmp_path / 'mgen_runtime.cmx').write_text('')
+        (tmp_path / 'mgen_runtime.flags').write_text('\n'.join(self.builder._get_compiler_command()))
+
+        cmd = self.builder._prepare_direct_compile(str(tmp_path / 'prog.ml'))
+
+        assert str(tmp_path / 'mgen_runtime.cmx') in cmd
+        assert str(tmp_path / 'mgen_runtime.ml') not in cmd
+
+    def test_compiled_runtime_rebuilt_on_flag_change(self, tmp_path, fake_opam):
+        """Test that the runtime is recompiled when the compiler flags change."""
+        assert self.builder.build(str(tmp_path / 'prog.ml'))
+        first = (tmp_path / 'mgen_runtime.flags').read_text()
+
+        prefs = OCamlPreferences()
+        prefs.set('release', True)
+        release = OCamlBuilder(preferences=prefs)
+        assert release._stage_runtime(tmp_path) == tmp_path / 'mgen_runtime.cmx'
+
+        assert (tmp_path / 'mgen_runtime.flags').read_text() != first
+        assert (tmp_path / 'mgen_runtime.flags').read_text() == '\n'.join(release._get_compiler_command())
+
+    def test_build_many_without_sources(self, tmp_path):
+        """Test that build_many rejects an empty module list."""
+        assert self.builder.build_many([], str(tmp_path / 'prog')) is False
+
+    def test_clean_removes_artifacts(self, tmp_path):
+        """Test that clean removes build artifacts and keeps sources."""
+        for name in ('prog', 'prog.cmx', 'prog.o', 'dune', 'prog.ml'):
+            (tmp_path / name).write_text('')
+        (tmp_path / '_build').mkdir()
+
+        assert self.builder.clean(str(tmp_path / 'prog.ml'))
+        # _build is renamed aside at once and deleted on a background thread
+        remaining = [p.name for p in tmp_path.iterdir() if '.trash.' not in p.name]
+        assert remaining == ['prog.ml']
+
+    def test_clean_removes_leftover_trash(self, tmp_path):
+        """Test that clean removes trees an interrupted earlier clean left behind."""
+        leftover = tmp_path / '_build.trash.1.2'
+        (leftover / 'default').mkdir(parents=True)
+        (tmp_path / 'notes.trash.txt').write_text('')
+
+        assert self.builder.clean(str(tmp_path / 'prog.ml'))
+        deadline = time.monotonic() + 5
+        while leftover.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert not leftover.exists()
+        assert (tmp_path / 'notes.trash.txt').exists()
+
+    @pytest.fixture
+    def fake_opam(self, tmp_path, monkeypatch):
+        """Put a stub ``opam`` on PATH that writes the files a real compile would."""
+        bin_dir = tmp_path / 'bin'
+        bin_dir.mkdir()
+        script = bin_dir / 'opam'
+        script.write_text(
+            f"#!{sys.executable}\n"
+            "import sys\n"
+            "from pathlib import Path\n"
+            "args = sys.argv[4:]  # drop 'exec -- ocamlopt'\n"
+            "if '-c' in args:\n"
+            "    for arg in args:\n"
+            "        if arg.endswith('.ml'):\n"
+            "            Path(arg).with_suffix('.cmx').write_text('')\n"
+            "if '-o' in args:\n"
+            "    Path(args[args.index('-o') + 1]).write_text('')\n"
+        )
+        script.chmod(0o755)
+        monkeypatch.setenv('PATH', f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+        return script
+
+    def test_build_async_stages_runtime(self, tmp_path, fake_opam):
+        """Test that the async build stages and compiles the runtime next to the source."""
+        source_dir = tmp_path / 'src'
+        source_dir.mkdir()
+        source = source_dir / 'prog.ml'
+        source.write_text('let () = print_endline "hi"\n')
+
+        assert asyncio.run(self.builder.build_async(str(source))) is True
+        assert (source_dir / 'mgen_runtime.ml').exists()
+        assert (source_dir / 'mgen_runtime.cmx').exists()
+        assert (source_dir / 'prog').exists()
+
+    def test_compiler_errors_are_logged(self, tmp_path, fake_opam, caplog):
+        """Test that compiler stderr from a failed build goes to the module logger."""
+        fake_opam.write_text(
+            f"#!{sys.executable}\n"
+            "import sys\n"
+            "sys.stderr.write('Error: Unbound value foo')\n"
+            "sys.exit(2)\n"
+        )
+        source = tmp_path / 'prog.ml'
+        source.write_text('let () = foo ()\n')
+
+        with caplog.at_level('ERROR', logger='mgen.backends.ocaml.builder'):
+            assert self.builder.build(str(source)) is False
+
+        assert 'Unbound value foo' in caplog.text
+
+    def test_concurrent_builds_share_runtime(self, tmp_path, fake_opam):
+        """Test that concurrent builds into one directory all succeed."""
+        source_dir = tmp_path / 'src'
+        source_dir.mkdir()
+        sources = []
+        for i in range(4):
+            source = source_dir / f'prog{i}.ml'
+            source.write_text('let () = print_endline "hi"\n')
+            sources.append(str(source))
+
+        async def build_all():
+            return await asyncio.gather(*(self.builder.build_async(source) for source in sources))
+
+        assert asyncio.run(build_all()) == [True] * 4
+        assert (source_dir / 'mgen_runtime.cmx').exists()
+
 
 class TestOCamlPreferences:
     """Test OCaml preference system."""
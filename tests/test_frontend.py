@@ -5,6 +5,8 @@ from pathlib import Path
 
 import pytest
 
+from mgen.frontend.static_ir import IRFor
+
 # Add src directory to Python path for development testing
 project_root = Path(__file__).parent.parent
 src_path = project_root / "src"
@@ -303,6 +305,28 @@ def loop_function(n: int) -> int:
         assert len(func.body) > 0
         assert len(func.local_variables) >= 1  # total variable
 
+    def test_loop_step_classification(self):
+        """Test that range() steps are classified when building the IR."""
+        code = """
+def loops(n: int) -> int:
+    total: int = 0
+    for i in range(n):
+        total = total + i
+    for j in range(n, 0, -1):
+        total = total + j
+    for k in range(0, n, 2):
+        total = total + k
+    return total
+"""
+        ir_module = build_ir_from_code(code)
+
+        loops = [stmt for stmt in ir_module.functions[0].body if isinstance(stmt, IRFor)]
+        assert [(loop.step_is_unit, loop.step_is_negative) for loop in loops] == [
+            (True, False),
+            (False, True),
+            (False, False),
+        ]
+
     def test_ir_type_mapping(self):
         """Test correct type mapping in IR."""
         from mgen.frontend.static_ir import IRDataType, IRType
@@ -0,0 +1,110 @@
+"""Test content-addressed caching of LLVM modules."""
+
+from mgen.backends.llvm.backend import LLVMBackend
+from mgen.backends.llvm.emitter import LLVMEmitter
+from mgen.backends.llvm.module_cache import LLVMModuleCache
+from mgen.backends.llvm.optimizer import LLVMOptimizer
+from mgen.backends.preferences import BackendPreferences
+
+SIMPLE_IR = """
+define i64 @add(i64 %a, i64 %b) {
+entry:
+  %result = add i64 %a, %b
+  ret i64 %result
+}
+"""
+
+SIMPLE_SOURCE = """
+def add(a: int, b: int) -> int:
+    return a + b
+"""
+
+
+class TestLLVMModuleCache:
+    """Test suite for the LLVM module cache."""
+
+    def test_miss_then_hit(self, tmp_path) -> None:
+        """Test that a stored module is returned on the next lookup."""
+        cache = LLVMModuleCache(tmp_path)
+        key = cache.make_key("emit", SIMPLE_IR)
+
+        assert cache.get(key) is None
+
+        cache.put(key, SIMPLE_IR)
+        cached = cache.get(key)
+
+        assert cached is not None
+        assert "define i64 @add" in cached
+        assert (tmp_path / f"{key}.bc").exists()
+
+    def test_keys_depend_on_all_parts(self, tmp_path) -> None:
+        """Test that different stages or inputs produce different keys."""
+        cache = LLVMModuleCache(tmp_path)
+
+        assert cache.make_key("O1", SIMPLE_IR) != cache.make_key("O2", SIMPLE_IR)
+        assert cache.make_key("emit", "a") != cache.make_key("emit", "b")
+        assert cache.make_key("emit", "a") == cache.make_key("emit", "a")
+
+    def test_cache_persists_across_instances(self, tmp_path) -> None:
+        """Test that a fresh cache instance sees entries written by another."""
+        key = LLVMModuleCache(tmp_path).make_key("emit", SIMPLE_IR)
+        LLVMModuleCache(tmp_path).put(key, SIMPLE_IR)
+
+        assert LLVMModuleCache(tmp_path).get(key) is not None
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path) -> None:
+        """Test that an unreadable bitcode file is treated as a miss."""
+        cache = LLVMModuleCache(tmp_path)
+        key = cache.make_key("emit", SIMPLE_IR)
+        (tmp_path / f"{key}.bc").write_bytes(b"not bitcode")
+
+        assert cache.get(key) is None
+
+    def test_clear(self, tmp_path) -> None:
+        """Test that clear() removes cached modules."""
+        cache = LLVMModuleCache(tmp_path)
+        key = cache.make_key("emit", SIMPLE_IR)
+        cache.put(key, SIMPLE_IR)
+
+        cache.clear()
+
+        assert cache.get(key) is None
+        assert not list(tmp_path.glob("*.bc"))
+
+    def test_optimizer_uses_cache(self, tmp_path) -> None:
+        """Test that the optimizer stores and reuses optimized modules."""
+        cache = LLVMModuleCache(tmp_path)
+        optimizer = LLVMOptimizer(opt_level=2, cache=cache)
+
+        first = optimizer.optimize(SIMPLE_IR)
+        assert len(list(tmp_path.glob("*.bc"))) == 1
+
+        second = optimizer.optimize(SIMPLE_IR)
+        assert first == second
+        assert "define i64 @add" in second
+
+    def test_emitter_uses_cache_when_enabled(self, tmp_path) -> None:
+        """Test that the emitter caches generated modules when opted in."""
+        preferences = BackendPreferences()
+        preferences.set("module_cache", True)
+        preferences.set("module_cache_dir", str(tmp_path))
+
+        first = LLVMEmitter(preferences).emit_module(SIMPLE_SOURCE)
+        second = LLVMEmitter(preferences).emit_module(SIMPLE_SOURCE)
+
+        assert first == second
+        assert "define i64 @add" in second
+        assert len(list(tmp_path.glob("*.bc"))) == 1
+
+    def test_emitter_cache_disabled_by_default(self) -> None:
+        """Test that the emitter does not cache unless asked to."""
+        assert LLVMEmitter().module_cache is None
+
+    def test_backend_builder_uses_cache_when_enabled(self, tmp_path) -> None:
+        """Test that the backend hands the module cache preference to its builder."""
+        preferences = BackendPreferences()
+        preferences.set("module_cache", True)
+        preferences.set("module_cache_dir", str(tmp_path))
+
+        assert LLVMBackend(preferences).get_builder().module_cache is not None
+        assert LLVMBackend().get_builder().module_cache is None